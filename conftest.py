@@ -1,7 +1,9 @@
 import pytest
 from rest_framework.test import APIClient
 
+from courses.instrumentation import endpoint_name
 from courses.tests.factories import TeacherFactory, StudentFactory, CourseFactory
+from courses.tests.query_budgets import QUERY_BUDGETS
 
 
 @pytest.fixture
@@ -26,3 +28,20 @@ def student(db):
 def course(db, teacher):
     """A course created by a teacher"""
     return CourseFactory()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Check a response against QUERY_BUDGETS for its endpoint and return its query count.
+    Counts come from QueryCountMiddleware, so authentication and permissions are included.
+    """
+
+    def check(response):
+        endpoint = endpoint_name(response.wsgi_request)
+        count = response.query_stats.count
+        budget = QUERY_BUDGETS[endpoint]
+        assert count <= budget, f"{endpoint} ran {count} queries, budget is {budget}"
+        return count
+
+    return check
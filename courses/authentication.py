@@ -0,0 +1,159 @@
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import SimpleLazyObject
+from rest_framework.authentication import BasicAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from courses.services.user_services import get_token_version
+
+User = get_user_model()
+
+TOKEN_ROLE_CLAIM = "role"
+TOKEN_VERSION_CLAIM = "ver"
+
+DEFAULT_BASIC_AUTH_CACHE_TTL = 300
+DEFAULT_BASIC_AUTH_CACHE_SIZE = 1024
+
+
+def token_is_current(token) -> bool:
+    """A token carrying a version is valid only while it matches the user's current one."""
+    version = token.get(TOKEN_VERSION_CLAIM)
+    return version is None or version == get_token_version(token[jwt_settings.USER_ID_CLAIM])
+
+
+class ClaimsUser(SimpleLazyObject):
+    """
+    Authenticated user known by its ID and role only, e.g. from access-token claims.
+
+    `pk`, `id`, `role` and the authentication flags are answered directly. Any other
+    attribute, or using it as a model instance (ORM writes, `==` with a model),
+    loads the User row once.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    def __init__(self, user_id, role):
+        user_id = uuid.UUID(str(user_id))
+        super().__init__(lambda: User.objects.get(pk=user_id))
+        self.__dict__["_claims"] = {"pk": user_id, "role": role}
+
+    @property
+    def pk(self):
+        return self.__dict__["_claims"]["pk"]
+
+    id = pk
+
+    @property
+    def role(self):
+        return self.__dict__["_claims"]["role"]
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the role and version embedded in the token.
+
+    The only per-request lookup is the user's token version, served from the cache;
+    revoking tokens is a version bump. Tokens issued before the claims existed
+    fall back to loading the user from the database.
+    """
+
+    def get_user(self, validated_token):
+        if TOKEN_ROLE_CLAIM not in validated_token or TOKEN_VERSION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        if not token_is_current(validated_token):
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+        return ClaimsUser(validated_token[jwt_settings.USER_ID_CLAIM], validated_token[TOKEN_ROLE_CLAIM])
+
+
+VerifiedCredential = namedtuple("VerifiedCredential", "user_id role token_version expires_at")
+
+
+class VerifiedCredentialCache:
+    """
+    Bounded, short-lived, in-process LRU of username/password pairs that passed a full check.
+
+    Entries are keyed by an HMAC under a random per-process key, so neither
+    passwords nor reusable digests are kept. Only successful checks are cached;
+    a wrong password always pays for the full hash.
+    """
+
+    def __init__(self, ttl=None, max_size=None):
+        self.ttl = ttl if ttl is not None else getattr(settings, "BASIC_AUTH_CACHE_TTL", DEFAULT_BASIC_AUTH_CACHE_TTL)
+        self.max_size = (
+            max_size if max_size is not None
+            else getattr(settings, "BASIC_AUTH_CACHE_SIZE", DEFAULT_BASIC_AUTH_CACHE_SIZE)
+        )
+        self._key = secrets.token_bytes(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _digest(self, username, password) -> bytes:
+        return hmac.new(self._key, f"{username}\0{password}".encode(), hashlib.sha256).digest()
+
+    def get(self, username, password):
+        digest = self._digest(username, password)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return entry
+
+    def add(self, username, password, user):
+        entry = VerifiedCredential(user.pk, user.role, user.token_version, time.monotonic() + self.ttl)
+        digest = self._digest(username, password)
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def forget_user(self, user_id):
+        with self._lock:
+            for digest in [digest for digest, entry in self._entries.items() if entry.user_id == user_id]:
+                del self._entries[digest]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+verified_credentials = VerifiedCredentialCache()
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """
+    Basic authentication that skips the password hash for recently verified credentials.
+
+    A cached pair is honoured only while the user's token version is unchanged. A
+    new password, role or deactivation bumps it; the process that saved the user
+    drops its entries at once, other workers once their cached version expires
+    (TOKEN_VERSION_CACHE_TTL).
+    """
+
+    def authenticate_credentials(self, userid, password, request=None):
+        entry = verified_credentials.get(userid, password)
+        if entry is not None and entry.token_version == get_token_version(entry.user_id):
+            return ClaimsUser(entry.user_id, entry.role), None
+
+        user, auth = super().authenticate_credentials(userid, password, request)
+        verified_credentials.add(userid, password, user)
+        return user, auth
@@ -0,0 +1,89 @@
+import hashlib
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+from courses.conditional import conditional_response
+
+DEFAULT_RESPONSE_CACHE_TTL = 300
+
+# (endpoint, "hit" | "miss") -> count, for this process.
+response_cache_stats = Counter()
+
+
+def _ttl(endpoint) -> int:
+    return getattr(settings, "RESPONSE_CACHE_TTLS", {}).get(endpoint, DEFAULT_RESPONSE_CACHE_TTL)
+
+
+def course_cache_version(course_id) -> str:
+    """Return the current cache version of a course; every cached response embeds it."""
+    return cache.get_or_set(f"course-cache-version:{course_id}", lambda: uuid.uuid4().hex, timeout=None)
+
+
+def bump_course_cache_version(*course_ids):
+    """Invalidate every cached response of the given courses by moving them to a new version."""
+    cache.set_many({f"course-cache-version:{pk}": uuid.uuid4().hex for pk in course_ids if pk}, timeout=None)
+
+
+def student_cache_version(student_id) -> str:
+    """Cache version of data derived from a student's own submissions and grades."""
+    return cache.get_or_set(f"student-cache-version:{student_id}", lambda: uuid.uuid4().hex, timeout=None)
+
+
+def bump_student_cache_version(*student_ids):
+    cache.set_many({f"student-cache-version:{pk}": uuid.uuid4().hex for pk in student_ids if pk}, timeout=None)
+
+
+def response_cache_key(request, endpoint, course_id, object_id) -> str:
+    role = getattr(request.user, "role", "anonymous")
+    version = course_cache_version(course_id)
+    url = hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+    return f"response:{endpoint}:{object_id}:{role}:{version}:{url}"
+
+
+def cached_response(request, endpoint, course_id, object_id, render):
+    """
+    Serve a GET response from the cache, keyed by endpoint, object, role and course version.
+    On a miss `render` builds the response, whose data and validators are stored for the endpoint's TTL.
+    """
+    key = response_cache_key(request, endpoint, course_id, object_id)
+    entry = cache.get(key)
+    if entry is None:
+        response_cache_stats[endpoint, "miss"] += 1
+        response = render()
+        if isinstance(response, Response) and response.status_code == 200:
+            cache.set(key, (response.data, response.get("ETag"), response.get("Last-Modified")), _ttl(endpoint))
+        response["X-Cache"] = "miss"
+        return response
+
+    response_cache_stats[endpoint, "hit"] += 1
+    data, etag, last_modified = entry
+    timestamp = parse_http_date_safe(last_modified) if last_modified else None
+    last_modified = datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp else None
+    response = conditional_response(request, etag, last_modified, lambda: Response(data))
+    response["X-Cache"] = "hit"
+    return response
+
+
+def cached_student_data(endpoint, student_id, course_ids, build):
+    """
+    Serve per-student data that depends on the student's own writes and on `course_ids`.
+    The key embeds the student's version and each course's version, so a bump of any
+    of them is a miss. Returns `(data, hit)`; on a miss `build()` provides the data.
+    """
+    versions = ",".join(f"{pk}={course_cache_version(pk)}" for pk in sorted(course_ids))
+    digest = hashlib.sha1(versions.encode()).hexdigest()
+    key = f"student:{endpoint}:{student_id}:{student_cache_version(student_id)}:{digest}"
+    data = cache.get(key)
+    if data is not None:
+        response_cache_stats[endpoint, "hit"] += 1
+        return data, True
+    response_cache_stats[endpoint, "miss"] += 1
+    data = build()
+    cache.set(key, data, _ttl(endpoint))
+    return data, False
@@ -0,0 +1,45 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def has_timestamps(queryset) -> bool:
+    return any(field.name == "updated_at" for field in queryset.model._meta.get_fields())
+
+
+def queryset_etag(request, queryset):
+    """
+    Return the ETag of a role-filtered queryset from one aggregate query: its newest
+    updated_at and row count, scoped to the user and the full request path.
+
+    Lists get no Last-Modified: max(updated_at) stays put when a row is deleted or
+    leaves the user's set, and has one-second resolution, so If-Modified-Since
+    would answer 304 for a changed list. The row count in the ETag catches both.
+    """
+    state = queryset.order_by().aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+    etag, _ = make_validators(request, state["last_modified"], state["count"])
+    return etag
+
+
+def make_validators(request, last_modified, count):
+    stamp = last_modified.isoformat() if last_modified else ""
+    key = f"{request.user.pk}|{request.get_full_path()}|{stamp}|{count}"
+    return quote_etag(hashlib.sha1(key.encode()).hexdigest()), last_modified
+
+
+def conditional_response(request, etag, last_modified, render):
+    """
+    Answer If-None-Match / If-Modified-Since with 304 before `render` runs,
+    otherwise render the response and attach the validators.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = render()
+    if 200 <= response.status_code < 400:
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+    return response
@@ -0,0 +1,52 @@
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+# (endpoint, "requests" | "queries" | "time_ms") -> running total, for this process.
+query_stats = Counter()
+
+
+class QueryCounter:
+    """Database execute wrapper counting queries and their total wall time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 2)
+
+
+@contextmanager
+def count_queries():
+    """Count every query run on any database connection inside the block."""
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+def endpoint_name(request) -> str:
+    """Name of the resolved URL pattern (`lecture-list`, `course-lectures`, ...)."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    return match.view_name or match._func_path
+
+
+def record_query_stats(endpoint, counter):
+    query_stats[(endpoint, "requests")] += 1
+    query_stats[(endpoint, "queries")] += counter.count
+    query_stats[(endpoint, "time_ms")] += counter.duration_ms
@@ -0,0 +1,33 @@
+from dataclasses import fields
+
+from django.core.management.base import BaseCommand
+
+from courses.services.dataset_services import DATASET_PASSWORD, DatasetSpec, generate_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-insert a synthetic dataset of production size (about 500 courses, 50k students, "
+        "2M submissions and 3M grades by default). Use --scale for smaller runs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1.0, help="Multiply courses, teachers and students.")
+        parser.add_argument("--seed", type=int, default=None, help="Seed for a reproducible dataset.")
+        for field in fields(DatasetSpec):
+            parser.add_argument(f"--{field.name.replace('_', '-')}", type=field.type, default=None)
+
+    def handle(self, *args, **options):
+        spec = DatasetSpec(**{
+            field.name: options[field.name] for field in fields(DatasetSpec) if options[field.name] is not None
+        })
+        if options["scale"] != 1.0:
+            spec = spec.scaled(options["scale"])
+
+        def progress(done, counts):
+            if done % 10 == 0 or done == spec.courses:
+                self.stdout.write(f"{done}/{spec.courses} courses, {counts['grades']} grades")
+
+        counts = generate_dataset(spec, seed=options["seed"], progress=progress)
+        summary = ", ".join(f"{value} {key}" for key, value in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Created {summary}. Every user's password is '{DATASET_PASSWORD}'."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from courses.services.statistics_services import rebuild_grade_statistics
+
+
+class Command(BaseCommand):
+    help = "Recompute per-homework and per-course grade statistics from the grade table."
+
+    def handle(self, *args, **options):
+        homeworks = rebuild_grade_statistics()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt statistics for {homeworks} homeworks."))
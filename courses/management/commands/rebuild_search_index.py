@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from courses.services.search_services import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index of lectures, homeworks and submissions."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            indexed = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} documents."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from courses.services.grade_services import refresh_current_grades
+
+
+class Command(BaseCommand):
+    help = "Backfill or repair every submission's pointer to its latest grade."
+
+    def handle(self, *args, **options):
+        updated = refresh_current_grades()
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {updated} submissions."))
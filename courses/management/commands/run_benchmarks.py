@@ -0,0 +1,40 @@
+import json
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from courses.services.benchmark_services import BENCHMARK_ROLES, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every GET route of the API as a course teacher and a student and write "
+        "p50/p95 latency, queries per request and peak memory to a JSON file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--role", action="append", choices=BENCHMARK_ROLES, help="Limit to a role; repeatable.")
+        parser.add_argument("--endpoint", action="append", help="Limit to a URL name; repeatable.")
+        parser.add_argument("--output", help="Result file (default: benchmark-<timestamp>.json).")
+
+    def handle(self, *args, **options):
+        try:
+            report = run_benchmarks(
+                iterations=options["iterations"],
+                roles=options["role"] or BENCHMARK_ROLES,
+                only=options["endpoint"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        for row in report["results"]:
+            self.stdout.write(
+                f"{row['endpoint']:<28} {row['role']:<8} {row['status']}  p50 {row['p50_ms']} ms  "
+                f"p95 {row['p95_ms']} ms  {row['queries']} queries  {row['peak_memory_kb']} KiB"
+            )
+
+        output = options["output"] or f"benchmark-{datetime.now():%Y%m%d-%H%M%S}.json"
+        with open(output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(report['results'])} results to {output}."))
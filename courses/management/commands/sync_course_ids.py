@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from courses.services.course_services import sync_course_ids
+
+
+class Command(BaseCommand):
+    help = "Backfill or repair the denormalized course of homeworks, submissions, grades and comments."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = sync_course_ids()
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} rows."))
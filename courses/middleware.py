@@ -0,0 +1,73 @@
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+from courses.instrumentation import count_queries, endpoint_name, record_query_stats
+from courses.services.access import course_membership_scope
+
+
+class SyncAndAsyncMiddleware:
+    """
+    Base for middleware that runs natively under both WSGI and ASGI, so async views
+    are not pushed onto a thread by a sync-only layer. Subclasses implement
+    `__call__` for sync chains and `__acall__` for async ones.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+
+class CourseMembershipMiddleware(SyncAndAsyncMiddleware):
+    """Scope the course membership cache to a single request."""
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with course_membership_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with course_membership_scope():
+            return await self.get_response(request)
+
+
+class QueryCountMiddleware(SyncAndAsyncMiddleware):
+    """
+    Count the queries and SQL time of each request per resolved endpoint.
+
+    The counter is attached to the response as `query_stats` and, in DEBUG, sent as
+    `X-Query-Count` / `X-Query-Time-Ms`. Queries run while a streaming body is
+    consumed happen after the response leaves and are not counted.
+    """
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with count_queries() as counter:
+            response = self.get_response(request)
+        return self.finish(request, response, counter)
+
+    async def __acall__(self, request):
+        # Async ORM calls of a request share one thread; the wrapper must be installed there.
+        stack = ExitStack()
+        counter = await sync_to_async(stack.enter_context)(count_queries())
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, counter)
+
+    def finish(self, request, response, counter):
+        record_query_stats(endpoint_name(request), counter)
+        response.query_stats = counter
+        if settings.DEBUG:
+            response["X-Query-Count"] = str(counter.count)
+            response["X-Query-Time-Ms"] = str(counter.duration_ms)
+        return response
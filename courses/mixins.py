@@ -1,4 +1,16 @@
+import json
+
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from courses.cache import cached_response
+from courses.conditional import conditional_response, has_timestamps, make_validators, queryset_etag
+from courses.serializers import HomeworkSubmissionSerializer
+from courses.serializers.base import ValuesSerializer
+from courses.services.access import with_access_relations
+from courses.services.homework_services import claim_ungraded_submissions
 
 
 class PostPutBlockedMixin:
@@ -17,3 +29,141 @@ class PostPutBlockedMixin:
 
     def update(self, request, *args, **kwargs):
         return Response({"detail": "Direct PUT not allowed."}, status=405)
+
+
+class ActionListMixin:
+    """
+    List helper for custom actions that return a queryset.
+
+    Results go through the configured paginator. With `?stream=true` every row is
+    streamed instead as one JSON array rendered from `queryset.iterator()`,
+    keeping memory constant regardless of the number of rows. Passing
+    `cache=(endpoint, course_id, object_id)` serves pages from the response cache.
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = 500
+
+    def list_response(self, queryset, serializer_class, cache=None):
+        if cache is not None and not self.streaming:
+            return cached_response(
+                self.request, *cache, lambda: self.list_response(queryset, serializer_class)
+            )
+        if not has_timestamps(queryset):
+            return self.render_list(queryset, serializer_class)
+        return conditional_response(
+            self.request, queryset_etag(self.request, queryset), None,
+            lambda: self.render_list(queryset, serializer_class),
+        )
+
+    def render_list(self, queryset, serializer_class):
+        context = self.get_serializer_context()
+        if issubclass(serializer_class, ValuesSerializer):
+            queryset = serializer_class.values(queryset)
+        if self.streaming:
+            rows = self.stream_rows(queryset, serializer_class, context)
+            return StreamingHttpResponse(rows, content_type="application/json")
+
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(serializer_class(queryset, many=True, context=context).data)
+        serializer = serializer_class(page, many=True, context=context)
+        return self.get_paginated_response(serializer.data)
+
+    @property
+    def streaming(self) -> bool:
+        return self.request.query_params.get(self.stream_query_param) in ("1", "true")
+
+    def stream_rows(self, queryset, serializer_class, context):
+        yield "["
+        for index, instance in enumerate(queryset.iterator(chunk_size=self.stream_chunk_size)):
+            data = serializer_class(instance, context=context).data
+            yield ("," if index else "") + json.dumps(data, cls=JSONEncoder)
+        yield "]"
+
+
+class ReadSerializerMixin:
+    """
+    Serve list and retrieve through `read_serializer_class`, a ValuesSerializer.
+
+    Lists are rendered from `.values()` rows; writes keep `serializer_class`.
+    Schema generation still sees the regular serializer.
+    """
+
+    read_serializer_class = None
+
+    def get_serializer_class(self):
+        if self.action in ("list", "retrieve") and not getattr(self, "swagger_fake_view", False):
+            return self.read_serializer_class
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action == "list":
+            return self.read_serializer_class.values(queryset)
+        return queryset
+
+
+class DetailObjectMixin:
+    """
+    Load a detail action's primary object once per request.
+
+    `get_object` is memoized on the view, which serves a single request, so a
+    permission that needs the object and the action itself share one query and
+    one object-permission check. The detail queryset also select_relateds what
+    object permissions walk (`with_access_relations`) plus `object_select_related`.
+    """
+
+    object_select_related = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, "detail", False):
+            queryset = with_access_relations(queryset)
+            if self.object_select_related:
+                queryset = queryset.select_related(*self.object_select_related)
+        return queryset
+
+    def get_object(self):
+        if "_object" not in self.__dict__:
+            self._object = super().get_object()
+        return self._object
+
+
+class GradingQueueMixin:
+    """Shared body of the course and homework `grading-queue` actions."""
+
+    def grading_queue_response(self, request, course, homework=None):
+        """Claim the next `?limit=` ungraded submissions for the requesting teacher."""
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            raise ValidationError("limit must be an integer.")
+        submissions, expires_at = claim_ungraded_submissions(request.user, course, limit, homework)
+        serializer = HomeworkSubmissionSerializer(submissions, many=True, context={"request": request})
+        return Response({"lease_expires_at": expires_at, "results": serializer.data})
+
+
+class ConditionalGetMixin:
+    """
+    ETag support for list and retrieve, plus Last-Modified on retrieve.
+
+    The list ETag comes from max(updated_at) and the row count of the role-filtered
+    queryset, the detail validators from the object itself, so a matching
+    If-None-Match (or If-Modified-Since on retrieve) returns 304 without running
+    the serializer.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return conditional_response(
+            request, queryset_etag(request, queryset), None,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag, last_modified = make_validators(request, instance.updated_at, 1)
+        return conditional_response(
+            request, etag, last_modified, lambda: Response(self.get_serializer(instance).data)
+        )
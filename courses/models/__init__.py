@@ -3,6 +3,7 @@ from .course import Course
 from .lecture import Lecture
 from .homework import Homework, HomeworkSubmission
 from .grade import Grade, GradeComment
+from .statistics import HomeworkGradeStatistics, CourseGradeStatistics
 
 __all__ = [
     "User",
@@ -13,4 +14,6 @@ __all__ = [
     "HomeworkSubmission",
     "Grade",
     "GradeComment",
+    "HomeworkGradeStatistics",
+    "CourseGradeStatistics",
 ]
@@ -10,7 +10,8 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        indexes = [models.Index(fields=["-created_at", "-id"], name="%(class)s_keyset_idx")]
 
 
 class UUIDModel(models.Model):
@@ -19,4 +20,47 @@ class UUIDModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     class Meta:
-        abstract = True
\ No newline at end of file
+        abstract = True
+
+class CourseScopedModel(models.Model):
+    """
+    Abstract model for objects that belong to a course.
+
+    `course_source` names the FK the course is taken from. When it is not `course`
+    itself, `course` is a denormalized copy filled on create and re-derived when
+    the source changes. `course_moved` and `previous_course_id` tell post_save
+    receivers that the object now belongs to another course.
+    """
+
+    course_source = "course"
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded course and source to detect moves on save."""
+        instance = super().from_db(db, field_names, values)
+        loaded = instance.__dict__
+        if "course_id" in loaded:
+            instance._loaded_course_id = loaded["course_id"]
+        if f"{cls.course_source}_id" in loaded:
+            instance._loaded_source_id = loaded[f"{cls.course_source}_id"]
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Derive the course from its source and flag whether it changed."""
+        source_id = getattr(self, f"{self.course_source}_id")
+        source_changed = source_id != getattr(self, "_loaded_source_id", source_id)
+        if self.course_source != "course" and (self.course_id is None or source_changed):
+            self.course_id = getattr(self, self.course_source).course_id
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "course"}
+
+        self.course_moved = not self._state.adding and (
+            self.course_id != getattr(self, "_loaded_course_id", self.course_id)
+        )
+        self.previous_course_id = self._loaded_course_id if self.course_moved else None
+        super().save(*args, **kwargs)
+        self._loaded_course_id = self.course_id
+        self._loaded_source_id = source_id
@@ -22,6 +22,9 @@ class Course(UUIDModel, TimeStampedModel):
 
     objects = CourseQuerySet.as_manager()
 
+    class Meta(TimeStampedModel.Meta):
+        pass
+
     def __str__(self):
         """Return the course title."""
         return self.title
\ No newline at end of file
@@ -1,17 +1,22 @@
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 
-from courses.models import HomeworkSubmission, User, Role
-from courses.models.base import UUIDModel, TimeStampedModel
+from courses.models import Course, HomeworkSubmission, User, Role
+from courses.models.base import UUIDModel, TimeStampedModel, CourseScopedModel
 from courses.querysets import GradeQuerySet, GradeCommentQuerySet
 
 
-class Grade(UUIDModel, TimeStampedModel):
+class Grade(UUIDModel, TimeStampedModel, CourseScopedModel):
     """Represents a grade given to a homework submission by a teacher."""
 
+    course_source = "submission"
+
     submission = models.ForeignKey(
         HomeworkSubmission, on_delete=models.CASCADE, related_name="grades"
     )
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="grades", editable=False
+    )
     teacher = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -27,15 +32,31 @@ class Grade(UUIDModel, TimeStampedModel):
 
     objects = GradeQuerySet.as_manager()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored value so statistics can replace it on update."""
+        instance = super().from_db(db, field_names, values)
+        if "value" in instance.__dict__:
+            instance._loaded_value = instance.value
+        return instance
+
+    class Meta(TimeStampedModel.Meta):
+        pass
+
     def __str__(self):
         """Return 'Grade Value% for Lecture Topic'."""
         return f"{self.value}% for {self.submission.homework.lecture.topic}"
 
 
-class GradeComment(UUIDModel, TimeStampedModel):
+class GradeComment(UUIDModel, TimeStampedModel, CourseScopedModel):
     """Represents a comment on a grade, authored by a user."""
 
+    course_source = "grade"
+
     grade = models.ForeignKey(Grade, on_delete=models.CASCADE, related_name="comments")
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="grade_comments", editable=False
+    )
     author = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="grade_comments"
     )
@@ -43,6 +64,9 @@ class GradeComment(UUIDModel, TimeStampedModel):
 
     objects = GradeCommentQuerySet.as_manager()
 
+    class Meta(TimeStampedModel.Meta):
+        pass
+
     def __str__(self):
         """Return 'Comment by Author Email on Grade ID'."""
         return f"Comment by {self.author.email} on {self.grade.id}"
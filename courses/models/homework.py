@@ -1,31 +1,44 @@
 from django.db import models
 
-from courses.models import Lecture, User, Role
-from courses.models.base import UUIDModel, TimeStampedModel
+from courses.models import Course, Lecture, User, Role
+from courses.models.base import UUIDModel, TimeStampedModel, CourseScopedModel
 from courses.querysets import HomeworkQuerySet, HomeworkSubmissionQuerySet
 
 
-class Homework(UUIDModel, TimeStampedModel):
+class Homework(UUIDModel, TimeStampedModel, CourseScopedModel):
     """Represents homework assigned for a lecture."""
 
+    course_source = "lecture"
+
     lecture = models.ForeignKey(
         Lecture, on_delete=models.CASCADE, related_name="homeworks"
     )
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="homeworks", editable=False
+    )
     description = models.TextField(blank=True, default="")
 
     objects = HomeworkQuerySet.as_manager()
 
+    class Meta(TimeStampedModel.Meta):
+        pass
+
     def __str__(self):
         """Return 'HW for Lecture Topic'."""
         return f"HW for {self.lecture.topic}"
 
 
-class HomeworkSubmission(UUIDModel, TimeStampedModel):
+class HomeworkSubmission(UUIDModel, TimeStampedModel, CourseScopedModel):
     """Represents a student's submission for a homework, including optional file."""
 
+    course_source = "homework"
+
     homework = models.ForeignKey(
         Homework, on_delete=models.CASCADE, related_name="submissions"
     )
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="submissions", editable=False
+    )
     student = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -34,10 +47,31 @@ class HomeworkSubmission(UUIDModel, TimeStampedModel):
     )
     content = models.TextField()
     file = models.FileField(upload_to="submissions/", blank=True, null=True)
+    current_grade = models.ForeignKey(
+        "courses.Grade", on_delete=models.SET_NULL, null=True, blank=True,
+        related_name="+", editable=False, help_text="Latest grade of the submission",
+    )
+    current_grade_value = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    claimed_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name="+", editable=False, help_text="Teacher holding the grading lease",
+    )
+    claim_expires_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     objects = HomeworkSubmissionQuerySet.as_manager()
 
-    class Meta:
+    class Meta(TimeStampedModel.Meta):
+        indexes = TimeStampedModel.Meta.indexes + [
+            models.Index(fields=["homework", "current_grade_value"], name="submission_grade_idx"),
+            models.Index(
+                fields=["homework", "created_at"], name="ungraded_homework_queue_idx",
+                condition=models.Q(current_grade__isnull=True),
+            ),
+            models.Index(
+                fields=["course", "created_at"], name="ungraded_course_queue_idx",
+                condition=models.Q(current_grade__isnull=True),
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["homework", "student"],
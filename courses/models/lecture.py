@@ -1,11 +1,11 @@
 from courses.models import Course
-from courses.models.base import UUIDModel, TimeStampedModel
+from courses.models.base import UUIDModel, TimeStampedModel, CourseScopedModel
 from django.db import models
 
 from courses.querysets import LectureQuerySet
 
 
-class Lecture(UUIDModel, TimeStampedModel):
+class Lecture(UUIDModel, TimeStampedModel, CourseScopedModel):
     """Represents a lecture within a course with optional presentation file."""
 
     course = models.ForeignKey(
@@ -16,6 +16,9 @@ class Lecture(UUIDModel, TimeStampedModel):
 
     objects = LectureQuerySet.as_manager()
 
+    class Meta(TimeStampedModel.Meta):
+        pass
+
     def __str__(self):
         """Return 'Course Title - Lecture Topic'."""
         return f"{self.course.title} - {self.topic}"
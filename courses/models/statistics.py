@@ -0,0 +1,100 @@
+import math
+
+from django.db import models
+
+from courses.models import Course, Homework
+
+HISTOGRAM_BUCKETS = 10
+BUCKET_WIDTH = 100 // HISTOGRAM_BUCKETS
+
+
+def empty_histogram():
+    return [0] * HISTOGRAM_BUCKETS
+
+
+def bucket_for(value: int) -> int:
+    """Return the histogram bucket of a 0-100 grade; 100 shares the top bucket."""
+    return min(value // BUCKET_WIDTH, HISTOGRAM_BUCKETS - 1)
+
+
+class GradeStatistics(models.Model):
+    """
+    Abstract running summary of grade values.
+
+    Count, sum, sum of squares and a fixed 0-100 histogram are enough to serve
+    mean, standard deviation and approximate percentiles without reading grades.
+    """
+
+    count = models.PositiveIntegerField(default=0)
+    total = models.PositiveBigIntegerField(default=0)
+    total_squares = models.PositiveBigIntegerField(default=0)
+    histogram = models.JSONField(default=empty_histogram)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+    def add(self, value: int, count: int = 1):
+        """Account for `count` grades of `value`; a negative count removes them."""
+        self.count += count
+        self.total += value * count
+        self.total_squares += value * value * count
+        self.histogram[bucket_for(value)] += count
+
+    def remove(self, value: int):
+        self.add(value, -1)
+
+    def percentile(self, fraction: float):
+        """Approximate percentile, interpolated linearly inside the histogram bucket."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bucket, size in enumerate(self.histogram):
+            if size and seen + size >= rank:
+                low = bucket * BUCKET_WIDTH
+                high = 100 if bucket == HISTOGRAM_BUCKETS - 1 else low + BUCKET_WIDTH
+                return round(low + (high - low) * (rank - seen) / size, 2)
+            seen += size
+        return 100.0
+
+    def as_dict(self) -> dict:
+        mean = self.total / self.count if self.count else None
+        variance = self.total_squares / self.count - mean * mean if self.count else None
+        return {
+            "count": self.count,
+            "mean": round(mean, 2) if mean is not None else None,
+            "stddev": round(math.sqrt(max(variance, 0)), 2) if variance is not None else None,
+            "median": self.percentile(0.5),
+            "p25": self.percentile(0.25),
+            "p75": self.percentile(0.75),
+            "p90": self.percentile(0.9),
+            "histogram": [
+                {"from": bucket * BUCKET_WIDTH, "count": size}
+                for bucket, size in enumerate(self.histogram)
+            ],
+        }
+
+
+class HomeworkGradeStatistics(GradeStatistics):
+    """Grade summary of one homework."""
+
+    homework = models.OneToOneField(
+        Homework, on_delete=models.CASCADE, primary_key=True, related_name="grade_statistics"
+    )
+
+    def __str__(self):
+        """Return 'Grade stats for HW'."""
+        return f"Grade stats for {self.homework_id}"
+
+
+class CourseGradeStatistics(GradeStatistics):
+    """Grade summary rolled up over every homework of a course."""
+
+    course = models.OneToOneField(
+        Course, on_delete=models.CASCADE, primary_key=True, related_name="grade_statistics"
+    )
+
+    def __str__(self):
+        """Return 'Grade stats for Course'."""
+        return f"Grade stats for {self.course_id}"
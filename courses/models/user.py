@@ -9,7 +9,35 @@ class User(AbstractUser, UUIDModel):
     """Custom user model with role field (student or teacher)."""
 
     REQUIRED_FIELDS = ["role", "email"]
+    keyset_ordering = ("-date_joined", "-id")
     role = models.CharField(max_length=10, choices=Role.choices, default=Role.STUDENT)
+    token_version = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Embedded in JWTs; bumping it revokes every issued token"
+    )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the token-relevant fields so a change to them can revoke tokens on save."""
+        instance = super().from_db(db, field_names, values)
+        if all(field in instance.__dict__ for field in ("role", "is_active", "password")):
+            instance._loaded_credentials = instance.credentials
+        return instance
+
+    @property
+    def credentials(self) -> tuple:
+        return self.role, self.is_active, self.password
+
+    def save(self, *args, **kwargs):
+        """A new role, deactivation or a password change invalidates the user's tokens."""
+        loaded = getattr(self, "_loaded_credentials", None)
+        if loaded is not None and loaded != self.credentials:
+            self.token_version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "token_version"}
+        super().save(*args, **kwargs)
+        if loaded is not None:
+            self._loaded_credentials = self.credentials
 
     def __str__(self):
         """Return user's email and role display."""
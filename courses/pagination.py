@@ -0,0 +1,151 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Opaque-cursor pagination keyed on (created_at, id).
+
+    Each page is a single indexed range query: no COUNT(*) and no OFFSET scan.
+    Models can override the key with `keyset_ordering`. Clients that need totals
+    opt into page-number pagination by passing `?page=`.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    page_number_class = PageNumberPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.page_number_class.page_query_param in request.query_params:
+            return self._paginate_by_number(queryset, request, view)
+        window = self._window(queryset, request)
+        if window is None:
+            return None
+        return self._take(list(window))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async variant of `paginate_queryset` for async views; rows come from `aiterator()`."""
+        if self.page_number_class.page_query_param in request.query_params:
+            return await sync_to_async(self._paginate_by_number)(queryset, request, view)
+        window = self._window(queryset, request)
+        if window is None:
+            return None
+        return self._take([row async for row in window.aiterator(chunk_size=self.page_size + 1)])
+
+    def _paginate_by_number(self, queryset, request, view):
+        self.request = request
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.page_number = self.page_number_class()
+        return self.page_number.paginate_queryset(queryset.order_by(*self.ordering), request, view)
+
+    def _window(self, queryset, request):
+        """Order and filter the queryset from the cursor; return the slice holding one extra row, or None."""
+        self.request = request
+        self.ordering = self.get_ordering(request, queryset, None)
+        self.page_number = None
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request, queryset.model)
+        reverse, position = self.cursor or (False, None)
+
+        ordering = self._reversed(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+        return queryset[: self.page_size + 1]
+
+    def _take(self, rows):
+        reverse, position = self.cursor or (False, None)
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        self.has_next = True if reverse else has_more
+        self.has_previous = has_more if reverse else position is not None
+        return self.page
+
+    def get_paginated_response(self, data):
+        if self.page_number is not None:
+            return self.page_number.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(getattr(queryset.model, "keyset_ordering", self.ordering))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor((False, self._position(self.page[-1])))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor((True, self._position(self.page[0])))
+
+    def encode_cursor(self, cursor):
+        encoded = urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, model):
+        """Return `(reverse, position)` with every position value parsed by its ordering field."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            reverse, position = json.loads(urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering) or None in position:
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            position = [
+                model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return bool(reverse), position
+
+    def _position(self, instance):
+        """Return the ordering key of a row (instance or `.values()` dict) as JSON-safe values."""
+        fields = [field.lstrip("-") for field in self.ordering]
+        if isinstance(instance, dict):
+            values = [instance[field] for field in fields]
+        else:
+            values = [getattr(instance, field) for field in fields]
+        return [value.isoformat() if hasattr(value, "isoformat") else str(value) for value in values]
+
+    @staticmethod
+    def _reversed(ordering):
+        return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+
+    @staticmethod
+    def _after(ordering, position):
+        """Build the row-value comparison `(a, b) > (x, y)` in the given ordering."""
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return condition
+
+
+class SearchPagination(PageNumberPagination):
+    """Page-number pagination for ranked results, which have no stable keyset to page on."""
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -1,7 +1,7 @@
 from rest_framework import permissions
 from rest_framework.permissions import SAFE_METHODS
 
-from courses.services.access import is_teacher, is_course_teacher, get_course_from_obj
+from courses.services.access import ObjectAccess, is_teacher, ais_course_teacher, get_course_id_from_obj
 
 
 class IsTeacherOrReadOnly(permissions.BasePermission):
@@ -13,8 +13,12 @@ class IsTeacherOrReadOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        course = get_course_from_obj(obj)
-        return is_course_teacher(request.user, course)
+        return ObjectAccess(request.user, obj).is_course_teacher
+
+    async def ahas_object_permission(self, request, view, obj):
+        if request.method in SAFE_METHODS:
+            return True
+        return await ais_course_teacher(request.user, get_course_id_from_obj(obj))
 
 
 class IsCourseTeacherOrReadOnly(permissions.BasePermission):
@@ -23,5 +27,9 @@ class IsCourseTeacherOrReadOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        course = get_course_from_obj(obj)
-        return is_course_teacher(request.user, course)
+        return ObjectAccess(request.user, obj).is_course_teacher
+
+    async def ahas_object_permission(self, request, view, obj):
+        if request.method in SAFE_METHODS:
+            return True
+        return await ais_course_teacher(request.user, get_course_id_from_obj(obj))
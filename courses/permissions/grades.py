@@ -1,7 +1,7 @@
 from rest_framework import permissions
 from rest_framework.permissions import SAFE_METHODS
 
-from courses.services.access import is_teacher, is_student, is_course_teacher, get_course_from_obj
+from courses.services.access import ObjectAccess, is_teacher, is_student, ais_course_teacher
 
 
 class IsTeacherOfCourse(permissions.BasePermission):
@@ -11,8 +11,7 @@ class IsTeacherOfCourse(permissions.BasePermission):
         return is_teacher(request.user)
 
     def has_object_permission(self, request, view, obj):
-        course = obj.submission.homework.lecture.course
-        return is_course_teacher(request.user, course)
+        return ObjectAccess(request.user, obj).is_course_teacher
 
 
 class IsGradeOwnerOrCourseTeacher(permissions.BasePermission):
@@ -22,25 +21,23 @@ class IsGradeOwnerOrCourseTeacher(permissions.BasePermission):
         return request.user.is_authenticated
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        course = get_course_from_obj(obj)
-
-        if request.method in SAFE_METHODS:
-            if is_student(user):
-                return obj.submission.student == user
-            if is_teacher(user):
-                return is_course_teacher(user, course)
-            return False
+        access = ObjectAccess(request.user, obj)
+        if request.method in SAFE_METHODS and is_student(request.user):
+            return access.is_owner
+        return access.is_course_teacher
 
-        return is_teacher(user) and is_course_teacher(user, course)
+    async def ahas_object_permission(self, request, view, obj):
+        user = request.user
+        if request.method in SAFE_METHODS and is_student(user):
+            return obj.submission.student_id == user.pk
+        return await ais_course_teacher(user, obj.course_id)
 
 
 class CanGradeCourse(permissions.BasePermission):
     """Only teachers of the submission's course can POST grades."""
 
     def has_object_permission(self, request, view, obj):
-        course = obj.homework.lecture.course
-        return is_course_teacher(request.user, course)
+        return ObjectAccess(request.user, obj).is_course_teacher
 
 
 class CanCommentOnGrade(permissions.BasePermission):
@@ -50,16 +47,9 @@ class CanCommentOnGrade(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        if not user.is_authenticated:
-            return False
-
-        course = obj.grade.submission.homework.lecture.course
-
-        if is_teacher(user):
-            return is_course_teacher(user, course)
-
-        if is_student(user):
-            return obj.grade.submission.student == user
-
+        access = ObjectAccess(request.user, obj)
+        if is_teacher(request.user):
+            return access.is_course_teacher
+        if is_student(request.user):
+            return access.is_owner
         return False
@@ -1,7 +1,7 @@
 from rest_framework import permissions
 from rest_framework.permissions import SAFE_METHODS
 
-from courses.services.access import is_student, is_teacher, is_course_student, is_course_teacher, get_course_from_obj
+from courses.services.access import ObjectAccess
 
 
 class IsStudentAndEnrolled(permissions.BasePermission):
@@ -13,8 +13,7 @@ class IsStudentAndEnrolled(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        course = obj.homework.lecture.course
-        return is_course_student(request.user, course)
+        return ObjectAccess(request.user, obj).is_course_student
 
 
 class IsStudentOfCourseOrTeacherCanView(permissions.BasePermission):
@@ -24,12 +23,7 @@ class IsStudentOfCourseOrTeacherCanView(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        course = get_course_from_obj(obj)
-        if is_teacher(request.user):
-            return is_course_teacher(request.user, course)
-        if is_student(request.user):
-            return is_course_student(request.user, course)
-        return False
+        return ObjectAccess(request.user, obj).role is not None
 
 
 class CanAccessSubmissions(permissions.BasePermission):
@@ -43,13 +37,12 @@ class CanAccessSubmissions(permissions.BasePermission):
         if not user.is_authenticated:
             return False
 
-        homework = view.get_object()
-        course = homework.lecture.course
+        access = ObjectAccess(user, view.get_object())
 
         if request.method in SAFE_METHODS:
-            return is_course_teacher(user, course) or is_course_student(user, course)
+            return access.role is not None
 
         if request.method == "POST":
-            return is_course_student(user, course)
+            return access.is_course_student
 
         return False
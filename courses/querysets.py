@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from courses.services.access import is_teacher, is_student
 from courses.services.filters import filters_for_course, filters_for_lecture, filters_for_homework, \
     filters_for_submission, filters_for_grade, filters_for_comment
@@ -29,6 +31,29 @@ class CourseQuerySet(RoleFilteredQuerySet):
     def for_user(self, user):
         return super().for_user(user, *filters_for_course(user))
 
+    def with_rosters(self):
+        """Prefetch teacher and student usernames: two queries regardless of the number of courses."""
+        users = self.model._meta.get_field("teachers").related_model.objects.only("id", "username")
+        return self.prefetch_related(Prefetch("teachers", queryset=users), Prefetch("students", queryset=users))
+
+    def with_member_counts(self):
+        """Annotate `teacher_count` and `student_count` without loading the rosters."""
+        return self.annotate(
+            teacher_count=self._roster_count("teachers"),
+            student_count=self._roster_count("students"),
+        )
+
+    def _roster_count(self, relation):
+        through = self.model._meta.get_field(relation).remote_field.through
+        counts = (
+            through.objects.filter(course=OuterRef("pk"))
+            .order_by()
+            .values("course")
+            .annotate(total=Count("*"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+
 
 class UserFilteredQuerySet(RoleFilteredQuerySet):
     """ Generic QuerySet for objects linked to courses via FK."""
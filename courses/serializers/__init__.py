@@ -1,15 +1,24 @@
-from .user_serializers import UserSerializer
-from .course_serializers import CourseSerializer
+from .user_serializers import UserSerializer, CourseTokenObtainPairSerializer, CourseTokenRefreshSerializer
+from .course_serializers import CourseSerializer, CourseSummarySerializer, BulkEnrollmentSerializer
 from .lecture_serializers import LectureSerializer
-from .homework_serializers import HomeworkSerializer, HomeworkSubmissionSerializer
-from .grade_serializers import GradeSerializer, GradeCommentSerializer
+from .homework_serializers import HomeworkSerializer, HomeworkSubmissionSerializer, HomeworkSubmissionReadSerializer
+from .grade_serializers import GradeSerializer, GradeReadSerializer, GradeCommentSerializer, BulkGradeSerializer
+from .search_serializers import SearchResultSerializer
 
 __all__ = [
     "UserSerializer",
+    "CourseTokenObtainPairSerializer",
+    "CourseTokenRefreshSerializer",
     "CourseSerializer",
+    "CourseSummarySerializer",
+    "BulkEnrollmentSerializer",
     "LectureSerializer",
     "HomeworkSerializer",
     "HomeworkSubmissionSerializer",
+    "HomeworkSubmissionReadSerializer",
     "GradeSerializer",
+    "GradeReadSerializer",
     "GradeCommentSerializer",
+    "BulkGradeSerializer",
+    "SearchResultSerializer",
 ]
@@ -0,0 +1,87 @@
+from rest_framework import serializers
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    Read-only fast path for a ModelSerializer on hot list endpoints.
+
+    Field names, order, sources and formatting are compiled once from
+    `source_serializer`; rows are then rendered straight from `queryset.values()`
+    dicts (see `values`) without binding DRF fields per row. Model instances are
+    accepted too, so the same class serves retrieve. The output is identical to
+    `source_serializer`.
+    """
+
+    source_serializer = None
+
+    @classmethod
+    def accessors(cls):
+        """Return `(name, lookup, attrs, convert, skip_none)` per readable field, compiled once."""
+        if "_accessors" not in cls.__dict__:
+            cls._accessors = [
+                cls._compile(name, field)
+                for name, field in cls.source_serializer().fields.items()
+                if not field.write_only
+            ]
+        return cls._accessors
+
+    @classmethod
+    def values(cls, queryset):
+        """Narrow a queryset to the dict rows this serializer renders."""
+        return queryset.values(*(lookup for _, lookup, _, _, _ in cls.accessors()))
+
+    @classmethod
+    def _compile(cls, name, field):
+        attrs = field.source.split(".")
+        # A dotted source on an optional field is skipped, not rendered as null, when a link is missing.
+        skip_none = len(attrs) > 1 and not field.required
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            attrs = [f"{field.source}_id"]
+            convert = _identity
+        elif isinstance(field, serializers.FileField):
+            convert = _file_url(cls.source_serializer.Meta.model._meta.get_field(field.source).storage)
+        else:
+            convert = _representation(field)
+        return name, field.source.replace(".", "__"), attrs, convert, skip_none
+
+    def to_representation(self, row):
+        request = self.context.get("request")
+        data = {}
+        for name, lookup, attrs, convert, skip_none in self.accessors():
+            value = row[lookup] if isinstance(row, dict) else _traverse(row, attrs)
+            if value is None:
+                if not skip_none:
+                    data[name] = None
+            else:
+                data[name] = convert(value, request)
+        return data
+
+
+def _identity(value, request):
+    return value
+
+
+def _representation(field):
+    def convert(value, request):
+        return field.to_representation(value)
+
+    return convert
+
+
+def _file_url(storage):
+    def convert(value, request):
+        name = getattr(value, "name", value)
+        if not name:
+            return None
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return convert
+
+
+def _traverse(instance, attrs):
+    for attr in attrs:
+        if instance is None:
+            return None
+        instance = getattr(instance, attr)
+    return instance
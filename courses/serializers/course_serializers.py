@@ -27,3 +27,22 @@ class CourseSerializer(serializers.ModelSerializer):
     class Meta:
         model = Course
         fields = ["id", "title", "description", "teachers", "students"]
+
+
+class CourseSummarySerializer(serializers.ModelSerializer):
+    """Compact course: roster sizes instead of usernames; rosters live under /teachers/ and /students/."""
+
+    teacher_count = serializers.IntegerField(read_only=True)
+    student_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Course
+        fields = ["id", "title", "description", "teacher_count", "student_count"]
+
+
+class BulkEnrollmentSerializer(serializers.Serializer):
+    """Input for bulk enrollment: user IDs, usernames or emails."""
+
+    users = serializers.ListField(
+        child=serializers.CharField(), allow_empty=False, max_length=5000
+    )
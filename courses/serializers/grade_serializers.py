@@ -1,6 +1,11 @@
+import csv
+import io
+from itertools import islice
+
 from rest_framework import serializers
 
 from courses.models import Grade, GradeComment
+from courses.serializers.base import ValuesSerializer
 
 
 class GradeSerializer(serializers.ModelSerializer):
@@ -10,14 +15,52 @@ class GradeSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Grade
-        fields = "__all__"
+        exclude = ("course",)
         read_only_fields = ["teacher", "created", "modified", "submission"]
 
 
+class GradeReadSerializer(ValuesSerializer):
+    """Fast list/retrieve rendering of GradeSerializer; the teacher username comes from a join."""
+
+    source_serializer = GradeSerializer
+
+
 class GradeCommentSerializer(serializers.ModelSerializer):
     """Serializer for GradeComment model with read-only author and grade fields."""
 
     class Meta:
         model = GradeComment
-        fields = "__all__"
+        exclude = ("course",)
         read_only_fields = ("author", "grade", "created_at")
+
+
+class BulkGradeSerializer(serializers.Serializer):
+    """
+    Input for bulk grading: JSON `rows` or a CSV `file` with a header of
+    submission or student, value and feedback.
+    """
+
+    max_rows = 5000
+
+    rows = serializers.ListField(child=serializers.DictField(), required=False, max_length=max_rows)
+    file = serializers.FileField(required=False)
+
+    def validate(self, attrs):
+        if "file" in attrs:
+            attrs["rows"] = self._read_csv(attrs.pop("file"))
+        if not attrs.get("rows"):
+            raise serializers.ValidationError("Provide grade rows or a CSV file.")
+        return attrs
+
+    def _read_csv(self, file):
+        """Read at most `max_rows` rows; an undecodable or malformed file is a validation error."""
+        reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig"))
+        try:
+            rows = list(islice(reader, self.max_rows + 1))
+        except UnicodeDecodeError:
+            raise serializers.ValidationError({"file": "The CSV file must be UTF-8 encoded."})
+        except csv.Error as exc:
+            raise serializers.ValidationError({"file": f"Malformed CSV: {exc}."})
+        if len(rows) > self.max_rows:
+            raise serializers.ValidationError({"file": f"Ensure the file has no more than {self.max_rows} rows."})
+        return rows
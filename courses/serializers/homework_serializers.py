@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from courses.models import Homework, HomeworkSubmission
+from courses.serializers.base import ValuesSerializer
 
 
 class HomeworkSerializer(serializers.ModelSerializer):
@@ -19,5 +20,11 @@ class HomeworkSubmissionSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = HomeworkSubmission
-        fields = "__all__"
-        read_only_fields = ("student", "homework")
\ No newline at end of file
+        exclude = ("course", "claimed_by", "claim_expires_at")
+        read_only_fields = ("student", "homework")
+
+
+class HomeworkSubmissionReadSerializer(ValuesSerializer):
+    """Fast list/retrieve rendering of HomeworkSubmissionSerializer."""
+
+    source_serializer = HomeworkSubmissionSerializer
@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from courses.services.search_services import SEARCHABLE
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """A ranked search match; lower `rank` is better (FTS5 bm25)."""
+
+    kind = serializers.ChoiceField(choices=list(SEARCHABLE))
+    id = serializers.UUIDField()
+    rank = serializers.FloatField()
+    snippet = serializers.CharField()
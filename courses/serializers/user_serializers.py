@@ -1,5 +1,11 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from courses.authentication import TOKEN_ROLE_CLAIM, TOKEN_VERSION_CLAIM, token_is_current
+from courses.tokens import CourseRefreshToken
 
 User = get_user_model()
 
@@ -22,4 +28,55 @@ class UserSerializer(serializers.ModelSerializer):
         )
         user.set_password(validated_data["password"])
         user.save()
-        return user
\ No newline at end of file
+        return user
+
+
+class CourseTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Token pair carrying the user's role and token version, so requests need no user lookup."""
+
+    token_class = CourseRefreshToken
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token[TOKEN_ROLE_CLAIM] = user.role
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+
+class CourseTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuse to refresh tokens revoked by a version bump.
+
+    The refresh token is verified once (signature, expiry, blacklist) and that
+    instance issues the access token. A versioned token needs no user lookup:
+    deactivation bumps the version. Unversioned tokens fall back to simplejwt's
+    authentication rule.
+    """
+
+    token_class = CourseRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if not token_is_current(refresh):
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+        if TOKEN_VERSION_CLAIM not in refresh:
+            self._check_user_is_active(refresh)
+
+        data = {"access": str(refresh.access_token)}
+        if jwt_settings.ROTATE_REFRESH_TOKENS:
+            if jwt_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data["refresh"] = str(refresh)
+        return data
+
+    def _check_user_is_active(self, refresh):
+        user = User.objects.filter(
+            **{jwt_settings.USER_ID_FIELD: refresh.payload.get(jwt_settings.USER_ID_CLAIM)}
+        ).first()
+        if user is None or not jwt_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
@@ -1,5 +1,84 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+
+from django.apps import apps
+
 from courses.models.roles import Role
 
+_membership_cache: ContextVar[dict | None] = ContextVar("course_membership_cache", default=None)
+
+
+def _course_ids(relation, user):
+    """Query the course IDs of one roster by user ID, so a token-backed user is never loaded."""
+    through = apps.get_model("courses", "Course")._meta.get_field(relation).remote_field.through
+    return through.objects.filter(user_id=user.pk).values_list("course_id", flat=True)
+
+
+class CourseMembership:
+    """
+    Course IDs a user teaches or is enrolled in.
+    Each side is loaded with a single query on first access and answered from memory afterwards.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._teaching = None
+        self._enrolled = None
+
+    @property
+    def teaching(self) -> frozenset:
+        if self._teaching is None:
+            self._teaching = frozenset(_course_ids("teachers", self.user))
+        return self._teaching
+
+    @property
+    def enrolled(self) -> frozenset:
+        if self._enrolled is None:
+            self._enrolled = frozenset(_course_ids("students", self.user))
+        return self._enrolled
+
+    async def aload(self, teaching=True, enrolled=True) -> "CourseMembership":
+        """Load the requested sides with the async ORM so the properties above never query."""
+        if teaching and self._teaching is None:
+            self._teaching = frozenset([pk async for pk in _course_ids("teachers", self.user)])
+        if enrolled and self._enrolled is None:
+            self._enrolled = frozenset([pk async for pk in _course_ids("students", self.user)])
+        return self
+
+
+@contextmanager
+def course_membership_scope():
+    """Cache course memberships for the duration of the block (one request)."""
+    token = _membership_cache.set({})
+    try:
+        yield
+    finally:
+        _membership_cache.reset(token)
+
+
+def get_course_membership(user) -> CourseMembership:
+    """Return the user's membership, reusing the one loaded earlier in the current scope."""
+    cache = _membership_cache.get()
+    if cache is None:
+        return CourseMembership(user)
+    membership = cache.get(user.pk)
+    if membership is None:
+        membership = cache[user.pk] = CourseMembership(user)
+    return membership
+
+
+def invalidate_course_membership(user) -> None:
+    """Drop the cached membership of a user whose courses changed in the current scope."""
+    cache = _membership_cache.get()
+    if cache is not None:
+        cache.pop(user.pk, None)
+
+
+async def aget_course_membership(user, teaching=True, enrolled=True) -> CourseMembership:
+    """Async `get_course_membership`, with the requested sides already loaded."""
+    return await get_course_membership(user).aload(teaching, enrolled)
+
 
 def is_teacher(user) -> bool:
     return user.is_authenticated and user.role == Role.TEACHER
@@ -11,29 +90,114 @@ def is_student(user) -> bool:
 
 def is_course_teacher(user, course) -> bool:
     """Check if user is a teacher of the given course."""
-    return is_teacher(user) and course.teachers.filter(id=user.id).exists()
+    return is_teacher(user) and course.pk in get_course_membership(user).teaching
 
 
 def is_course_student(user, course) -> bool:
     """Check if user is a student enrolled in the given course."""
-    return is_student(user) and course.students.filter(id=user.id).exists()
-
-
-def get_course_from_obj(obj):
-    """
-    Try to resolve the Course object from different domain objects.
-    Works for course, lecture, homework, submission, grade, comment.
-    """
-    if hasattr(obj, "teachers") and hasattr(obj, "students"):
-        return obj  # it's a Course
-    if hasattr(obj, "course"):
-        return obj.course
-    if hasattr(obj, "lecture"):
-        return obj.lecture.course
-    if hasattr(obj, "homework"):
-        return obj.homework.lecture.course
-    if hasattr(obj, "submission"):
-        return obj.submission.homework.lecture.course
-    if hasattr(obj, "grade"):
-        return obj.grade.submission.homework.lecture.course
-    return None
+    return is_student(user) and course.pk in get_course_membership(user).enrolled
+
+
+async def ais_course_teacher(user, course_id) -> bool:
+    """Async-safe `is_course_teacher`, keyed by course ID so no relation has to be loaded."""
+    return is_teacher(user) and course_id in (await aget_course_membership(user, enrolled=False)).teaching
+
+
+async def ais_course_student(user, course_id) -> bool:
+    """Async-safe `is_course_student`, keyed by course ID."""
+    return is_student(user) and course_id in (await aget_course_membership(user, teaching=False)).enrolled
+
+
+def get_course_id_from_obj(obj):
+    """
+    Return the ID of the course owning a course, lecture, homework, submission, grade
+    or comment, from the denormalized `course_id`, without loading the course.
+    """
+    if obj._meta.model_name == "course":
+        return obj.pk
+    return getattr(obj, "course_id", None)
+
+
+# model name -> lookup of the student who owns objects of that model
+OWNER_LOOKUPS = {
+    "homeworksubmission": "student_id",
+    "grade": "submission__student_id",
+    "gradecomment": "grade__submission__student_id",
+}
+
+_NOT_LOADED = object()
+
+
+def _loaded_value(obj, lookup):
+    """Follow `lookup` through relations already loaded on `obj`; `_NOT_LOADED` if one is not."""
+    *relations, attname = lookup.split("__")
+    for name in relations:
+        if not obj._meta.get_field(name).is_cached(obj):
+            return _NOT_LOADED
+        obj = getattr(obj, name)
+        if obj is None:
+            return None
+    return getattr(obj, attname)
+
+
+def get_owner_id(obj):
+    """
+    ID of the student who owns a submission, grade or comment; None for other objects.
+    Read from relations loaded by `with_access_relations`, else one query for the
+    object's model; remembered on the instance either way.
+    """
+    lookup = OWNER_LOOKUPS.get(obj._meta.model_name)
+    if lookup is None:
+        return None
+    if "_access_owner_id" not in obj.__dict__:
+        owner_id = _loaded_value(obj, lookup)
+        if owner_id is _NOT_LOADED:
+            owner_id = type(obj)._base_manager.filter(pk=obj.pk).values_list(lookup, flat=True).first()
+        obj.__dict__["_access_owner_id"] = owner_id
+    return obj.__dict__["_access_owner_id"]
+
+
+def with_access_relations(queryset):
+    """select_related the relations `get_owner_id` walks for the queryset's model."""
+    lookup = OWNER_LOOKUPS.get(queryset.model._meta.model_name, "")
+    relations, _, _ = lookup.rpartition("__")
+    return queryset.select_related(relations) if relations else queryset
+
+
+class ObjectAccess:
+    """
+    The requesting user's standing on an object: their role on the owning course and
+    whether they own it.
+
+    The course comes from the denormalized `course_id` and the role from the
+    request's course membership, so neither costs a query of its own; ownership
+    is resolved by `get_owner_id` only when asked for.
+    """
+
+    def __init__(self, user, obj):
+        self.user = user
+        self.obj = obj
+        self.course_id = get_course_id_from_obj(obj)
+
+    @cached_property
+    def role(self):
+        """`Role.TEACHER` or `Role.STUDENT` on the object's course, None for outsiders."""
+        if self.course_id is None:
+            return None
+        if is_teacher(self.user):
+            return Role.TEACHER if self.course_id in get_course_membership(self.user).teaching else None
+        if is_student(self.user):
+            return Role.STUDENT if self.course_id in get_course_membership(self.user).enrolled else None
+        return None
+
+    @property
+    def is_course_teacher(self) -> bool:
+        return self.role == Role.TEACHER
+
+    @property
+    def is_course_student(self) -> bool:
+        return self.role == Role.STUDENT
+
+    @cached_property
+    def is_owner(self) -> bool:
+        return self.user.is_authenticated and get_owner_id(self.obj) == self.user.pk
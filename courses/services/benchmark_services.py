@@ -0,0 +1,156 @@
+import math
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.urls import URLPattern, URLResolver, reverse
+from rest_framework.test import APIClient
+
+from courses import urls as course_urls
+from courses.models import Course, Lecture, Homework, HomeworkSubmission, Grade, GradeComment, User
+
+BENCHMARK_ROLES = ("teacher", "student")
+
+
+def iter_get_routes(patterns=None):
+    """Yield `(url_name, basename, kwargs)` for every GET-able named route of courses/urls.py."""
+    seen = set()
+    for pattern in course_urls.urlpatterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_get_routes(pattern.url_patterns)
+            continue
+        if not isinstance(pattern, URLPattern) or not pattern.name:
+            continue
+        kwargs = set(pattern.pattern.regex.groupindex)
+        if "format" in kwargs:
+            continue
+        if pattern.name in seen or not _serves_get(pattern.callback):
+            continue
+        seen.add(pattern.name)
+        yield pattern.name, getattr(pattern.callback, "initkwargs", {}).get("basename"), sorted(kwargs)
+
+
+def _serves_get(callback):
+    actions = getattr(callback, "actions", None)
+    if actions is not None:
+        return "get" in actions
+    view_class = getattr(callback, "view_class", None)
+    return view_class is not None and hasattr(view_class, "get")
+
+
+def benchmark_subjects():
+    """
+    Pick a graded submission and everything around it: the objects routes are
+    called with and the teacher and student acting on them.
+    """
+    submission = (
+        HomeworkSubmission.objects.filter(current_grade__isnull=False)
+        .select_related("homework__lecture", "course", "student", "current_grade")
+        .first()
+    )
+    if submission is None:
+        return None
+    course = submission.course
+    grade = submission.current_grade
+    return {
+        "users": {"teacher": course.teachers.first(), "student": submission.student},
+        "objects": {
+            "course": course,
+            "lecture": submission.homework.lecture,
+            "homework": submission.homework,
+            "submission": submission,
+            "grade": grade,
+            "grade-comment": GradeComment.objects.filter(grade=grade).first()
+            or GradeComment.objects.filter(course=course).first(),
+            "user": submission.student,
+        },
+    }
+
+
+def run_benchmarks(iterations=20, roles=BENCHMARK_ROLES, only=None) -> dict:
+    """
+    Request every GET route once per role to warm up, then `iterations` more times.
+
+    Each result carries p50/p95/mean latency, the queries of one request (from
+    QueryCountMiddleware) and the peak Python memory of one request under tracemalloc.
+    """
+    subjects = benchmark_subjects()
+    if subjects is None:
+        raise ValueError("No graded submission to benchmark against; generate a dataset first.")
+
+    results = []
+    for name, basename, kwargs in iter_get_routes():
+        if only and name not in only:
+            continue
+        target = subjects["objects"].get(basename)
+        if kwargs and target is None:
+            continue
+        path = reverse(name, kwargs={key: target.pk for key in kwargs})
+        for role in roles:
+            client = APIClient(SERVER_NAME=_benchmark_host())
+            client.force_authenticate(user=subjects["users"][role])
+            results.append({"endpoint": name, "role": role, "path": path, **_measure(client, path, iterations)})
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "iterations": iterations,
+        "dataset": dataset_counts(),
+        "results": results,
+    }
+
+
+def dataset_counts() -> dict:
+    return {
+        model._meta.model_name: model.objects.count()
+        for model in (User, Course, Lecture, Homework, HomeworkSubmission, Grade, GradeComment)
+    }
+
+
+def _measure(client, path, iterations):
+    response = _request(client, path)
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = _request(client, path)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        _request(client, path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stats = getattr(response, "query_stats", None)
+    return {
+        "status": response.status_code,
+        "p50_ms": _percentile(timings, 0.5),
+        "p95_ms": _percentile(timings, 0.95),
+        "mean_ms": round(sum(timings) / len(timings), 2) if timings else None,
+        "queries": stats.count if stats is not None else None,
+        "sql_ms": stats.duration_ms if stats is not None else None,
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def _request(client, path):
+    response = client.get(path)
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+    return response
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)], 2)
+
+
+def _benchmark_host():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != "*"]
+    return hosts[0].lstrip(".") if hosts else "localhost"
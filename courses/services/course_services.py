@@ -1,28 +1,100 @@
-from courses.models import Course, User, Role
+import uuid
+
+from django.db import transaction
+from django.db.models import F, OuterRef, Q, Subquery
+from django.utils import timezone
+
+from courses.cache import bump_course_cache_version
+from courses.models import Course, User, Role, Homework, HomeworkSubmission, Grade, GradeComment
+from courses.services.access import is_course_teacher, invalidate_course_membership
 from rest_framework.exceptions import PermissionDenied, NotFound
 
 def add_user_to_course(course: Course, user: User, role: Role, acting_user: User):
     """Add a user (teacher/student) to a course, enforcing rules."""
-    if not course.teachers.filter(id=acting_user.id).exists():
+    if not is_course_teacher(acting_user, course):
         raise PermissionDenied("Only course teachers can modify this course.")
 
     if user.role != role:
         raise ValueError(f"User must have role {role}.")
     relation = course.teachers if role == Role.TEACHER else course.students
     relation.add(user)
+    invalidate_course_membership(user)
     return user
 
+def resolve_users(identifiers) -> dict:
+    """Map each identifier (user ID, username or email) to its user, or None, in one query."""
+    ids = set()
+    for identifier in identifiers:
+        try:
+            ids.add(uuid.UUID(str(identifier)))
+        except ValueError:
+            pass
+    users = User.objects.filter(Q(id__in=ids) | Q(username__in=identifiers) | Q(email__in=identifiers))
+
+    lookup = {}
+    for user in users:
+        lookup.setdefault(user.email, user)
+        lookup[str(user.id)] = user
+        lookup[user.username] = user
+    return {identifier: lookup.get(str(identifier)) for identifier in identifiers}
+
+def add_users_to_course(course: Course, identifiers, role: Role, acting_user: User) -> list[dict]:
+    """
+    Add many users (teachers/students) to a course in one transaction.
+    Returns one result per identifier: added, already_member, not_found or wrong_role.
+    """
+    if not is_course_teacher(acting_user, course):
+        raise PermissionDenied("Only course teachers can modify this course.")
+
+    relation = course.teachers if role == Role.TEACHER else course.students
+    resolved = resolve_users(identifiers)
+    candidates = {user.id for user in resolved.values() if user is not None and user.role == role}
+
+    with transaction.atomic():
+        existing = set(
+            relation.through.objects.filter(course_id=course.id, user_id__in=candidates)
+            .values_list("user_id", flat=True)
+        )
+        added = candidates - existing
+        relation.through.objects.bulk_create(
+            [relation.through(course_id=course.id, user_id=user_id) for user_id in added],
+            ignore_conflicts=True,
+        )
+        if added:
+            touch_courses([course.pk])
+
+    results = []
+    for identifier, user in resolved.items():
+        if user is None:
+            results.append({"user": identifier, "status": "not_found"})
+            continue
+        if user.role != role:
+            status = "wrong_role"
+        elif user.id in existing:
+            status = "already_member"
+        else:
+            status = "added"
+            invalidate_course_membership(user)
+        results.append({"user": identifier, "id": user.id, "status": status})
+    return results
+
 def remove_user_from_course(course: Course, user: User, role: Role, acting_user: User):
     """Remove a user (teacher/student) from a course, enforcing rules."""
-    if not course.teachers.filter(id=acting_user.id).exists():
+    if not is_course_teacher(acting_user, course):
         raise PermissionDenied("Only course teachers can modify this course.")
 
     if user.role != role:
         raise ValueError(f"User must have role {role}.")
     relation = course.teachers if role == Role.TEACHER else course.students
     relation.remove(user)
+    invalidate_course_membership(user)
     return user
 
+def touch_courses(course_ids):
+    """Bump updated_at and the cache version of courses whose rosters changed."""
+    Course.objects.filter(pk__in=course_ids).update(updated_at=timezone.now())
+    bump_course_cache_version(*course_ids)
+
 def get_course_users(course: Course, role: Role):
     """Return all users of a given role in a course."""
     relation = course.teachers if role == Role.TEACHER else course.students
@@ -30,7 +102,7 @@ def get_course_users(course: Course, role: Role):
 
 def create_lecture_for_course(course: Course, data: dict, acting_user: User, LectureModel):
     """Create a lecture under a course, ensuring only teachers can do it."""
-    if acting_user not in course.teachers.all():
+    if not is_course_teacher(acting_user, course):
         raise PermissionDenied("Only course teachers can add lectures.")
     lecture = LectureModel.objects.create(course=course, **data)
     return lecture
@@ -40,10 +112,43 @@ def get_teaching_courses(user):
     """Return courses taught by the given user, enforcing teacher role."""
     if user.role != Role.TEACHER:
         raise PermissionDenied("Only teachers can view teaching courses.")
-    return user.teaching_courses.all()
+    return Course.objects.filter(teachers=user.pk)
 
 def get_enrolled_courses(user):
     """Return courses a student is enrolled in, enforcing student role."""
     if user.role != Role.STUDENT:
         raise PermissionDenied("Only students can view enrolled courses.")
-    return user.enrolled_courses.all()
\ No newline at end of file
+    return Course.objects.filter(students=user.pk)
+
+
+# Models carrying a denormalized course, top-down, with the FK the course is copied from.
+COURSE_CHAIN = (
+    (Homework, "lecture"),
+    (HomeworkSubmission, "homework"),
+    (Grade, "submission"),
+    (GradeComment, "grade"),
+)
+
+def sync_course_ids(root=None) -> int:
+    """
+    Re-derive the denormalized course of homeworks, submissions, grades and comments.
+    Limited to the objects below `root` (a lecture, homework, submission or grade),
+    or the whole tables when no root is given. Returns the number of rows updated.
+    """
+    lookup = None
+    updated = 0
+    for model, parent_field in COURSE_CHAIN:
+        parent = model._meta.get_field(parent_field).related_model
+        if lookup is not None:
+            lookup = f"{parent_field}__{lookup}"
+        elif root is not None and isinstance(root, parent):
+            lookup = parent_field
+        elif root is not None:
+            continue
+
+        rows = model.objects.all() if root is None else model.objects.filter(**{lookup: root})
+        parent_course = parent.objects.filter(pk=OuterRef(f"{parent_field}_id")).values("course_id")
+        updated += rows.exclude(course_id=F(f"{parent_field}__course_id")).update(
+            course_id=Subquery(parent_course[:1])
+        )
+    return updated
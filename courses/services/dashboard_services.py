@@ -0,0 +1,83 @@
+from collections import defaultdict
+
+from courses.cache import cached_student_data
+from courses.models import Course, Lecture, Homework, HomeworkSubmission
+from courses.services.access import get_course_membership
+
+DASHBOARD_ENDPOINT = "my-dashboard"
+
+
+def get_student_dashboard(student) -> tuple[dict, bool]:
+    """
+    Return `(dashboard, cache_hit)` for a student. The cache entry is reused until one of
+    the student's courses, lectures or homeworks changes, or their submissions and grades do.
+    """
+    course_ids = get_course_membership(student).enrolled
+    return cached_student_data(
+        DASHBOARD_ENDPOINT, student.pk, course_ids, lambda: build_student_dashboard(student, course_ids)
+    )
+
+
+def build_student_dashboard(student, course_ids) -> dict:
+    """
+    Every enrolled course with its lectures, their homeworks and the student's own
+    submission status and current grade. Four queries at most, stitched in memory.
+    """
+    if not course_ids:
+        return {"courses": []}
+
+    courses = Course.objects.filter(pk__in=course_ids).order_by("title", "id").values("id", "title", "description")
+    lectures = (
+        Lecture.objects.filter(course_id__in=course_ids)
+        .order_by("created_at", "id")
+        .values("id", "course_id", "topic", "created_at")
+    )
+    homeworks = (
+        Homework.objects.filter(course_id__in=course_ids)
+        .order_by("created_at", "id")
+        .values("id", "lecture_id", "description", "created_at")
+    )
+    submissions = {
+        row["homework_id"]: row
+        for row in HomeworkSubmission.objects.filter(student=student.pk, course_id__in=course_ids).values(
+            "id", "homework_id", "created_at", "current_grade_value", "current_grade__feedback"
+        )
+    }
+
+    homeworks_by_lecture = defaultdict(list)
+    for homework in homeworks:
+        lecture_id = homework.pop("lecture_id")
+        homeworks_by_lecture[lecture_id].append({**homework, **_submission_status(submissions.get(homework["id"]))})
+
+    lectures_by_course = defaultdict(list)
+    for lecture in lectures:
+        course_id = lecture.pop("course_id")
+        lectures_by_course[course_id].append({**lecture, "homeworks": homeworks_by_lecture[lecture["id"]]})
+
+    return {"courses": [_course_entry(course, lectures_by_course[course["id"]]) for course in courses]}
+
+
+def _submission_status(submission) -> dict:
+    if submission is None:
+        return {"status": "not_submitted", "submission": None}
+    graded = submission["current_grade_value"] is not None
+    return {
+        "status": "graded" if graded else "submitted",
+        "submission": {
+            "id": submission["id"],
+            "submitted_at": submission["created_at"],
+            "grade": submission["current_grade_value"],
+            "feedback": submission["current_grade__feedback"] if graded else None,
+        },
+    }
+
+
+def _course_entry(course, lectures) -> dict:
+    homeworks = [homework for lecture in lectures for homework in lecture["homeworks"]]
+    return {
+        **course,
+        "homework_count": len(homeworks),
+        "submitted_count": sum(homework["status"] != "not_submitted" for homework in homeworks),
+        "graded_count": sum(homework["status"] == "graded" for homework in homeworks),
+        "lectures": lectures,
+    }
@@ -0,0 +1,154 @@
+import random
+import uuid
+from dataclasses import asdict, dataclass
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from courses.models import (
+    Course,
+    Lecture,
+    Homework,
+    HomeworkSubmission,
+    Grade,
+    GradeComment,
+    User,
+    Role,
+)
+from courses.services.search_services import rebuild_search_index
+from courses.services.statistics_services import rebuild_grade_statistics
+
+DATASET_PASSWORD = "password123"
+
+
+# Defaults produce about 500 courses, 50k students, 2M submissions and 3M grades.
+@dataclass
+class DatasetSpec:
+    courses: int = 500
+    teachers: int = 1000
+    students: int = 50_000
+    teachers_per_course: int = 2
+    students_per_course: int = 400
+    lectures_per_course: int = 10
+    homeworks_per_lecture: int = 2
+    submission_rate: float = 0.5
+    grades_per_submission: float = 1.5
+    comment_rate: float = 0.05
+    batch_size: int = 5000
+
+    def scaled(self, factor: float) -> "DatasetSpec":
+        """Shrink or grow the population and course counts; per-course shape stays the same."""
+        spec = DatasetSpec(**asdict(self))
+        spec.courses = max(1, round(self.courses * factor))
+        spec.teachers = max(self.teachers_per_course, round(self.teachers * factor))
+        spec.students = max(1, round(self.students * factor))
+        spec.students_per_course = min(self.students_per_course, spec.students)
+        return spec
+
+
+def generate_dataset(spec: DatasetSpec, seed=None, progress=None) -> dict:
+    """
+    Insert a synthetic dataset with bulk_create and return the number of rows per model.
+
+    Denormalized columns (course, current grade) are filled in directly because
+    bulk_create skips save() and signals; grade statistics are rebuilt at the end.
+    Each course is written in its own transaction, so memory stays flat at any scale.
+    """
+    rng = random.Random(seed)
+    run = uuid.uuid4().hex[:8]
+    password = make_password(DATASET_PASSWORD)
+    counts = dict.fromkeys(("users", "courses", "lectures", "homeworks", "submissions", "grades", "comments"), 0)
+
+    teacher_ids = _create_users(spec.teachers, Role.TEACHER, f"t-{run}", password, spec.batch_size)
+    student_ids = _create_users(spec.students, Role.STUDENT, f"s-{run}", password, spec.batch_size)
+    counts["users"] = len(teacher_ids) + len(student_ids)
+
+    for index in range(spec.courses):
+        with transaction.atomic():
+            course_counts = _create_course(
+                spec, rng, index,
+                rng.sample(teacher_ids, min(spec.teachers_per_course, len(teacher_ids))),
+                rng.sample(student_ids, spec.students_per_course),
+            )
+        for key, value in course_counts.items():
+            counts[key] += value
+        if progress is not None:
+            progress(index + 1, counts)
+
+    rebuild_grade_statistics()
+    rebuild_search_index()
+    return counts
+
+
+def _create_users(total, role, prefix, password, batch_size):
+    users = [
+        User(username=f"{prefix}-{n}", email=f"{prefix}-{n}@example.com", role=role, password=password)
+        for n in range(total)
+    ]
+    User.objects.bulk_create(users, batch_size=batch_size)
+    return [user.pk for user in users]
+
+
+def _create_course(spec, rng, index, teacher_ids, student_ids):
+    course = Course.objects.create(title=f"Course {index}", description="Synthetic course")
+    Course.teachers.through.objects.bulk_create(
+        [Course.teachers.through(course_id=course.pk, user_id=pk) for pk in teacher_ids]
+    )
+    Course.students.through.objects.bulk_create(
+        [Course.students.through(course_id=course.pk, user_id=pk) for pk in student_ids],
+        batch_size=spec.batch_size,
+    )
+
+    lectures = [
+        Lecture(course=course, topic=f"Lecture {n} of course {index}")
+        for n in range(spec.lectures_per_course)
+    ]
+    homeworks = [
+        Homework(lecture=lecture, course=course, description=f"Homework {n}")
+        for lecture in lectures
+        for n in range(spec.homeworks_per_lecture)
+    ]
+
+    submissions, grades, comments = [], [], []
+    per_homework = round(len(student_ids) * spec.submission_rate)
+    for homework in homeworks:
+        for student_id in rng.sample(student_ids, per_homework):
+            submission = HomeworkSubmission(
+                homework=homework, course=course, student_id=student_id, content="Synthetic answer"
+            )
+            submissions.append(submission)
+            for _ in range(_grade_count(rng, spec.grades_per_submission)):
+                grade = Grade(
+                    submission=submission,
+                    course=course,
+                    teacher_id=rng.choice(teacher_ids),
+                    value=min(100, max(0, round(rng.gauss(75, 15)))),
+                )
+                grades.append(grade)
+                # Grades are inserted in list order, so the last one is the latest.
+                submission.current_grade = grade
+                submission.current_grade_value = grade.value
+                if rng.random() < spec.comment_rate:
+                    comments.append(
+                        GradeComment(grade=grade, course=course, author_id=student_id, content="Why this grade?")
+                    )
+
+    # Foreign keys are checked at commit, so submissions may point at grades inserted after them.
+    Lecture.objects.bulk_create(lectures, batch_size=spec.batch_size)
+    Homework.objects.bulk_create(homeworks, batch_size=spec.batch_size)
+    HomeworkSubmission.objects.bulk_create(submissions, batch_size=spec.batch_size)
+    Grade.objects.bulk_create(grades, batch_size=spec.batch_size)
+    GradeComment.objects.bulk_create(comments, batch_size=spec.batch_size)
+    return {
+        "courses": 1,
+        "lectures": len(lectures),
+        "homeworks": len(homeworks),
+        "submissions": len(submissions),
+        "grades": len(grades),
+        "comments": len(comments),
+    }
+
+
+def _grade_count(rng, mean):
+    """Grades for one submission, Binomial(3, mean / 3): averages `mean` and leaves some ungraded."""
+    return sum(rng.random() < mean / 3 for _ in range(3))
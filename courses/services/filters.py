@@ -1,21 +1,17 @@
 def filters_for_course(user):
-    return {"teachers": user}, {"students": user}
+    return {"teachers": user.pk}, {"students": user.pk}
 
 def filters_for_lecture(user):
-    return {"course__teachers": user}, {"course__students": user}
+    return {"course__teachers": user.pk}, {"course__students": user.pk}
 
 def filters_for_homework(user):
-    return {"lecture__course__teachers": user}, {"lecture__course__students": user}
+    return {"course__teachers": user.pk}, {"course__students": user.pk}
 
 def filters_for_submission(user):
-    return {"homework__lecture__course__teachers": user}, {"student": user}
+    return {"course__teachers": user.pk}, {"student": user.pk}
 
 def filters_for_grade(user):
-    return {"submission__homework__lecture__course__teachers": user}, {"submission__student": user}
+    return {"course__teachers": user.pk}, {"submission__student": user.pk}
 
 def filters_for_comment(user):
-    return {
-        "grade__submission__homework__lecture__course__teachers": user
-    }, {
-        "grade__submission__student": user
-    }
\ No newline at end of file
+    return {"course__teachers": user.pk}, {"grade__submission__student": user.pk}
\ No newline at end of file
@@ -1,6 +1,41 @@
-from courses.models import Grade, GradeComment, Role
+import uuid
+
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+
+from courses.cache import bump_student_cache_version
+from courses.models import Grade, GradeComment, HomeworkSubmission, Role
+from courses.services.access import is_course_teacher
+from courses.services.statistics_services import apply_grade_changes
 from rest_framework.exceptions import PermissionDenied, NotFound
 
+def refresh_current_grades(submission_ids=None, only_missing=False) -> int:
+    """
+    Point submissions at their latest grade in one UPDATE.
+    Limited to the given submissions (all when None); `only_missing` skips those that still have one.
+    """
+    latest = Grade.objects.filter(submission=OuterRef("pk")).order_by("-created_at", "-id")
+    submissions = HomeworkSubmission.objects.all()
+    if submission_ids is not None:
+        submissions = submissions.filter(pk__in=submission_ids)
+    if only_missing:
+        submissions = submissions.filter(current_grade__isnull=True)
+    return submissions.update(
+        current_grade=Subquery(latest.values("pk")[:1]),
+        current_grade_value=Subquery(latest.values("value")[:1]),
+        updated_at=timezone.now(),
+    )
+
+def record_current_grade(grade: Grade, created: bool):
+    """Keep the submission's current grade in step with a saved grade."""
+    submissions = HomeworkSubmission.objects.filter(pk=grade.submission_id)
+    if created:
+        submissions.update(current_grade=grade, current_grade_value=grade.value, updated_at=timezone.now())
+    else:
+        submissions.filter(current_grade=grade).update(current_grade_value=grade.value, updated_at=timezone.now())
+
+@transaction.atomic
 def create_grade(submission, teacher, value, feedback=""):
     """Create a grade, ensuring the teacher has permissions."""
     if teacher.role != Role.TEACHER:
@@ -10,6 +45,7 @@ def create_grade(submission, teacher, value, feedback=""):
     )
     return grade
 
+@transaction.atomic
 def update_grade(grade: Grade, teacher, value, feedback=""):
     """Update a grade, ensuring the teacher remains the same."""
     if teacher.role != Role.TEACHER:
@@ -19,6 +55,85 @@ def update_grade(grade: Grade, teacher, value, feedback=""):
     grade.save()
     return grade
 
+@transaction.atomic
+def delete_grade(grade: Grade):
+    """Delete a grade; the submission falls back to its previous grade."""
+    grade.delete()
+
+def _as_uuid(value):
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+def _resolve_row_submissions(homework, rows) -> dict:
+    """Map submission IDs and student IDs/usernames/emails of the rows to submissions, in one query."""
+    keys = {str(row.get("submission") or row.get("student") or "") for row in rows} - {""}
+    uuids = {value for value in map(_as_uuid, keys) if value is not None}
+    submissions = homework.submissions.filter(
+        Q(id__in=uuids) | Q(student_id__in=uuids) | Q(student__username__in=keys) | Q(student__email__in=keys)
+    ).select_related("student")
+
+    lookup = {}
+    for submission in submissions:
+        student = submission.student
+        lookup.setdefault(student.email, submission)
+        lookup[student.username] = submission
+        lookup[str(student.id)] = submission
+        lookup[str(submission.id)] = submission
+    return lookup
+
+def _validate_grade_row(row, lookup):
+    """Return (submission, value, feedback, errors) for one import row."""
+    errors = {}
+    key = row.get("submission") or row.get("student")
+    submission = lookup.get(str(key)) if key else None
+    if submission is None:
+        errors["submission"] = "No submission found for this homework." if key else "Submission or student is required."
+
+    try:
+        value = int(row.get("value"))
+    except (TypeError, ValueError):
+        value = None
+    if value is None or not 0 <= value <= 100:
+        errors["value"] = "Value must be an integer between 0 and 100."
+
+    feedback = row.get("feedback") or ""
+    return submission, value, str(feedback), errors
+
+def bulk_grade_submissions(homework, teacher, rows) -> dict:
+    """
+    Grade many submissions of a homework at once.
+    Each row names a `submission` ID or a `student` (ID, username or email), a `value`
+    and optional `feedback`. Invalid rows are reported without aborting the batch.
+    """
+    if not is_course_teacher(teacher, homework.course):
+        raise PermissionDenied("Only course teachers can assign grades.")
+
+    lookup = _resolve_row_submissions(homework, rows)
+    grades, created, errors = [], [], []
+    for index, row in enumerate(rows):
+        submission, value, feedback, row_errors = _validate_grade_row(row, lookup)
+        if row_errors:
+            errors.append({"row": index, "errors": row_errors})
+            continue
+        grade = Grade(
+            submission=submission, course_id=submission.course_id,
+            teacher=teacher, value=value, feedback=feedback,
+        )
+        grades.append(grade)
+        created.append({"row": index, "submission": submission.id, "grade": grade.id})
+
+    with transaction.atomic():
+        Grade.objects.bulk_create(grades)
+        refresh_current_grades({grade.submission_id for grade in grades})
+        apply_grade_changes(
+            (grade.submission.homework_id, grade.course_id, None, grade.value) for grade in grades
+        )
+    # bulk_create sends no signals; invalidate what the grade signals would have.
+    bump_student_cache_version(*{grade.submission.student_id for grade in grades})
+    return {"created": created, "errors": errors}
+
 def get_grade_comments(grade: Grade):
     """Return all comments for a given grade."""
     return grade.comments.select_related("author").all()
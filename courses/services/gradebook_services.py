@@ -0,0 +1,105 @@
+from array import array
+
+from django.db.models import OuterRef, Subquery
+from rest_framework.exceptions import PermissionDenied
+
+from courses.models import Course, HomeworkSubmission, Grade
+from courses.services.access import is_course_teacher
+
+# Export column name -> HomeworkSubmission lookup. Grades are LEFT JOINed, so an
+# ungraded submission yields one row with empty grade columns.
+GRADEBOOK_EXPORT_FIELDS = {
+    "student_id": "student_id",
+    "student": "student__username",
+    "email": "student__email",
+    "lecture": "homework__lecture__topic",
+    "homework_id": "homework_id",
+    "submission_id": "id",
+    "submitted_at": "created_at",
+    "grade": "grades__value",
+    "graded_at": "grades__created_at",
+    "graded_by": "grades__teacher__username",
+}
+
+
+def iter_gradebook_rows(course: Course, acting_user, chunk_size=2000):
+    """
+    Stream every submission of the course with each of its grades as plain tuples.
+    Reads a single values_list() query in chunks, so memory does not grow with the course.
+    """
+    if not is_course_teacher(acting_user, course):
+        raise PermissionDenied("Only course teachers can export the gradebook.")
+    rows = (
+        HomeworkSubmission.objects.filter(course=course)
+        .order_by("student__username", "homework__created_at", "grades__created_at")
+        .values_list(*GRADEBOOK_EXPORT_FIELDS.values())
+    )
+    return rows.iterator(chunk_size=chunk_size)
+
+
+class Gradebook:
+    """
+    Student x homework matrix of latest grades.
+    Each student row is a compact array("h") holding a grade 0-100, UNGRADED or NOT_SUBMITTED.
+    """
+
+    NOT_SUBMITTED = -2
+    UNGRADED = -1
+
+    def __init__(self, students, homeworks, column_offset=0, total_columns=None):
+        self.students = students
+        self.homeworks = homeworks
+        self.column_offset = column_offset
+        self.total_columns = len(homeworks) if total_columns is None else total_columns
+        self._rows = {student_id: index for index, (student_id, _) in enumerate(students)}
+        self._columns = {homework_id: index for index, (homework_id, _) in enumerate(homeworks)}
+        self.cells = [array("h", [self.NOT_SUBMITTED]) * len(homeworks) for _ in students]
+
+    def set(self, student_id, homework_id, value):
+        """Record a submission's latest grade, or UNGRADED when value is None."""
+        row = self._rows.get(student_id)
+        column = self._columns.get(homework_id)
+        if row is not None and column is not None:
+            self.cells[row][column] = self.UNGRADED if value is None else value
+
+    def as_dict(self) -> dict:
+        return {
+            "column_offset": self.column_offset,
+            "total_columns": self.total_columns,
+            "homeworks": [{"id": homework_id, "lecture": topic} for homework_id, topic in self.homeworks],
+            "students": [
+                {
+                    "id": student_id,
+                    "username": username,
+                    "grades": [cell if cell >= 0 else None for cell in cells],
+                    "submitted": [cell != self.NOT_SUBMITTED for cell in cells],
+                }
+                for (student_id, username), cells in zip(self.students, self.cells)
+            ],
+        }
+
+
+def build_gradebook(course: Course, acting_user, column_offset=0, column_limit=None) -> Gradebook:
+    """
+    Build the latest-grade matrix of a course, optionally for a slice of homework columns.
+    Cells come from one query annotating each submission with its latest grade.
+    """
+    if not is_course_teacher(acting_user, course):
+        raise PermissionDenied("Only course teachers can view the gradebook.")
+
+    homeworks = course.homeworks.order_by("lecture__created_at", "created_at", "id")
+    total_columns = homeworks.count()
+    end = None if column_limit is None else column_offset + column_limit
+    homeworks = list(homeworks.values_list("id", "lecture__topic")[column_offset:end])
+    students = list(course.students.order_by("username").values_list("id", "username"))
+    gradebook = Gradebook(students, homeworks, column_offset, total_columns)
+
+    latest_grade = Grade.objects.filter(submission=OuterRef("pk")).order_by("-created_at", "-id")
+    cells = (
+        HomeworkSubmission.objects.filter(course=course, homework_id__in=[hw_id for hw_id, _ in homeworks])
+        .annotate(latest_grade=Subquery(latest_grade.values("value")[:1]))
+        .values_list("student_id", "homework_id", "latest_grade")
+    )
+    for student_id, homework_id, value in cells.iterator(chunk_size=2000):
+        gradebook.set(student_id, homework_id, value)
+    return gradebook
@@ -1,20 +1,34 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
 from courses.models import Homework, HomeworkSubmission, Role
+from courses.services.access import is_course_teacher
 from rest_framework.exceptions import PermissionDenied
 
+GRADING_LEASE = timedelta(minutes=15)
+MAX_CLAIM_BATCH = 50
+
 def get_homeworks_for_user(user):
     """Return homeworks visible to the user."""
     if user.role == Role.TEACHER:
-        return Homework.objects.filter(lecture__course__teachers=user)
+        return Homework.objects.filter(course__teachers=user.pk)
     elif user.role == Role.STUDENT:
-        return Homework.objects.filter(lecture__course__students=user)
+        return Homework.objects.filter(course__students=user.pk)
     else:
         return Homework.objects.none()
 
-def get_homework_submissions(homework):
-    """Return all submissions for a homework."""
-    return homework.submissions.select_related(
-        "student", "homework__lecture__course"
-    ).prefetch_related("grades")
+def filter_graded(submissions, graded=None):
+    """Keep only graded (True) or ungraded (False) submissions; None keeps all."""
+    if graded is None:
+        return submissions
+    return submissions.filter(current_grade__isnull=not graded)
+
+def get_homework_submissions(homework, graded=None):
+    """Return submissions for a homework, optionally only graded or ungraded ones."""
+    return filter_graded(homework.submissions.all(), graded)
 
 def submit_homework(homework, student, data, serializer_class):
     """Create a new homework submission for a student."""
@@ -26,15 +40,16 @@ def submit_homework(homework, student, data, serializer_class):
 def get_submissions_for_user(user):
     """Return homework submissions visible to the user."""
     if user.role == Role.TEACHER:
-        return HomeworkSubmission.objects.filter(homework__lecture__course__teachers=user)
+        return HomeworkSubmission.objects.filter(course__teachers=user.pk)
     elif user.role == Role.STUDENT:
-        return HomeworkSubmission.objects.filter(student=user)
+        return HomeworkSubmission.objects.filter(student=user.pk)
     return HomeworkSubmission.objects.none()
 
 def get_submission_grades(submission):
     """Return all grades for a submission."""
     return submission.grades.select_related("teacher").prefetch_related("comments").all()
 
+@transaction.atomic
 def add_grade_to_submission(submission, teacher, data, serializer_class):
     """Create a new grade for a submission."""
     serializer = serializer_class(data=data)
@@ -42,7 +57,7 @@ def add_grade_to_submission(submission, teacher, data, serializer_class):
     grade = serializer.save(submission=submission, teacher=teacher)
     return grade
 
-def filter_submissions_for_user(user, homework_id=None, lecture_id=None, course_id=None):
+def filter_submissions_for_user(user, homework_id=None, lecture_id=None, course_id=None, graded=None):
     """Return submissions filtered by user role and optional IDs."""
     submissions = HomeworkSubmission.objects.for_user(user)
 
@@ -51,6 +66,29 @@ def filter_submissions_for_user(user, homework_id=None, lecture_id=None, course_
     if lecture_id:
         submissions = submissions.filter(homework__lecture_id=lecture_id)
     if course_id:
-        submissions = submissions.filter(homework__lecture__course_id=course_id)
+        submissions = submissions.filter(course_id=course_id)
+
+    return filter_graded(submissions, graded)
+
+def claim_ungraded_submissions(teacher, course, limit=10, homework=None):
+    """
+    Lease the next `limit` ungraded submissions of a course (or one homework), oldest first.
+    Submissions leased by another teacher are skipped until the lease expires, so
+    parallel graders never receive the same submission. Returns (submissions, expires_at).
+    """
+    if not is_course_teacher(teacher, course):
+        raise PermissionDenied("Only course teachers can grade submissions.")
+
+    limit = min(max(limit, 1), MAX_CLAIM_BATCH)
+    now = timezone.now()
+    expires_at = now + GRADING_LEASE
+    queue = HomeworkSubmission.objects.filter(course=course, current_grade__isnull=True)
+    if homework is not None:
+        queue = queue.filter(homework=homework)
+    available = Q(claim_expires_at__isnull=True) | Q(claim_expires_at__lte=now) | Q(claimed_by=teacher)
 
-    return submissions
\ No newline at end of file
+    candidates = list(queue.filter(available).order_by("created_at", "id").values_list("pk", flat=True)[:limit])
+    # The availability condition is re-checked in the UPDATE, so a concurrent claim wins cleanly.
+    queue.filter(available, pk__in=candidates).update(claimed_by=teacher, claim_expires_at=expires_at)
+    claimed = queue.filter(claimed_by=teacher, claim_expires_at=expires_at).order_by("created_at", "id")
+    return claimed, expires_at
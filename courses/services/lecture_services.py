@@ -1,12 +1,13 @@
 from rest_framework.exceptions import PermissionDenied
 
 from courses.models import Lecture, Homework
+from courses.services.access import is_course_teacher
 
 
 def get_lecture_representation(instance, request=None):
     rep = {
         "id": instance.id,
-        "course": instance.course.id,
+        "course": instance.course_id,
         "topic": instance.topic,
         "presentation": None,
         "created_at": instance.created_at,
@@ -19,12 +20,12 @@ def get_lecture_representation(instance, request=None):
 
 def get_lecture_homeworks(lecture: Lecture):
     """Return homeworks for a lecture with optimal prefetch/select."""
-    return lecture.homeworks.select_related("lecture__course").prefetch_related("submissions")
+    return lecture.homeworks.all()
 
 
 def create_homework_for_lecture(lecture: Lecture, user, homework_data: dict):
     """Create a homework for the lecture if the user is a teacher."""
-    if user not in lecture.course.teachers.all():
+    if not is_course_teacher(user, lecture.course):
         raise PermissionDenied("Only course teachers can add homework.")
 
     homework = Homework.objects.create(lecture=lecture, **homework_data)
@@ -0,0 +1,203 @@
+import re
+import uuid
+
+from django.core.exceptions import EmptyResultSet
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from courses.models import Lecture, Homework, HomeworkSubmission
+
+SEARCH_DOCUMENTS = "courses_search_document"
+SEARCH_INDEX = "courses_search_index"
+REBUILD_BATCH_SIZE = 1000
+
+# kind -> (model, indexed text field)
+SEARCHABLE = {
+    "lecture": (Lecture, "topic"),
+    "homework": (Homework, "description"),
+    "submission": (HomeworkSubmission, "content"),
+}
+KIND_BY_MODEL = {model: kind for kind, (model, _) in SEARCHABLE.items()}
+
+# Documents live in a plain table (unique on kind + object) that the FTS5 index
+# uses as external content; triggers keep the index in step with every write.
+SCHEMA = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {SEARCH_DOCUMENTS} (
+        id INTEGER PRIMARY KEY,
+        kind VARCHAR(16) NOT NULL,
+        object_id CHAR(32) NOT NULL,
+        body TEXT NOT NULL,
+        UNIQUE (kind, object_id)
+    )
+    """,
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX} USING fts5(
+        body, content='{SEARCH_DOCUMENTS}', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_DOCUMENTS}_ai AFTER INSERT ON {SEARCH_DOCUMENTS} BEGIN
+        INSERT INTO {SEARCH_INDEX} (rowid, body) VALUES (new.id, new.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_DOCUMENTS}_ad AFTER DELETE ON {SEARCH_DOCUMENTS} BEGIN
+        INSERT INTO {SEARCH_INDEX} ({SEARCH_INDEX}, rowid, body) VALUES ('delete', old.id, old.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_DOCUMENTS}_au AFTER UPDATE ON {SEARCH_DOCUMENTS} BEGIN
+        INSERT INTO {SEARCH_INDEX} ({SEARCH_INDEX}, rowid, body) VALUES ('delete', old.id, old.body);
+        INSERT INTO {SEARCH_INDEX} (rowid, body) VALUES (new.id, new.body);
+    END
+    """,
+]
+
+UPSERT = f"""
+    INSERT INTO {SEARCH_DOCUMENTS} (kind, object_id, body) VALUES (%s, %s, %s)
+    ON CONFLICT (kind, object_id) DO UPDATE SET body = excluded.body WHERE {SEARCH_DOCUMENTS}.body != excluded.body
+"""
+
+
+class SearchUnavailable(APIException):
+    status_code = status.HTTP_501_NOT_IMPLEMENTED
+    default_detail = "Full-text search requires SQLite with FTS5."
+    default_code = "search_unavailable"
+
+
+def search_supported(using=DEFAULT_DB_ALIAS) -> bool:
+    """The index is built on SQLite FTS5; other databases get no search index."""
+    return connections[using].vendor == "sqlite"
+
+
+def ensure_search_index(using=DEFAULT_DB_ALIAS):
+    """Create the search tables and triggers if they are missing. Runs after every migrate."""
+    if not search_supported(using):
+        return
+    with connections[using].cursor() as cursor:
+        for statement in SCHEMA:
+            cursor.execute(statement)
+
+
+def _document(instance):
+    kind = KIND_BY_MODEL[type(instance)]
+    return kind, instance.pk.hex, getattr(instance, SEARCHABLE[kind][1]) or ""
+
+
+def index_object(instance):
+    """Add or refresh the search document of a lecture, homework or submission."""
+    if search_supported():
+        with connection.cursor() as cursor:
+            cursor.execute(UPSERT, _document(instance))
+
+
+def unindex_object(instance):
+    if search_supported():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_DOCUMENTS} WHERE kind = %s AND object_id = %s",
+                [KIND_BY_MODEL[type(instance)], instance.pk.hex],
+            )
+
+
+def rebuild_search_index() -> int:
+    """
+    Re-index every searchable object, for data written without signals (bulk_create,
+    queryset updates) or a database created before the index existed.
+    """
+    ensure_search_index()
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_DOCUMENTS}")
+        for kind, (model, field) in SEARCHABLE.items():
+            rows = model.objects.order_by().values_list("pk", field).iterator(chunk_size=REBUILD_BATCH_SIZE)
+            batch = []
+            for pk, body in rows:
+                batch.append((kind, pk.hex, body or ""))
+                if len(batch) == REBUILD_BATCH_SIZE:
+                    cursor.executemany(UPSERT, batch)
+                    total += len(batch)
+                    batch = []
+            cursor.executemany(UPSERT, batch)
+            total += len(batch)
+    return total
+
+
+def match_expression(query: str) -> str:
+    """
+    Turn free text into an FTS5 query: every word must match, as a prefix.
+    Operators and quotes are dropped, so user input can never be a syntax error.
+    """
+    return " ".join(f'"{term}"*' for term in re.findall(r"\w+", query))
+
+
+class SearchResults:
+    """
+    Ranked matches visible to a user, evaluated lazily: slicing runs one
+    LIMIT/OFFSET query and `count()` one COUNT, so Django's paginator can page it.
+    """
+
+    def __init__(self, user, query, kinds=None):
+        if not search_supported():
+            raise SearchUnavailable()
+        self.match = match_expression(query)
+        self.where, self.params = self._visibility(user, kinds or list(SEARCHABLE))
+
+    @staticmethod
+    def _visibility(user, kinds):
+        """
+        Restrict documents to the objects `for_user` returns, so search follows the
+        same role rules as the list endpoints (filters_for_lecture and friends).
+        """
+        clauses, params = [], []
+        for kind in kinds:
+            model, _ = SEARCHABLE[kind]
+            try:
+                sql, sub_params = model.objects.for_user(user).order_by().values("pk").query.sql_with_params()
+            except EmptyResultSet:
+                continue
+            clauses.append(f"(d.kind = %s AND d.object_id IN ({sql}))")
+            params += [kind, *sub_params]
+        return " OR ".join(clauses), params
+
+    def _select(self, columns, suffix="", suffix_params=()):
+        sql = (
+            f"SELECT {columns} FROM {SEARCH_INDEX} "
+            f"JOIN {SEARCH_DOCUMENTS} d ON d.id = {SEARCH_INDEX}.rowid "
+            f"WHERE {SEARCH_INDEX} MATCH %s AND ({self.where}) {suffix}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.match, *self.params, *suffix_params])
+            return cursor.fetchall()
+
+    def count(self):
+        if not self.match or not self.where:
+            return 0
+        return self._select("COUNT(*)")[0][0]
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, page):
+        if not isinstance(page, slice) or page.step is not None:
+            raise TypeError("SearchResults only supports slicing.")
+        start, stop = page.start or 0, page.stop
+        if not self.match or not self.where or (stop is not None and stop <= start):
+            return []
+        rows = self._select(
+            f"d.kind, d.object_id, bm25({SEARCH_INDEX}), "
+            f"snippet({SEARCH_INDEX}, 0, '[', ']', '…', 16)",
+            "ORDER BY 3, d.id LIMIT %s OFFSET %s",
+            [-1 if stop is None else stop - start, start],
+        )
+        return [
+            {"kind": kind, "id": uuid.UUID(object_id), "rank": rank, "snippet": snippet}
+            for kind, object_id, rank, snippet in rows
+        ]
+
+
+def search(user, query, kinds=None) -> SearchResults:
+    """Full-text search over the lectures, homeworks and submissions the user can see, best match first."""
+    return SearchResults(user, query, kinds)
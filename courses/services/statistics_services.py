@@ -0,0 +1,99 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, QuerySet
+from rest_framework.exceptions import PermissionDenied
+
+from courses.models import Course, Lecture, Homework, HomeworkSubmission, Grade, HomeworkGradeStatistics, \
+    CourseGradeStatistics
+from courses.models.statistics import empty_histogram
+from courses.services.access import is_course_teacher
+
+
+def apply_grade_changes(changes):
+    """
+    Fold grade changes into the homework and course summaries.
+    `changes` yields (homework_id, course_id, old_value, new_value); None means no grade,
+    and a None homework or course leaves that summary alone.
+    Each summary row is locked and written once, however many changes touch it.
+    """
+    deltas = defaultdict(lambda: defaultdict(int))
+    for homework_id, course_id, old_value, new_value in changes:
+        for key in ((HomeworkGradeStatistics, homework_id), (CourseGradeStatistics, course_id)):
+            if key[1] is None:
+                continue
+            if old_value is not None:
+                deltas[key][old_value] -= 1
+            if new_value is not None:
+                deltas[key][new_value] += 1
+
+    with transaction.atomic():
+        for (model, pk), values in deltas.items():
+            stats, _ = model.objects.select_for_update().get_or_create(pk=pk)
+            for value, count in values.items():
+                if count:
+                    stats.add(value, count)
+            stats.save()
+
+
+def record_grade_saved(grade: Grade, created: bool):
+    """Update summaries after a grade is created or its value changes."""
+    old_value = None if created else getattr(grade, "_loaded_value", None)
+    if old_value != grade.value:
+        apply_grade_changes([(grade.submission.homework_id, grade.course_id, old_value, grade.value)])
+    grade._loaded_value = grade.value
+
+
+def record_grade_deleted(grade: Grade, origin=None):
+    """
+    Update summaries after a grade is deleted. `origin` is what the delete started
+    from (an instance or queryset); summaries of a homework or course that the same
+    cascade removes are left to it rather than decremented or recreated.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin or grade)
+    if origin_model is Course:
+        return
+    value = getattr(grade, "_loaded_value", grade.value)
+    if origin_model in (Lecture, Homework):
+        # Every homework above the grade goes with the cascade; only the course remains.
+        homework_id = None
+    elif isinstance(origin, HomeworkSubmission) and origin.pk == grade.submission_id:
+        homework_id = origin.homework_id
+    else:
+        homework_id = grade.submission.homework_id
+    apply_grade_changes([(homework_id, grade.course_id, value, None)])
+
+
+def rebuild_grade_statistics() -> int:
+    """Recompute every summary from the grade table. Returns the number of homework summaries."""
+    groups = (
+        Grade.objects.order_by()
+        .values("submission__homework_id", "course_id", "value")
+        .annotate(n=Count("id"))
+    )
+
+    homeworks, courses = {}, {}
+    for group in groups.iterator(chunk_size=2000):
+        for model, pk, summaries in (
+            (HomeworkGradeStatistics, group["submission__homework_id"], homeworks),
+            (CourseGradeStatistics, group["course_id"], courses),
+        ):
+            stats = summaries.get(pk)
+            if stats is None:
+                stats = summaries[pk] = model(pk=pk, histogram=empty_histogram())
+            stats.add(group["value"], group["n"])
+
+    with transaction.atomic():
+        HomeworkGradeStatistics.objects.all().delete()
+        CourseGradeStatistics.objects.all().delete()
+        HomeworkGradeStatistics.objects.bulk_create(homeworks.values(), batch_size=1000)
+        CourseGradeStatistics.objects.bulk_create(courses.values(), batch_size=1000)
+    return len(homeworks)
+
+
+def get_grade_statistics(model, pk, course, acting_user) -> dict:
+    """Return the summary of a homework or course, visible to its course teachers."""
+    if not is_course_teacher(acting_user, course):
+        raise PermissionDenied("Only course teachers can view grade statistics.")
+    stats = model.objects.filter(pk=pk).first() or model(pk=pk, histogram=empty_histogram())
+    return stats.as_dict()
@@ -1,6 +1,81 @@
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+
+from courses.tokens import CourseRefreshToken, blacklisted_jtis
+
+User = get_user_model()
+
+DEFAULT_TOKEN_VERSION_CACHE_TTL = 30
+
 
 def blacklist_refresh_token(refresh_token: str):
-    """Blacklist a refresh token."""
-    token = RefreshToken(refresh_token)
-    token.blacklist()
\ No newline at end of file
+    """
+    Blacklist a refresh token issued by this service, found through its unique `jti`.
+
+    Raises `TokenError` for a forged, expired or already blacklisted token and
+    `OutstandingToken.DoesNotExist` for one that was never issued here.
+    """
+    jti = CourseRefreshToken(refresh_token)[jwt_settings.JTI_CLAIM]
+    outstanding = OutstandingToken.objects.only("id").get(jti=jti)
+    BlacklistedToken.objects.get_or_create(token=outstanding)
+    blacklisted_jtis.add(jti)
+
+
+def compact_expired_tokens(batch_size=1000, now=None) -> tuple[int, int]:
+    """
+    Delete outstanding tokens that have expired, with their blacklist entries, in
+    batches of `batch_size` so no single transaction locks the tables for long.
+
+    Returns `(outstanding, blacklisted)` row counts.
+    """
+    now = now or timezone.now()
+    outstanding = blacklisted = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return outstanding, blacklisted
+            blacklisted += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            outstanding += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+
+
+def _token_version_key(user_id) -> str:
+    return f"token-version:{user_id}"
+
+
+def get_token_version(user_id):
+    """
+    Current token version of an active user, or None if the user is gone or inactive.
+
+    Cached for `TOKEN_VERSION_CACHE_TTL` seconds. A change is forgotten at once in the
+    process that made it; with a per-process cache, other workers pick it up when
+    their entry expires, so a revoked token lives at most that long anywhere.
+    """
+    key = _token_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = User.objects.filter(pk=user_id, is_active=True).values_list("token_version", flat=True).first()
+        if version is not None:
+            ttl = getattr(settings, "TOKEN_VERSION_CACHE_TTL", DEFAULT_TOKEN_VERSION_CACHE_TTL)
+            cache.set(key, version, timeout=ttl)
+    return version
+
+
+def forget_token_version(user_id):
+    cache.delete(_token_version_key(user_id))
+
+
+def revoke_user_tokens(user):
+    """Invalidate every access and refresh token issued to the user so far."""
+    User.objects.filter(pk=user.pk).update(token_version=F("token_version") + 1)
+    forget_token_version(user.pk)
@@ -0,0 +1,109 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed, post_migrate
+from django.dispatch import receiver
+
+from courses.authentication import verified_credentials
+from courses.cache import bump_course_cache_version, bump_student_cache_version
+from courses.models import Course, Lecture, Homework, HomeworkSubmission, Grade, User
+from courses.services.course_services import sync_course_ids, touch_courses
+from courses.services.grade_services import record_current_grade, refresh_current_grades
+from courses.services.search_services import ensure_search_index, index_object, unindex_object
+from courses.services.statistics_services import record_grade_saved, record_grade_deleted
+from courses.services.user_services import forget_token_version
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_save, sender=Homework)
+@receiver(post_save, sender=HomeworkSubmission)
+@receiver(post_save, sender=Grade)
+def propagate_course_move(sender, instance, created, **kwargs):
+    """Carry a course change down to the objects below the saved one."""
+    if not created and instance.course_moved:
+        sync_course_ids(root=instance)
+
+
+@receiver(post_save, sender=Grade)
+def update_current_grade_on_save(sender, instance, created, **kwargs):
+    record_current_grade(instance, created)
+
+
+@receiver(post_delete, sender=Grade)
+def update_current_grade_on_delete(sender, instance, **kwargs):
+    """The FK was nulled if this was the current grade; fall back to the previous one."""
+    refresh_current_grades([instance.submission_id], only_missing=True)
+
+
+@receiver(post_save, sender=Grade)
+def update_statistics_on_grade_save(sender, instance, created, **kwargs):
+    record_grade_saved(instance, created)
+
+
+@receiver(post_delete, sender=Grade)
+def update_statistics_on_grade_delete(sender, instance, origin=None, **kwargs):
+    record_grade_deleted(instance, origin)
+
+
+@receiver(m2m_changed, sender=Course.teachers.through)
+@receiver(m2m_changed, sender=Course.students.through)
+def touch_course_on_roster_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """A roster change alters the course representation, so bump its updated_at."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        touch_courses([instance.pk])
+    elif pk_set:
+        touch_courses(pk_set)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_responses(sender, instance, **kwargs):
+    bump_course_cache_version(instance.pk)
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_delete, sender=Lecture)
+@receiver(post_save, sender=Homework)
+@receiver(post_delete, sender=Homework)
+def invalidate_course_content_responses(sender, instance, **kwargs):
+    bump_course_cache_version(instance.course_id, getattr(instance, "previous_course_id", None))
+
+
+@receiver(post_save, sender=HomeworkSubmission)
+@receiver(post_delete, sender=HomeworkSubmission)
+def invalidate_student_submission_data(sender, instance, **kwargs):
+    bump_student_cache_version(instance.student_id)
+
+
+@receiver(post_save, sender=Grade)
+@receiver(post_delete, sender=Grade)
+def invalidate_student_grade_data(sender, instance, **kwargs):
+    bump_student_cache_version(instance.submission.student_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_token_version(sender, instance, **kwargs):
+    """Tokens and Basic-auth credentials are checked against the cached version; re-read it after any change."""
+    forget_token_version(instance.pk)
+    verified_credentials.forget_user(instance.pk)
+
+
+@receiver(post_migrate)
+def create_search_index(sender, using, **kwargs):
+    """The search tables are not models; create them once the app's tables exist."""
+    if sender.name == "courses":
+        ensure_search_index(using)
+
+
+@receiver(post_save, sender=Lecture)
+@receiver(post_save, sender=Homework)
+@receiver(post_save, sender=HomeworkSubmission)
+def update_search_index(sender, instance, **kwargs):
+    index_object(instance)
+
+
+@receiver(post_delete, sender=Lecture)
+@receiver(post_delete, sender=Homework)
+@receiver(post_delete, sender=HomeworkSubmission)
+def remove_from_search_index(sender, instance, **kwargs):
+    unindex_object(instance)
@@ -0,0 +1,36 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+# A spreadsheet runs a cell starting with one of these as a formula.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def escape_formula(value):
+    """Prefix text that a spreadsheet would evaluate with `'`, so it opens as plain text."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def stream_csv(columns, rows):
+    """Yield a CSV header and one line per row tuple, with formula-like text escaped."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow([escape_formula(column) for column in columns])
+    for row in rows:
+        yield writer.writerow([escape_formula(value) for value in row])
+
+
+def stream_jsonl(columns, rows):
+    """Yield one JSON object per row tuple, newline-delimited."""
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder) + "\n"
@@ -0,0 +1,39 @@
+"""
+Maximum queries per endpoint, enforced by test_query_budgets against seeded data
+of several sizes. A list endpoint must also run the same number of queries at
+every size: a budget is a ceiling, not permission to grow with N.
+"""
+
+QUERY_BUDGETS = {
+    "course-list": 4,
+    "course-detail": 3,
+    "course-lectures": 3,
+    "course-manage-teachers": 2,
+    "course-manage-students": 2,
+    "course-gradebook": 6,
+    "course-stats": 3,
+    "lecture-list": 2,
+    "lecture-detail": 1,
+    "lecture-homeworks": 3,
+    "homework-list": 2,
+    "homework-detail": 1,
+    "homework-submissions": 5,
+    "homework-stats": 4,
+    "submission-list": 2,
+    "submission-detail": 1,
+    "submission-grades": 3,
+    "grade-list": 2,
+    "grade-detail": 3,
+    "grade-comments": 4,
+    "grade-comment-list": 2,
+    "my-teaching-courses": 4,
+    "my-enrolled-courses-list": 4,
+    "my-submissions": 2,
+    "my-dashboard": 5,
+    "user-list": 1,
+    "async-course-list": 3,
+    "async-lecture-list": 1,
+    "async-homework-list": 1,
+    "async-grade-list": 1,
+    "async-my-submissions": 1,
+}
@@ -0,0 +1,101 @@
+import pytest
+from django.urls import reverse
+
+from courses.models import Grade, GradeComment
+from courses.models.roles import Role
+from courses.services.access import (
+    ObjectAccess,
+    course_membership_scope,
+    is_course_student,
+    is_course_teacher,
+    with_access_relations,
+)
+from courses.services.course_services import add_user_to_course, remove_user_from_course
+from courses.tests.factories import (
+    CourseFactory,
+    GradeFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    LectureFactory,
+    StudentFactory,
+    TeacherFactory,
+)
+
+
+@pytest.mark.django_db
+def test_membership_is_loaded_once_per_scope(django_assert_num_queries):
+    teacher = TeacherFactory()
+    courses = CourseFactory.create_batch(3, teachers=[teacher])
+    other = CourseFactory()
+
+    with course_membership_scope():
+        with django_assert_num_queries(1):
+            for course in courses:
+                assert is_course_teacher(teacher, course)
+            assert not is_course_teacher(teacher, other)
+
+
+@pytest.mark.django_db
+def test_membership_is_invalidated_on_enrollment_change():
+    teacher = TeacherFactory()
+    student = StudentFactory()
+    course = CourseFactory(teachers=[teacher])
+
+    with course_membership_scope():
+        assert not is_course_student(student, course)
+        add_user_to_course(course, student, Role.STUDENT, teacher)
+        assert is_course_student(student, course)
+        remove_user_from_course(course, student, Role.STUDENT, teacher)
+        assert not is_course_student(student, course)
+
+
+@pytest.fixture
+def comment(db):
+    teacher = TeacherFactory()
+    student = StudentFactory()
+    course = CourseFactory(teachers=[teacher], students=[student])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    grade = GradeFactory(submission=HomeworkSubmissionFactory(homework=homework, student=student), teacher=teacher)
+    return GradeComment.objects.create(grade=grade, author=student, content="Why?")
+
+
+@pytest.mark.django_db
+def test_object_access_resolves_role_without_walking_relations(comment, django_assert_num_queries):
+    teacher = comment.course.teachers.get()
+    student = comment.author
+    comment = GradeComment.objects.get(pk=comment.pk)
+
+    with course_membership_scope():
+        with django_assert_num_queries(1):  # the teacher's membership
+            assert ObjectAccess(teacher, comment).role == Role.TEACHER
+        with django_assert_num_queries(2):  # the student's membership, then the comment's owner
+            access = ObjectAccess(student, comment)
+            assert access.is_course_student
+            assert access.is_owner
+        with django_assert_num_queries(0):
+            assert ObjectAccess(student, comment).is_owner
+            assert ObjectAccess(teacher, comment).is_course_teacher
+        assert ObjectAccess(StudentFactory(), comment).role is None
+
+
+@pytest.mark.django_db
+def test_select_related_chain_answers_ownership_from_memory(comment, django_assert_num_queries):
+    student = comment.author
+    grade = with_access_relations(Grade.objects.all()).get(pk=comment.grade_id)
+    comment = with_access_relations(GradeComment.objects.all()).get(pk=comment.pk)
+
+    with django_assert_num_queries(0):
+        assert ObjectAccess(student, grade).is_owner
+        assert ObjectAccess(student, comment).is_owner
+        assert not ObjectAccess(TeacherFactory.build(), comment).is_owner
+
+
+@pytest.mark.django_db
+def test_comment_detail_checks_permissions_without_extra_queries(api_client, comment, django_assert_num_queries):
+    api_client.force_authenticate(user=comment.author)
+    with django_assert_num_queries(1):  # the comment, joined to its grade and submission
+        resp = api_client.get(reverse("grade-comment-detail", args=[comment.pk]))
+    assert resp.status_code == 200
+
+    api_client.force_authenticate(user=StudentFactory())
+    assert api_client.get(reverse("grade-comment-detail", args=[comment.pk])).status_code == 404
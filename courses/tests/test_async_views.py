@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from courses.tests.factories import (
+    CourseFactory,
+    GradeFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    LectureFactory,
+    StudentFactory,
+    TeacherFactory,
+)
+
+
+@pytest.fixture
+def graded_course(db):
+    teacher = TeacherFactory()
+    student, other = StudentFactory.create_batch(2)
+    course = CourseFactory(teachers=[teacher], students=[student, other])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    grade = GradeFactory(submission=HomeworkSubmissionFactory(homework=homework, student=student), teacher=teacher)
+    GradeFactory(submission=HomeworkSubmissionFactory(homework=homework, student=other), teacher=teacher)
+    return {"teacher": teacher, "student": student, "course": course, "homework": homework, "grade": grade}
+
+
+# async route -> (matching DRF route, seeded object passed as the URL argument)
+MIRRORS = {
+    "async-course-list": ("course-list", None),
+    "async-course-detail": ("course-detail", "course"),
+    "async-lecture-list": ("lecture-list", None),
+    "async-homework-list": ("homework-list", None),
+    "async-homework-detail": ("homework-detail", "homework"),
+    "async-grade-list": ("grade-list", None),
+    "async-grade-detail": ("grade-detail", "grade"),
+    "async-my-submissions": ("my-submissions", None),
+}
+
+
+@pytest.mark.parametrize("role", ["teacher", "student"])
+@pytest.mark.parametrize("async_name", sorted(MIRRORS))
+def test_async_endpoint_matches_drf_endpoint(api_client, graded_course, async_name, role):
+    sync_name, object_key = MIRRORS[async_name]
+    args = [graded_course[object_key].pk] if object_key else []
+    api_client.force_authenticate(user=graded_course[role])
+
+    expected = api_client.get(reverse(sync_name, args=args))
+    resp = api_client.get(reverse(async_name, args=args))
+
+    assert resp.status_code == expected.status_code
+    assert resp.json() == json.loads(expected.content)
+
+
+def test_async_views_hide_other_students_objects(api_client, graded_course):
+    outsider = StudentFactory()
+    api_client.force_authenticate(user=outsider)
+
+    assert api_client.get(reverse("async-grade-detail", args=[graded_course["grade"].pk])).status_code == 404
+    assert api_client.get(reverse("async-course-list")).json()["results"] == []
+
+
+def test_async_views_paginate_and_filter(api_client, graded_course):
+    api_client.force_authenticate(user=graded_course["teacher"])
+
+    first = api_client.get(reverse("async-grade-list"), {"page_size": 1}).json()
+    assert len(first["results"]) == 1
+    second = api_client.get(first["next"]).json()
+    assert len(second["results"]) == 1
+    assert first["results"][0]["id"] != second["results"][0]["id"]
+
+    api_client.force_authenticate(user=graded_course["student"])
+    assert api_client.get(reverse("async-my-submissions"), {"graded": "false"}).json()["results"] == []
+
+
+def test_anonymous_request_is_rejected(api_client, db):
+    resp = api_client.get(reverse("async-my-submissions"))
+    assert resp.status_code == 401
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_view_runs_under_asgi():
+    teacher = TeacherFactory()
+    CourseFactory.create_batch(2, teachers=[teacher])
+    token = RefreshToken.for_user(teacher).access_token
+
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = async_to_sync(AsyncClient().get)(reverse("async-course-list"), headers=headers)
+
+    assert resp.status_code == 200
+    assert len(resp.json()["results"]) == 2
+    assert resp.query_stats.count > 0
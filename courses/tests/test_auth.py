@@ -1,5 +1,35 @@
+import base64
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import jwt
 import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from courses.authentication import (
+    TOKEN_ROLE_CLAIM,
+    TOKEN_VERSION_CLAIM,
+    ClaimsJWTAuthentication,
+    VerifiedCredentialCache,
+    verified_credentials,
+)
+from courses.services.user_services import blacklist_refresh_token, revoke_user_tokens
+from courses.tests.factories import CourseFactory
+from courses.tokens import CourseRefreshToken, blacklisted_jtis
+
+User = get_user_model()
 
 
 @pytest.mark.django_db
@@ -30,3 +60,268 @@ def test_login(api_client, teacher):
     assert resp.status_code == 200
     assert "access" in resp.data
     assert "refresh" in resp.data
+
+
+def _login(api_client, user):
+    resp = api_client.post(
+        reverse("token_obtain_pair"),
+        {"username": user.username, "password": "password123"},
+        format="json",
+    )
+    assert resp.status_code == 200
+    return resp.data
+
+
+@pytest.mark.django_db
+def test_access_token_carries_role_and_version(api_client, teacher):
+    access = AccessToken(_login(api_client, teacher)["access"])
+    assert access[TOKEN_ROLE_CLAIM] == "teacher"
+    assert access[TOKEN_VERSION_CLAIM] == 0
+
+
+@pytest.mark.django_db
+def test_token_user_is_built_from_claims(api_client, teacher, django_assert_num_queries):
+    access = AccessToken(_login(api_client, teacher)["access"])
+    authentication = ClaimsJWTAuthentication()
+    authentication.get_user(access)  # caches the token version
+
+    with django_assert_num_queries(0):
+        user = authentication.get_user(access)
+        assert user.pk == teacher.pk
+        assert user.role == "teacher"
+        assert user.is_authenticated
+
+    with django_assert_num_queries(1):
+        assert user.username == teacher.username
+        assert user == teacher
+
+
+@pytest.mark.django_db
+def test_requests_with_claims_token_skip_user_lookup(api_client, teacher):
+    CourseFactory(teachers=[teacher])
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {_login(api_client, teacher)['access']}")
+
+    api_client.get(reverse("user-me"))  # caches the token version
+    with CaptureQueriesContext(connection) as queries:
+        resp = api_client.get(reverse("course-list"), {"compact": "true"})
+
+    assert resp.status_code == 200
+    assert len(resp.data["results"]) == 1
+    assert not any(f'FROM "{User._meta.db_table}"' in query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_revoking_tokens_rejects_access_and_refresh(api_client, teacher):
+    tokens = _login(api_client, teacher)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+    assert api_client.get(reverse("user-me")).status_code == 200
+
+    revoke_user_tokens(teacher)
+
+    assert api_client.get(reverse("user-me")).status_code == 401
+    resp = api_client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json")
+    assert resp.status_code == 401
+
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {_login(api_client, teacher)['access']}")
+    assert api_client.get(reverse("user-me")).status_code == 200
+
+
+@pytest.mark.django_db
+def test_refresh_with_forged_signature_is_rejected_before_version_lookup(api_client, teacher):
+    claims = CourseRefreshToken(_login(api_client, teacher)["refresh"]).payload
+    forged = jwt.encode(claims, "not-the-signing-key", algorithm="HS256")
+
+    with mock.patch("courses.authentication.get_token_version") as version_lookup:
+        resp = api_client.post(reverse("token_refresh"), {"refresh": forged}, format="json")
+
+    assert resp.status_code == 401
+    version_lookup.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_refresh_verifies_the_token_once(api_client, teacher, django_assert_num_queries):
+    refresh = _login(api_client, teacher)["refresh"]
+    assert api_client.post(reverse("token_refresh"), {"refresh": refresh}, format="json").status_code == 200
+
+    # Token version cached: only the blacklist lookup is left.
+    with django_assert_num_queries(1):
+        resp = api_client.post(reverse("token_refresh"), {"refresh": refresh}, format="json")
+    assert resp.status_code == 200
+    assert AccessToken(resp.data["access"])[TOKEN_VERSION_CLAIM] == teacher.token_version
+
+
+@pytest.mark.django_db
+def test_deactivated_user_cannot_refresh(api_client, teacher):
+    refresh = _login(api_client, teacher)["refresh"]
+    teacher.is_active = False
+    teacher.save()
+
+    assert api_client.post(reverse("token_refresh"), {"refresh": refresh}, format="json").status_code == 401
+
+
+def _revoke_in_another_worker(user):
+    """Bump the version the way another process would: nothing is forgotten in this one."""
+    User.objects.filter(pk=user.pk).update(token_version=F("token_version") + 1)
+
+
+def _after_token_version_ttl():
+    later = time.time() + settings.TOKEN_VERSION_CACHE_TTL + 1
+    return mock.patch("django.core.cache.backends.locmem.time.time", return_value=later)
+
+
+@pytest.mark.django_db
+def test_revocation_elsewhere_takes_effect_within_the_cache_ttl(api_client, teacher):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {_login(api_client, teacher)['access']}")
+    assert api_client.get(reverse("user-me")).status_code == 200
+
+    _revoke_in_another_worker(teacher)
+
+    with _after_token_version_ttl():
+        assert api_client.get(reverse("user-me")).status_code == 401
+
+
+@pytest.mark.django_db
+def test_role_change_revokes_tokens(api_client, teacher):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {_login(api_client, teacher)['access']}")
+    assert api_client.get(reverse("user-me")).status_code == 200
+
+    user = User.objects.get(pk=teacher.pk)
+    user.role = "student"
+    user.save()
+
+    assert api_client.get(reverse("user-me")).status_code == 401
+
+
+@pytest.mark.django_db
+def test_token_without_claims_falls_back_to_database(api_client, teacher):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(teacher)}")
+    resp = api_client.get(reverse("user-me"))
+    assert resp.status_code == 200
+    assert resp.data["username"] == teacher.username
+
+
+def _basic(username, password="password123"):
+    return "Basic " + base64.b64encode(f"{username}:{password}".encode()).decode()
+
+
+@pytest.fixture
+def password_checks():
+    verified_credentials.clear()
+    with mock.patch.object(User, "check_password", autospec=True, side_effect=User.check_password) as check:
+        yield check
+    verified_credentials.clear()
+
+
+@pytest.mark.django_db
+def test_basic_auth_verifies_password_once(api_client, teacher, password_checks):
+    api_client.credentials(HTTP_AUTHORIZATION=_basic(teacher.username))
+
+    for _ in range(3):
+        resp = api_client.get(reverse("user-me"))
+        assert resp.status_code == 200
+        assert resp.data["username"] == teacher.username
+
+    assert password_checks.call_count == 1
+
+
+@pytest.mark.django_db
+def test_basic_auth_wrong_password_is_never_cached(api_client, teacher, password_checks):
+    api_client.credentials(HTTP_AUTHORIZATION=_basic(teacher.username, "wrong"))
+
+    assert api_client.get(reverse("user-me")).status_code == 401
+    assert api_client.get(reverse("user-me")).status_code == 401
+    assert password_checks.call_count == 2
+    assert len(verified_credentials) == 0
+
+
+@pytest.mark.django_db
+def test_password_change_invalidates_cached_basic_credentials(api_client, teacher, password_checks):
+    api_client.credentials(HTTP_AUTHORIZATION=_basic(teacher.username))
+    assert api_client.get(reverse("user-me")).status_code == 200
+
+    user = User.objects.get(pk=teacher.pk)
+    user.set_password("new-password")
+    user.save()
+
+    assert api_client.get(reverse("user-me")).status_code == 401
+    api_client.credentials(HTTP_AUTHORIZATION=_basic(teacher.username, "new-password"))
+    assert api_client.get(reverse("user-me")).status_code == 200
+
+
+@pytest.mark.django_db
+def test_version_bump_elsewhere_invalidates_cached_basic_credentials(api_client, teacher, password_checks):
+    api_client.credentials(HTTP_AUTHORIZATION=_basic(teacher.username))
+    api_client.get(reverse("user-me"))
+
+    _revoke_in_another_worker(teacher)
+
+    with _after_token_version_ttl():
+        assert api_client.get(reverse("user-me")).status_code == 200
+    assert password_checks.call_count == 2
+
+
+def test_verified_credential_cache_is_bounded_and_expires(teacher, student):
+    cache = VerifiedCredentialCache(ttl=60, max_size=1)
+    cache.add(teacher.username, "password123", teacher)
+    cache.add(student.username, "password123", student)
+    assert cache.get(teacher.username, "password123") is None
+    assert cache.get(student.username, "password123").user_id == student.pk
+    assert cache.get(student.username, "other") is None
+
+    expired = VerifiedCredentialCache(ttl=0, max_size=1)
+    expired.add(teacher.username, "password123", teacher)
+    assert expired.get(teacher.username, "password123") is None
+
+
+@pytest.fixture
+def jti_cache():
+    blacklisted_jtis.clear()
+    yield blacklisted_jtis
+    blacklisted_jtis.clear()
+
+
+@pytest.mark.django_db
+def test_logout_blacklists_refresh_token(api_client, teacher, jti_cache):
+    tokens = _login(api_client, teacher)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+    assert api_client.post(reverse("logout-list"), {"refresh": tokens["refresh"]}, format="json").status_code == 205
+    assert BlacklistedToken.objects.count() == 1
+
+    resp = api_client.post(reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json")
+    assert resp.status_code == 401
+    assert api_client.post(reverse("logout-list"), {"refresh": tokens["refresh"]}, format="json").status_code == 400
+    assert api_client.post(reverse("logout-list"), {"refresh": "garbage"}, format="json").status_code == 400
+
+
+@pytest.mark.django_db
+def test_blacklist_check_is_served_from_memory(api_client, teacher, jti_cache, django_assert_num_queries):
+    refresh = _login(api_client, teacher)["refresh"]
+    blacklist_refresh_token(refresh)
+
+    with django_assert_num_queries(0):
+        with pytest.raises(TokenError):
+            CourseRefreshToken(refresh)
+
+    jti_cache.clear()
+    with django_assert_num_queries(1):
+        with pytest.raises(TokenError):
+            CourseRefreshToken(refresh)
+    assert len(jti_cache) == 1
+
+
+@pytest.mark.django_db
+def test_compact_tokens_deletes_expired_rows_in_batches(api_client, teacher, jti_cache):
+    for _ in range(3):
+        blacklist_refresh_token(_login(api_client, teacher)["refresh"])
+    live = _login(api_client, teacher)["refresh"]
+    OutstandingToken.objects.exclude(jti=CourseRefreshToken(live)["jti"]).update(
+        expires_at=timezone.now() - timedelta(minutes=1)
+    )
+
+    out = StringIO()
+    call_command("compact_tokens", batch_size=2, stdout=out)
+
+    assert "Deleted 3 outstanding and 3 blacklisted tokens." in out.getvalue()
+    assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [CourseRefreshToken(live)["jti"]]
+    assert BlacklistedToken.objects.count() == 0
@@ -0,0 +1,57 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import F
+
+from courses.models import Course, Grade, HomeworkSubmission, HomeworkGradeStatistics, User
+from courses.services.dataset_services import DatasetSpec, generate_dataset
+
+SMALL = DatasetSpec(
+    courses=2, teachers=3, students=12, students_per_course=8,
+    lectures_per_course=2, homeworks_per_lecture=2, comment_rate=0.5,
+)
+
+
+@pytest.mark.django_db
+def test_generated_dataset_is_consistent():
+    counts = generate_dataset(SMALL, seed=1)
+
+    assert counts["courses"] == Course.objects.count() == 2
+    assert counts["users"] == User.objects.count() == 15
+    assert counts["submissions"] == HomeworkSubmission.objects.count() == 2 * 4 * 4
+    assert counts["grades"] == Grade.objects.count()
+    assert not HomeworkSubmission.objects.exclude(course=F("homework__course")).exists()
+    assert not Grade.objects.exclude(course=F("submission__course")).exists()
+
+    for submission in HomeworkSubmission.objects.prefetch_related("grades"):
+        grades = sorted(submission.grades.all(), key=lambda grade: (grade.created_at, grade.pk))
+        latest = grades[-1] if grades else None
+        assert submission.current_grade_id == (latest.pk if latest else None)
+    assert HomeworkGradeStatistics.objects.exists()
+
+
+@pytest.mark.django_db
+def test_scaled_spec_keeps_course_shape():
+    spec = DatasetSpec().scaled(0.01)
+    assert (spec.courses, spec.teachers, spec.students) == (5, 10, 500)
+    assert spec.students_per_course == 400
+
+
+@pytest.mark.django_db
+def test_benchmark_command_writes_json(tmp_path):
+    generate_dataset(SMALL, seed=2)
+    output = tmp_path / "bench.json"
+
+    call_command("run_benchmarks", iterations=2, output=str(output), stdout=StringIO())
+
+    report = json.loads(output.read_text())
+    assert report["dataset"]["course"] == 2
+    endpoints = {row["endpoint"] for row in report["results"]}
+    assert {"course-list", "lecture-homeworks", "submission-grades", "my-submissions"} <= endpoints
+    assert {row["role"] for row in report["results"]} == {"teacher", "student"}
+    for row in report["results"]:
+        assert row["status"] < 500, row
+        assert row["p50_ms"] <= row["p95_ms"]
+        assert row["queries"] is not None
@@ -0,0 +1,67 @@
+import pytest
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+
+from courses.tests.factories import CourseFactory, HomeworkFactory, LectureFactory, StudentFactory
+
+
+@pytest.mark.django_db
+def test_list_returns_304_until_data_changes(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    lecture = LectureFactory(course=course)
+    api_client.force_authenticate(user=teacher)
+    url = reverse("lecture-list")
+
+    first = api_client.get(url)
+    assert first.status_code == status.HTTP_200_OK
+    etag = first["ETag"]
+
+    cached = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached["ETag"] == etag
+
+    lecture.topic = "Renamed"
+    lecture.save()
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_list_ignores_if_modified_since_after_a_delete(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    oldest, newest = LectureFactory(course=course), LectureFactory(course=course)
+    api_client.force_authenticate(user=teacher)
+    url = reverse("lecture-list")
+
+    first = api_client.get(url)
+    assert "Last-Modified" not in first
+    oldest.delete()
+    resp = api_client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(newest.updated_at.timestamp() + 60))
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert [row["id"] for row in resp.data["results"]] == [newest.id]
+
+
+@pytest.mark.django_db
+def test_retrieve_honours_if_none_match(api_client, teacher):
+    homework = HomeworkFactory(lecture=LectureFactory(course=CourseFactory(teachers=[teacher])))
+    api_client.force_authenticate(user=teacher)
+    url = reverse("homework-detail", args=[homework.id])
+
+    first = api_client.get(url)
+    assert "Last-Modified" in first
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_roster_change_invalidates_course_etag(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    api_client.force_authenticate(user=teacher)
+    url = reverse("course-detail", args=[course.id])
+
+    etag = api_client.get(url)["ETag"]
+    course.students.add(StudentFactory())
+    resp = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(resp.data["students"]) == 1
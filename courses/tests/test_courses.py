@@ -1,4 +1,23 @@
+import csv
+import io
+import json
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from courses.models import Homework, HomeworkSubmission, Grade, GradeComment
+from courses.services.course_services import sync_course_ids
+from courses.tests.factories import (
+    CourseFactory,
+    GradeFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    LectureFactory,
+    StudentFactory,
+    TeacherFactory,
+)
 
 
 @pytest.mark.django_db
@@ -22,3 +41,186 @@ def test_student_cannot_create_course(api_client, student):
         format="json",
     )
     assert resp.status_code == 403
+
+
+@pytest.mark.django_db
+def test_moving_lecture_moves_downstream_course():
+    grade = GradeFactory()
+    comment = GradeComment.objects.create(grade=grade, author=grade.teacher, content="ok")
+    lecture = grade.submission.homework.lecture
+    assert comment.course_id == lecture.course_id
+
+    new_course = CourseFactory()
+    lecture.course = new_course
+    lecture.save()
+
+    for model in (Homework, HomeworkSubmission, Grade, GradeComment):
+        assert set(model.objects.values_list("course_id", flat=True)) == {new_course.id}
+
+
+@pytest.mark.django_db
+def test_sync_course_ids_repairs_stale_rows():
+    grade = GradeFactory()
+    other = CourseFactory()
+    Grade.objects.update(course=other)
+    HomeworkSubmission.objects.update(course=other)
+
+    assert sync_course_ids() == 2
+    grade.refresh_from_db()
+    assert grade.course_id == grade.submission.homework.lecture.course_id
+
+
+@pytest.mark.django_db
+def test_teacher_can_bulk_enroll_students(api_client, teacher):
+    enrolled = StudentFactory()
+    course = CourseFactory(teachers=[teacher], students=[enrolled])
+    by_id, by_username, by_email = StudentFactory.create_batch(3)
+    other_teacher = TeacherFactory()
+    api_client.force_authenticate(user=teacher)
+
+    resp = api_client.post(
+        reverse("course-bulk-students", args=[course.id]),
+        {"users": [str(by_id.id), by_username.username, by_email.email,
+                   enrolled.username, other_teacher.username, "nobody"]},
+        format="json",
+    )
+
+    assert resp.status_code == 200
+    assert [row["status"] for row in resp.data["results"]] == [
+        "added", "added", "added", "already_member", "wrong_role", "not_found",
+    ]
+    assert set(course.students.all()) == {enrolled, by_id, by_username, by_email}
+
+
+@pytest.mark.django_db
+def test_student_cannot_bulk_enroll(api_client, student):
+    course = CourseFactory(students=[student])
+    api_client.force_authenticate(user=student)
+
+    resp = api_client.post(
+        reverse("course-bulk-students", args=[course.id]), {"users": ["someone"]}, format="json"
+    )
+
+    assert resp.status_code == 403
+
+
+@pytest.mark.django_db
+def test_teacher_can_export_gradebook(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    graded = GradeFactory(submission__homework=homework, teacher=teacher, value=80)
+    HomeworkSubmissionFactory(homework=homework)
+    api_client.force_authenticate(user=teacher)
+    url = reverse("course-export-gradebook", args=[course.id])
+
+    resp = api_client.get(url)
+    rows = list(csv.DictReader(io.StringIO(b"".join(resp.streaming_content).decode())))
+    assert resp["Content-Type"] == "text/csv"
+    assert len(rows) == 2
+    assert {row["grade"] for row in rows} == {"80", ""}
+
+    resp = api_client.get(url + "?output=jsonl")
+    lines = [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()]
+    assert {line["submission_id"] for line in lines} >= {str(graded.submission.id)}
+
+
+@pytest.mark.django_db
+def test_gradebook_csv_escapes_formulas(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    student = StudentFactory(username='=HYPERLINK("http://evil.example","x")', email="-2+3@example.com")
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    GradeFactory(submission__homework=homework, submission__student=student, teacher=teacher, value=70)
+    api_client.force_authenticate(user=teacher)
+    url = reverse("course-export-gradebook", args=[course.id])
+
+    resp = api_client.get(url)
+    (row,) = csv.DictReader(io.StringIO(b"".join(resp.streaming_content).decode()))
+    assert row["student"] == "'" + student.username
+    assert row["email"] == "'-2+3@example.com"
+    assert row["grade"] == "70"
+
+    resp = api_client.get(url + "?output=jsonl")
+    (line,) = [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()]
+    assert line["student"] == student.username
+
+
+@pytest.mark.django_db
+def test_student_cannot_export_gradebook(api_client, student):
+    course = CourseFactory(students=[student])
+    api_client.force_authenticate(user=student)
+    resp = api_client.get(reverse("course-export-gradebook", args=[course.id]))
+    assert resp.status_code == 403
+
+
+@pytest.mark.django_db
+def test_gradebook_returns_latest_grade_matrix(api_client, teacher):
+    graded, ungraded, absent = StudentFactory.create_batch(3)
+    course = CourseFactory(teachers=[teacher], students=[graded, ungraded, absent])
+    first, second = HomeworkFactory.create_batch(2, lecture=LectureFactory(course=course))
+    submission = HomeworkSubmissionFactory(homework=first, student=graded)
+    GradeFactory(submission=submission, teacher=teacher, value=60)
+    GradeFactory(submission=submission, teacher=teacher, value=95)
+    HomeworkSubmissionFactory(homework=first, student=ungraded)
+    api_client.force_authenticate(user=teacher)
+
+    resp = api_client.get(reverse("course-gradebook", args=[course.id]))
+
+    assert [hw["id"] for hw in resp.data["homeworks"]] == [first.id, second.id]
+    rows = {row["id"]: row for row in resp.data["students"]}
+    assert rows[graded.id]["grades"] == [95, None]
+    assert rows[ungraded.id]["submitted"] == [True, False]
+    assert rows[absent.id]["submitted"] == [False, False]
+
+    resp = api_client.get(reverse("course-gradebook", args=[course.id]) + "?column_offset=1&column_limit=1")
+    assert resp.data["total_columns"] == 2
+    assert [hw["id"] for hw in resp.data["homeworks"]] == [second.id]
+
+
+def _course_list_queries(api_client, user, url):
+    api_client.force_authenticate(user=user)
+    with CaptureQueriesContext(connection) as queries:
+        resp = api_client.get(url)
+    assert resp.status_code == 200
+    return len(queries), resp.data["results"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/v1/courses/", "/api/v1/me/teaching-courses/"])
+def test_course_list_runs_constant_queries(api_client, url):
+    teacher = TeacherFactory()
+    CourseFactory(teachers=[teacher], students=StudentFactory.create_batch(2))
+    few, _ = _course_list_queries(api_client, teacher, url)
+
+    for _ in range(4):
+        CourseFactory(teachers=[teacher], students=StudentFactory.create_batch(3))
+    many, results = _course_list_queries(api_client, teacher, url)
+
+    assert many == few
+    assert len(results) == 5
+    assert all(teacher.username in course["teachers"] for course in results)
+
+
+@pytest.mark.django_db
+def test_compact_course_list_shows_counts(api_client):
+    teacher = TeacherFactory()
+    student = StudentFactory()
+    course = CourseFactory(teachers=[teacher], students=[student, StudentFactory()])
+    api_client.force_authenticate(user=student)
+
+    resp = api_client.get("/api/v1/courses/?compact=true")
+    assert resp.data["results"] == [
+        {
+            "id": str(course.id),
+            "title": course.title,
+            "description": course.description,
+            "teacher_count": 1,
+            "student_count": 2,
+        }
+    ]
+
+    resp = api_client.get("/api/v1/me/enrolled-courses/?compact=true")
+    assert resp.data["results"][0]["student_count"] == 2
+
+    resp = api_client.get(f"/api/v1/courses/{course.id}/?compact=true")
+    assert resp.data["teacher_count"] == 1
+    assert "students" not in resp.data
@@ -0,0 +1,97 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from courses.tests.factories import (
+    CourseFactory,
+    GradeFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    LectureFactory,
+    StudentFactory,
+    TeacherFactory,
+)
+
+
+@pytest.fixture
+def enrolled(db):
+    teacher = TeacherFactory()
+    student, classmate = StudentFactory.create_batch(2)
+    course = CourseFactory(teachers=[teacher], students=[student, classmate])
+    lecture = LectureFactory(course=course)
+    graded, submitted, open_ = HomeworkFactory.create_batch(3, lecture=lecture)
+    GradeFactory(submission=HomeworkSubmissionFactory(homework=graded, student=student), teacher=teacher, value=87)
+    HomeworkSubmissionFactory(homework=submitted, student=student)
+    HomeworkSubmissionFactory(homework=open_, student=classmate)
+    CourseFactory(teachers=[teacher])  # not enrolled
+    return {
+        "teacher": teacher,
+        "student": student,
+        "course": course,
+        "lecture": lecture,
+        "homeworks": {"graded": graded, "submitted": submitted, "not_submitted": open_},
+    }
+
+
+def _dashboard(api_client, user):
+    api_client.force_authenticate(user=user)
+    return api_client.get(reverse("my-dashboard"))
+
+
+def test_dashboard_shows_courses_lectures_and_own_homework_status(api_client, enrolled):
+    resp = _dashboard(api_client, enrolled["student"])
+    assert resp.status_code == status.HTTP_200_OK
+
+    [course] = resp.data["courses"]
+    assert course["id"] == enrolled["course"].id
+    assert (course["homework_count"], course["submitted_count"], course["graded_count"]) == (3, 2, 1)
+    [lecture] = course["lectures"]
+    assert lecture["id"] == enrolled["lecture"].id
+
+    statuses = {homework["id"]: homework for homework in lecture["homeworks"]}
+    for expected, homework in enrolled["homeworks"].items():
+        assert statuses[homework.id]["status"] == expected
+    assert statuses[enrolled["homeworks"]["graded"].id]["submission"]["grade"] == 87
+    assert statuses[enrolled["homeworks"]["submitted"].id]["submission"]["grade"] is None
+    assert statuses[enrolled["homeworks"]["not_submitted"].id]["submission"] is None
+
+
+def test_dashboard_is_cached_until_a_relevant_write(api_client, enrolled):
+    student = enrolled["student"]
+    assert _dashboard(api_client, student)["X-Cache"] == "miss"
+    assert _dashboard(api_client, student)["X-Cache"] == "hit"
+
+    HomeworkSubmissionFactory(homework=enrolled["homeworks"]["not_submitted"], student=student)
+    resp = _dashboard(api_client, student)
+    assert resp["X-Cache"] == "miss"
+    assert resp.data["courses"][0]["submitted_count"] == 3
+
+    submission = enrolled["homeworks"]["submitted"].submissions.get(student=student)
+    GradeFactory(submission=submission, teacher=enrolled["teacher"])
+    assert _dashboard(api_client, student).data["courses"][0]["graded_count"] == 2
+
+    LectureFactory(course=enrolled["course"])
+    assert len(_dashboard(api_client, student).data["courses"][0]["lectures"]) == 2
+
+    other = CourseFactory(students=[student])
+    assert {course["id"] for course in _dashboard(api_client, student).data["courses"]} == {
+        enrolled["course"].id,
+        other.id,
+    }
+
+
+def test_other_students_writes_keep_the_cache(api_client, enrolled):
+    student = enrolled["student"]
+    _dashboard(api_client, student)
+    HomeworkSubmissionFactory(homework=enrolled["homeworks"]["graded"], student=StudentFactory())
+    assert _dashboard(api_client, student)["X-Cache"] == "hit"
+
+
+def test_dashboard_is_for_students_only(api_client, enrolled):
+    assert _dashboard(api_client, enrolled["teacher"]).status_code == status.HTTP_403_FORBIDDEN
+    api_client.force_authenticate(user=None)
+    assert api_client.get(reverse("my-dashboard")).status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_dashboard_of_unenrolled_student_is_empty(api_client, db):
+    assert _dashboard(api_client, StudentFactory()).data == {"courses": []}
@@ -28,7 +28,7 @@ def test_teacher_can_create_and_list_grade_comments(api_client):
     list_url = reverse("grade-comments", args=[grade.id])
     resp = api_client.get(list_url)
     assert resp.status_code == status.HTTP_200_OK
-    assert resp.data == []
+    assert resp.data["results"] == []
 
     payload = {"content": "Nice feedback!"}
     resp = api_client.post(list_url, payload)
@@ -38,7 +38,7 @@ def test_teacher_can_create_and_list_grade_comments(api_client):
 
     resp = api_client.get(list_url)
     assert resp.status_code == status.HTTP_200_OK
-    assert len(resp.data) == 1
+    assert len(resp.data["results"]) == 1
 
 
 @pytest.mark.django_db
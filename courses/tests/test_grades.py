@@ -1,7 +1,9 @@
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework import status
 from django.urls import reverse
 
+from courses.models import Grade
 from courses.tests.factories import (
     CourseFactory,
     LectureFactory,
@@ -9,6 +11,7 @@ from courses.tests.factories import (
     HomeworkSubmissionFactory,
     TeacherFactory,
     StudentFactory,
+    GradeFactory,
 )
 
 
@@ -26,7 +29,7 @@ def test_teacher_can_create_and_list_grades(api_client):
     list_url = reverse("submission-grades", args=[submission.id])
     resp = api_client.get(list_url)
     assert resp.status_code == status.HTTP_200_OK
-    assert resp.data == []
+    assert resp.data["results"] == []
 
     payload = {"value": 95, "feedback": "Great work"}
     resp = api_client.post(list_url, payload)
@@ -37,7 +40,7 @@ def test_teacher_can_create_and_list_grades(api_client):
 
     resp = api_client.get(list_url)
     assert resp.status_code == status.HTTP_200_OK
-    assert len(resp.data) == 1
+    assert len(resp.data["results"]) == 1
 
 
 @pytest.mark.django_db
@@ -70,3 +73,119 @@ def test_teacher_can_retrieve_update_and_delete_grade(api_client):
 
     resp = api_client.get(detail_url)
     assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_teacher_can_bulk_grade_homework(api_client):
+    teacher = TeacherFactory()
+    students = StudentFactory.create_batch(2)
+    course = CourseFactory(teachers=[teacher], students=students)
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    first, second = [HomeworkSubmissionFactory(homework=homework, student=s) for s in students]
+
+    api_client.force_authenticate(user=teacher)
+    url = reverse("homework-bulk-grades", args=[homework.id])
+    rows = [
+        {"submission": str(first.id), "value": 90, "feedback": "Good"},
+        {"student": second.student.username, "value": 75},
+        {"student": "stranger", "value": 50},
+        {"submission": str(first.id), "value": 150},
+    ]
+    resp = api_client.post(url, {"rows": rows}, format="json")
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert [row["row"] for row in resp.data["created"]] == [0, 1]
+    assert [row["row"] for row in resp.data["errors"]] == [2, 3]
+    assert sorted(Grade.objects.values_list("value", flat=True)) == [75, 90]
+    assert set(Grade.objects.values_list("course_id", flat=True)) == {course.id}
+
+
+@pytest.mark.django_db
+def test_teacher_can_bulk_grade_from_csv(api_client):
+    teacher = TeacherFactory()
+    student = StudentFactory()
+    course = CourseFactory(teachers=[teacher], students=[student])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    HomeworkSubmissionFactory(homework=homework, student=student)
+
+    api_client.force_authenticate(user=teacher)
+    url = reverse("homework-bulk-grades", args=[homework.id])
+    upload = SimpleUploadedFile("grades.csv", f"student,value,feedback\n{student.email},88,Nice\n".encode())
+    resp = api_client.post(url, {"file": upload}, format="multipart")
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["errors"] == []
+    assert Grade.objects.get().value == 88
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "content",
+    [
+        "student,value\n".encode() + b"s@example.com,1\n" * 5001,
+        "student,value,feedback\ns@example.com,88,Très bien\n".encode("latin-1"),
+        b"student,value,feedback\ns@example.com,88," + b"x" * (256 * 1024) + b"\n",
+    ],
+    ids=["too-many-rows", "not-utf8", "malformed"],
+)
+def test_bulk_grade_csv_is_validated(api_client, content):
+    teacher = TeacherFactory()
+    homework = HomeworkFactory(lecture=LectureFactory(course=CourseFactory(teachers=[teacher])))
+
+    api_client.force_authenticate(user=teacher)
+    url = reverse("homework-bulk-grades", args=[homework.id])
+    resp = api_client.post(url, {"file": SimpleUploadedFile("grades.csv", content)}, format="multipart")
+
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert "file" in resp.data
+    assert not Grade.objects.exists()
+
+
+@pytest.mark.django_db
+def test_submission_tracks_current_grade():
+    submission = HomeworkSubmissionFactory()
+    first = GradeFactory(submission=submission, value=60)
+    second = GradeFactory(submission=submission, value=70)
+    submission.refresh_from_db()
+    assert (submission.current_grade, submission.current_grade_value) == (second, 70)
+
+    second.value = 75
+    second.save()
+    submission.refresh_from_db()
+    assert submission.current_grade_value == 75
+
+    second.delete()
+    submission.refresh_from_db()
+    assert (submission.current_grade, submission.current_grade_value) == (first, 60)
+
+
+@pytest.mark.django_db
+def test_teacher_can_filter_ungraded_submissions(api_client):
+    teacher = TeacherFactory()
+    homework = HomeworkFactory(lecture=LectureFactory(course=CourseFactory(teachers=[teacher])))
+    graded = GradeFactory(submission__homework=homework).submission
+    ungraded = HomeworkSubmissionFactory(homework=homework)
+
+    api_client.force_authenticate(user=teacher)
+    url = reverse("homework-submissions", args=[homework.id])
+    assert [row["id"] for row in api_client.get(url + "?graded=false").data["results"]] == [str(ungraded.id)]
+    assert [row["id"] for row in api_client.get(url + "?graded=true").data["results"]] == [str(graded.id)]
+
+
+@pytest.mark.django_db
+def test_grade_comments_check_the_grade_once(api_client, django_assert_num_queries):
+    teacher = TeacherFactory()
+    student = StudentFactory()
+    course = CourseFactory(teachers=[teacher], students=[student])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    grade = GradeFactory(submission=HomeworkSubmissionFactory(homework=homework, student=student), teacher=teacher)
+    url = reverse("grade-comments", args=[grade.id])
+
+    api_client.force_authenticate(user=student)
+    assert api_client.post(url, {"content": "Why?"}, format="json").status_code == status.HTTP_201_CREATED
+    with django_assert_num_queries(3):  # the grade with its submission, the validators, the comments
+        resp = api_client.get(url)
+    assert len(resp.data["results"]) == 1
+
+    api_client.force_authenticate(user=StudentFactory())
+    assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
@@ -1,8 +1,11 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from django.urls import reverse
 
-from courses.tests.factories import CourseFactory, LectureFactory, HomeworkFactory
+from courses.models import Homework
+from courses.tests.factories import CourseFactory, LectureFactory, HomeworkFactory, HomeworkSubmissionFactory
 
 
 @pytest.mark.django_db
@@ -49,7 +52,7 @@ def test_teacher_can_list_homeworks(api_client, teacher):
     resp = api_client.get(url)
 
     assert resp.status_code == status.HTTP_200_OK
-    assert len(resp.data) == 2
+    assert len(resp.data["results"]) == 2
 
 
 @pytest.mark.django_db
@@ -91,3 +94,19 @@ def test_teacher_can_delete_homework(api_client, teacher):
     resp = api_client.delete(url)
 
     assert resp.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+def test_homework_is_loaded_once_for_permission_and_action(api_client, teacher, student):
+    course = CourseFactory(teachers=[teacher], students=[student])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    HomeworkSubmissionFactory(homework=homework, student=student)
+
+    api_client.force_authenticate(user=teacher)
+    with CaptureQueriesContext(connection) as queries:
+        resp = api_client.get(reverse("homework-submissions", args=[homework.id]))
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(resp.data["results"]) == 1
+    homework_table = f'FROM "{Homework._meta.db_table}"'
+    assert sum(homework_table in query["sql"] for query in queries) == 1
@@ -81,7 +81,7 @@ def test_homeworks_list(api_client, teacher):
     resp = api_client.get(url)
 
     assert resp.status_code == status.HTTP_200_OK
-    assert len(resp.data) == 2
+    assert len(resp.data["results"]) == 2
 
 
 @pytest.mark.django_db
@@ -116,3 +116,35 @@ def test_student_cannot_add_homework(api_client, student):
     )
 
     assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_lecture_homeworks_are_cached_until_homework_changes(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    lecture = LectureFactory(course=course)
+    HomeworkFactory(lecture=lecture)
+    api_client.force_authenticate(user=teacher)
+    url = reverse("lecture-homeworks", args=[lecture.id])
+
+    assert api_client.get(url)["X-Cache"] == "miss"
+    cached = api_client.get(url)
+    assert cached["X-Cache"] == "hit"
+    assert len(cached.data["results"]) == 1
+
+    HomeworkFactory(lecture=lecture)
+    fresh = api_client.get(url)
+    assert fresh["X-Cache"] == "miss"
+    assert len(fresh.data["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_cached_lectures_still_enforce_membership(api_client, teacher, student):
+    course = CourseFactory(teachers=[teacher])
+    LectureFactory(course=course)
+    url = reverse("course-lectures", args=[course.id])
+
+    api_client.force_authenticate(user=teacher)
+    api_client.get(url)
+    api_client.force_authenticate(user=student)
+
+    assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
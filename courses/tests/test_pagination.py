@@ -0,0 +1,97 @@
+import json
+from base64 import urlsafe_b64encode
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from courses.tests.factories import CourseFactory, LectureFactory, StudentFactory
+
+
+@pytest.mark.django_db
+def test_cursor_pages_cover_every_row_once(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    lectures = LectureFactory.create_batch(7, course=course)
+    api_client.force_authenticate(user=teacher)
+
+    seen = []
+    url = reverse("lecture-list") + "?page_size=3"
+    while url:
+        resp = api_client.get(url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert "count" not in resp.data
+        seen += [row["id"] for row in resp.data["results"]]
+        url = resp.data["next"]
+
+    expected = sorted(lectures, key=lambda lecture: (lecture.created_at, lecture.id), reverse=True)
+    assert seen == [lecture.id for lecture in expected]
+
+
+@pytest.mark.django_db
+def test_previous_link_returns_previous_page(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    LectureFactory.create_batch(5, course=course)
+    api_client.force_authenticate(user=teacher)
+
+    first = api_client.get(reverse("lecture-list") + "?page_size=2")
+    second = api_client.get(first.data["next"])
+    back = api_client.get(second.data["previous"])
+
+    assert back.data["results"] == first.data["results"]
+    assert back.data["previous"] is None
+
+
+@pytest.mark.django_db
+def test_page_number_pagination_is_opt_in(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    LectureFactory.create_batch(3, course=course)
+    api_client.force_authenticate(user=teacher)
+
+    resp = api_client.get(reverse("lecture-list") + "?page=1")
+
+    assert resp.data["count"] == 3
+    assert len(resp.data["results"]) == 3
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_is_rejected(api_client, teacher):
+    api_client.force_authenticate(user=teacher)
+    resp = api_client.get(reverse("lecture-list") + "?cursor=garbage")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("position", [["x", "y"], [1, 2], [None, None], [[], {}]])
+def test_cursor_with_mistyped_position_is_rejected(api_client, teacher, position):
+    CourseFactory(teachers=[teacher])
+    api_client.force_authenticate(user=teacher)
+    cursor = urlsafe_b64encode(json.dumps([False, position]).encode()).decode()
+
+    resp = api_client.get(reverse("course-list"), {"cursor": cursor})
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_custom_action_is_paginated(api_client, teacher):
+    students = StudentFactory.create_batch(3)
+    course = CourseFactory(teachers=[teacher], students=students)
+    api_client.force_authenticate(user=teacher)
+
+    resp = api_client.get(reverse("course-manage-students", args=[course.id]) + "?page_size=2")
+
+    assert len(resp.data["results"]) == 2
+    assert resp.data["next"]
+
+
+@pytest.mark.django_db
+def test_custom_action_can_stream_all_rows(api_client, teacher):
+    students = StudentFactory.create_batch(3)
+    course = CourseFactory(teachers=[teacher], students=students)
+    api_client.force_authenticate(user=teacher)
+
+    resp = api_client.get(reverse("course-manage-students", args=[course.id]) + "?stream=true")
+
+    assert resp.status_code == status.HTTP_200_OK
+    rows = json.loads(b"".join(resp.streaming_content))
+    assert sorted(row["username"] for row in rows) == sorted(s.username for s in students)
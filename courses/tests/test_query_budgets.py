@@ -0,0 +1,113 @@
+import pytest
+from django.urls import reverse
+
+from courses.models import GradeComment
+from courses.tests.factories import (
+    CourseFactory,
+    GradeFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    LectureFactory,
+    StudentFactory,
+    TeacherFactory,
+)
+from courses.tests.query_budgets import QUERY_BUDGETS
+
+SIZES = (1, 4)
+
+
+def seed(size):
+    """A course with `size` students, lectures and homeworks, every homework submitted, graded and commented."""
+    teacher = TeacherFactory()
+    students = StudentFactory.create_batch(size)
+    course = CourseFactory(teachers=[teacher], students=students)
+    for _ in range(size):
+        homework = HomeworkFactory(lecture=LectureFactory(course=course))
+        for student in students:
+            grade = GradeFactory(
+                submission=HomeworkSubmissionFactory(homework=homework, student=student), teacher=teacher
+            )
+            GradeComment.objects.create(grade=grade, author=student, content="Why?")
+    lecture = course.lectures.first()
+    homework = lecture.homeworks.first()
+    submission = homework.submissions.first()
+    grade = submission.grades.first()
+    return {
+        "teacher": teacher,
+        "student": students[0],
+        "course": course,
+        "lecture": lecture,
+        "homework": homework,
+        "submission": submission,
+        "grade": grade,
+        "comment": grade.comments.first(),
+    }
+
+
+# endpoint -> (requesting user, seeded object passed as the URL argument)
+REQUESTS = {
+    "course-list": ("teacher", None),
+    "course-detail": ("teacher", "course"),
+    "course-lectures": ("teacher", "course"),
+    "course-manage-teachers": ("teacher", "course"),
+    "course-manage-students": ("teacher", "course"),
+    "course-gradebook": ("teacher", "course"),
+    "course-stats": ("teacher", "course"),
+    "lecture-list": ("student", None),
+    "lecture-detail": ("student", "lecture"),
+    "lecture-homeworks": ("student", "lecture"),
+    "homework-list": ("student", None),
+    "homework-detail": ("student", "homework"),
+    "homework-submissions": ("teacher", "homework"),
+    "homework-stats": ("teacher", "homework"),
+    "submission-list": ("teacher", None),
+    "submission-detail": ("teacher", "submission"),
+    "submission-grades": ("teacher", "submission"),
+    "grade-list": ("teacher", None),
+    "grade-detail": ("teacher", "grade"),
+    "grade-comments": ("teacher", "grade"),
+    "grade-comment-list": ("teacher", None),
+    "my-teaching-courses": ("teacher", None),
+    "my-enrolled-courses-list": ("student", None),
+    "my-submissions": ("student", None),
+    "my-dashboard": ("student", None),
+    "user-list": ("teacher", None),
+    "async-course-list": ("teacher", None),
+    "async-lecture-list": ("student", None),
+    "async-homework-list": ("student", None),
+    "async-grade-list": ("teacher", None),
+    "async-my-submissions": ("student", None),
+}
+
+
+def test_every_budget_has_a_request():
+    assert set(REQUESTS) == set(QUERY_BUDGETS)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", sorted(REQUESTS))
+def test_endpoint_stays_within_query_budget(api_client, query_budget, endpoint):
+    user_key, object_key = REQUESTS[endpoint]
+    counts = []
+    for size in SIZES:
+        data = seed(size)
+        args = [data[object_key].pk] if object_key else []
+        api_client.force_authenticate(user=data[user_key])
+        resp = api_client.get(reverse(endpoint, args=args))
+        assert resp.status_code == 200, resp.content
+        counts.append(query_budget(resp))
+    assert len(set(counts)) == 1, f"{endpoint} query count grows with data: {dict(zip(SIZES, counts))}"
+
+
+@pytest.mark.django_db
+def test_query_headers_are_sent_in_debug(api_client, settings):
+    data = seed(1)
+    api_client.force_authenticate(user=data["teacher"])
+
+    resp = api_client.get(reverse("lecture-list"))
+    assert not resp.has_header("X-Query-Count")
+
+    settings.DEBUG = True
+    resp = api_client.get(reverse("lecture-list"))
+    assert resp["X-Query-Count"] == str(resp.query_stats.count)
+    assert float(resp["X-Query-Time-Ms"]) >= 0
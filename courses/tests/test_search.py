@@ -0,0 +1,125 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+
+from courses.services.search_services import SEARCH_DOCUMENTS, match_expression
+from courses.tests.factories import (
+    CourseFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    LectureFactory,
+    StudentFactory,
+    TeacherFactory,
+)
+
+
+@pytest.fixture
+def searchable(db):
+    teacher, outsider_teacher = TeacherFactory.create_batch(2)
+    student, classmate = StudentFactory.create_batch(2)
+    course = CourseFactory(teachers=[teacher], students=[student, classmate])
+    lecture = LectureFactory(course=course, topic="Photosynthesis basics")
+    homework = HomeworkFactory(lecture=lecture, description="Explain photosynthesis in plants")
+    own = HomeworkSubmissionFactory(homework=homework, student=student, content="Photosynthesis makes sugar")
+    other = HomeworkSubmissionFactory(homework=homework, student=classmate, content="Photosynthesis needs light")
+    other_course = CourseFactory(teachers=[outsider_teacher])
+    LectureFactory(course=other_course, topic="Photosynthesis advanced")
+    return {
+        "teacher": teacher,
+        "student": student,
+        "lecture": lecture,
+        "homework": homework,
+        "own": own,
+        "other": other,
+    }
+
+
+def _search(api_client, user, **params):
+    api_client.force_authenticate(user=user)
+    return api_client.get(reverse("search"), params)
+
+
+def _found(resp):
+    assert resp.status_code == 200, resp.content
+    return {(row["kind"], row["id"]) for row in resp.data["results"]}
+
+
+def test_teacher_finds_everything_in_their_courses(api_client, searchable):
+    found = _found(_search(api_client, searchable["teacher"], q="photosynth"))
+    assert found == {
+        ("lecture", str(searchable["lecture"].pk)),
+        ("homework", str(searchable["homework"].pk)),
+        ("submission", str(searchable["own"].pk)),
+        ("submission", str(searchable["other"].pk)),
+    }
+
+
+def test_student_finds_course_material_and_own_submissions_only(api_client, searchable):
+    found = _found(_search(api_client, searchable["student"], q="photosynthesis"))
+    assert found == {
+        ("lecture", str(searchable["lecture"].pk)),
+        ("homework", str(searchable["homework"].pk)),
+        ("submission", str(searchable["own"].pk)),
+    }
+
+
+def test_results_are_ranked_paginated_and_filterable(api_client, searchable):
+    resp = _search(api_client, searchable["teacher"], q="photosynthesis plants", page_size=1)
+    assert resp.data["count"] == 1
+    assert resp.data["results"][0]["id"] == str(searchable["homework"].pk)
+    assert "[photosynthesis]" in resp.data["results"][0]["snippet"].lower()
+
+    resp = _search(api_client, searchable["teacher"], q="photosynthesis", page_size=3)
+    assert resp.data["count"] == 4
+    assert len(resp.data["results"]) == 3
+    ranks = [row["rank"] for row in resp.data["results"]]
+    assert ranks == sorted(ranks)
+    assert len(api_client.get(resp.data["next"]).data["results"]) == 1
+
+    found = _found(_search(api_client, searchable["teacher"], q="photosynthesis", kind="lecture"))
+    assert found == {("lecture", str(searchable["lecture"].pk))}
+
+
+def test_index_follows_saves_and_deletes(api_client, searchable):
+    lecture = searchable["lecture"]
+    lecture.topic = "Cellular respiration"
+    lecture.save()
+    assert ("lecture", str(lecture.pk)) in _found(_search(api_client, searchable["teacher"], q="respiration"))
+
+    searchable["own"].delete()
+    found = _found(_search(api_client, searchable["teacher"], q="sugar"))
+    assert found == set()
+
+
+def test_query_syntax_is_neutralised(api_client, searchable):
+    assert match_expression('photo" OR NEAR(x') == '"photo"* "OR"* "NEAR"* "x"*'
+    assert _search(api_client, searchable["teacher"], q='"photo* AND').status_code == 200
+    assert _search(api_client, searchable["teacher"], q="  !! ").status_code == 400
+    assert _search(api_client, searchable["teacher"], q="photo", kind="grade").status_code == 400
+
+
+def test_search_without_fts_backend_is_not_implemented(api_client, searchable, monkeypatch):
+    monkeypatch.setattr("courses.services.search_services.search_supported", lambda using=None: False)
+    resp = _search(api_client, searchable["teacher"], q="photosynthesis")
+    assert resp.status_code == 501
+    assert resp.data["detail"].code == "search_unavailable"
+
+
+def test_search_runs_constant_queries(api_client, searchable, django_assert_num_queries):
+    for _ in range(5):
+        HomeworkSubmissionFactory(homework=searchable["homework"], content="More photosynthesis")
+    api_client.force_authenticate(user=searchable["teacher"])
+    with django_assert_num_queries(2):
+        api_client.get(reverse("search"), {"q": "photosynthesis"})
+
+
+def test_rebuild_command_restores_index(api_client, searchable):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_DOCUMENTS}")
+    assert _found(_search(api_client, searchable["teacher"], q="photosynthesis")) == set()
+
+    call_command("rebuild_search_index", stdout=StringIO())
+    assert len(_found(_search(api_client, searchable["teacher"], q="photosynthesis"))) == 4
@@ -0,0 +1,93 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from courses.models import Grade, HomeworkSubmission
+from courses.serializers import (
+    GradeSerializer,
+    GradeReadSerializer,
+    HomeworkSubmissionSerializer,
+    HomeworkSubmissionReadSerializer,
+)
+from courses.tests.factories import (
+    CourseFactory,
+    LectureFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    TeacherFactory,
+    StudentFactory,
+    GradeFactory,
+)
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.fixture
+def graded_homework(db, settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    teacher = TeacherFactory()
+    students = StudentFactory.create_batch(3)
+    course = CourseFactory(teachers=[teacher], students=students)
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    with_file = HomeworkSubmissionFactory(
+        homework=homework, student=students[0], file=SimpleUploadedFile("answer.txt", b"42")
+    )
+    graded = HomeworkSubmissionFactory(homework=homework, student=students[1])
+    HomeworkSubmissionFactory(homework=homework, student=students[2])
+    GradeFactory(submission=with_file, teacher=teacher, value=70)
+    GradeFactory(submission=graded, teacher=None, value=90)
+    return teacher, homework
+
+
+@pytest.mark.parametrize(
+    "model, serializer_class, read_serializer_class",
+    [
+        (Grade, GradeSerializer, GradeReadSerializer),
+        (HomeworkSubmission, HomeworkSubmissionSerializer, HomeworkSubmissionReadSerializer),
+    ],
+)
+def test_read_serializer_output_matches(graded_homework, model, serializer_class, read_serializer_class):
+    context = {"request": APIRequestFactory().get("/")}
+    queryset = model.objects.order_by("created_at")
+
+    expected = serializer_class(queryset, many=True, context=context).data
+    rows = read_serializer_class(read_serializer_class.values(queryset), many=True, context=context).data
+    instances = read_serializer_class(queryset, many=True, context=context).data
+
+    assert render(rows) == render(expected)
+    assert render(instances) == render(expected)
+    assert render(read_serializer_class(queryset.first()).data) == render(serializer_class(queryset.first()).data)
+
+
+def test_read_serializer_omits_missing_teacher_like_source(graded_homework):
+    grade = Grade.objects.get(teacher=None)
+    assert "teacher" not in GradeSerializer(grade).data
+    assert "teacher" not in GradeReadSerializer(GradeReadSerializer.values(Grade.objects.filter(pk=grade.pk))[0]).data
+
+
+@pytest.mark.django_db
+def test_list_and_retrieve_endpoints_keep_shape(api_client, graded_homework):
+    teacher, homework = graded_homework
+    api_client.force_authenticate(user=teacher)
+
+    resp = api_client.get(reverse("submission-list"))
+    assert resp.status_code == status.HTTP_200_OK
+    request = resp.wsgi_request
+    expected = HomeworkSubmissionSerializer(
+        HomeworkSubmission.objects.order_by("-created_at", "-id"), many=True, context={"request": request}
+    ).data
+    assert render(resp.data["results"]) == render(expected)
+
+    grade = Grade.objects.get(value=70)
+    resp = api_client.get(reverse("grade-detail", args=[grade.id]))
+    assert resp.status_code == status.HTTP_200_OK
+    assert render(resp.data) == render(GradeSerializer(grade).data)
+
+    resp = api_client.get(reverse("homework-submissions", args=[homework.id]))
+    assert len(resp.data["results"]) == 3
+    assert resp.data["results"][-1]["file"].endswith(".txt")
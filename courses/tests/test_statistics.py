@@ -0,0 +1,89 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from courses.models import Grade, HomeworkGradeStatistics, CourseGradeStatistics
+from courses.services.statistics_services import rebuild_grade_statistics
+from courses.tests.factories import (
+    CourseFactory,
+    GradeFactory,
+    HomeworkFactory,
+    HomeworkSubmissionFactory,
+    LectureFactory,
+    StudentFactory,
+)
+
+
+def _snapshot():
+    return {
+        (type(stats).__name__, stats.pk): (stats.count, stats.total, stats.total_squares, stats.histogram)
+        for model in (HomeworkGradeStatistics, CourseGradeStatistics)
+        for stats in model.objects.all()
+    }
+
+
+@pytest.mark.django_db
+def test_statistics_follow_grade_writes(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    grades = [
+        GradeFactory(submission=HomeworkSubmissionFactory(homework=homework), teacher=teacher, value=value)
+        for value in (40, 80, 100)
+    ]
+    grades[0].value = 60
+    grades[0].save()
+    grades[1].delete()
+
+    stats = HomeworkGradeStatistics.objects.get(homework=homework)
+    assert (stats.count, stats.total, stats.total_squares) == (2, 160, 60 * 60 + 100 * 100)
+    assert stats.histogram[6] == stats.histogram[9] == 1
+
+    api_client.force_authenticate(user=teacher)
+    resp = api_client.get(reverse("homework-stats", args=[homework.id]))
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["mean"] == 80
+    assert api_client.get(reverse("course-stats", args=[course.id])).data["count"] == 2
+
+
+@pytest.mark.django_db
+def test_rebuild_matches_incremental_statistics():
+    GradeFactory.create_batch(4)
+    Grade.objects.first().delete()
+    incremental = _snapshot()
+
+    HomeworkGradeStatistics.objects.all().delete()
+    rebuild_grade_statistics()
+
+    assert _snapshot() == {key: value for key, value in incremental.items() if value[0]}
+
+
+@pytest.mark.django_db
+def test_student_cannot_view_statistics(api_client):
+    student = StudentFactory()
+    homework = HomeworkFactory(lecture=LectureFactory(course=CourseFactory(students=[student])))
+    api_client.force_authenticate(user=student)
+    resp = api_client.get(reverse("homework-stats", args=[homework.id]))
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_deleting_graded_homework_and_course_keeps_statistics_consistent(api_client, teacher):
+    course = CourseFactory(teachers=[teacher])
+    lecture = LectureFactory(course=course)
+    kept, dropped = HomeworkFactory.create_batch(2, lecture=lecture)
+    for homework, value in ((kept, 70), (kept, 90), (dropped, 30), (dropped, 50)):
+        GradeFactory(submission=HomeworkSubmissionFactory(homework=homework), teacher=teacher, value=value)
+    kept.submissions.filter(current_grade_value=90).get().delete()
+
+    api_client.force_authenticate(user=teacher)
+    assert api_client.delete(reverse("homework-detail", args=[dropped.id])).status_code == status.HTTP_204_NO_CONTENT
+
+    assert not HomeworkGradeStatistics.objects.filter(pk=dropped.pk).exists()
+    assert CourseGradeStatistics.objects.get(pk=course.pk).count == 1
+    before = _snapshot()
+    rebuild_grade_statistics()
+    assert _snapshot() == before
+
+    assert api_client.delete(reverse("course-detail", args=[course.id])).status_code == status.HTTP_204_NO_CONTENT
+    assert not HomeworkGradeStatistics.objects.exists()
+    assert not CourseGradeStatistics.objects.exists()
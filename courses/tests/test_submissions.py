@@ -8,6 +8,8 @@ from courses.tests.factories import (
     HomeworkFactory,
     HomeworkSubmissionFactory,
     StudentFactory,
+    TeacherFactory,
+    GradeFactory,
 )
 
 
@@ -46,7 +48,7 @@ def test_teacher_can_list_submissions(api_client, teacher):
     resp = api_client.get(url)
 
     assert resp.status_code == status.HTTP_200_OK
-    assert len(resp.data) == 2
+    assert len(resp.data["results"]) == 2
 
 
 @pytest.mark.django_db
@@ -62,3 +64,30 @@ def test_teacher_can_retrieve_submission(api_client, teacher):
 
     assert resp.status_code == status.HTTP_200_OK
     assert resp.data["id"]
+
+
+@pytest.mark.django_db
+def test_grading_queue_leases_distinct_submissions(api_client):
+    first_ta, second_ta = TeacherFactory.create_batch(2)
+    course = CourseFactory(teachers=[first_ta, second_ta])
+    homework = HomeworkFactory(lecture=LectureFactory(course=course))
+    submissions = [HomeworkSubmissionFactory(homework=homework) for _ in range(3)]
+    GradeFactory(submission=submissions[0])
+    url = reverse("homework-grading-queue", args=[homework.id])
+
+    api_client.force_authenticate(user=first_ta)
+    first = api_client.post(url + "?limit=1")
+    assert first.status_code == status.HTTP_200_OK
+    assert [row["id"] for row in first.data["results"]] == [str(submissions[1].id)]
+
+    api_client.force_authenticate(user=second_ta)
+    second = api_client.post(reverse("course-grading-queue", args=[course.id]) + "?limit=5")
+    assert [row["id"] for row in second.data["results"]] == [str(submissions[2].id)]
+
+
+@pytest.mark.django_db
+def test_student_cannot_claim_grading_queue(api_client, student):
+    homework = HomeworkFactory(lecture=LectureFactory(course=CourseFactory(students=[student])))
+    api_client.force_authenticate(user=student)
+    resp = api_client.post(reverse("homework-grading-queue", args=[homework.id]))
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
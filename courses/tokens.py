@@ -0,0 +1,75 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+DEFAULT_BLACKLIST_CACHE_SIZE = 4096
+
+
+class BlacklistedJtiCache:
+    """
+    Bounded in-process LRU of token IDs known to be blacklisted.
+
+    A token is never taken off the blacklist before it expires, so a hit can be
+    trusted without asking the database. A miss proves nothing (another process
+    may have blacklisted the token) and falls through to the indexed `jti` lookup.
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = (
+            max_size if max_size is not None
+            else getattr(settings, "TOKEN_BLACKLIST_CACHE_SIZE", DEFAULT_BLACKLIST_CACHE_SIZE)
+        )
+        self._jtis = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, jti):
+        with self._lock:
+            if jti not in self._jtis:
+                return False
+            self._jtis.move_to_end(jti)
+            return True
+
+    def add(self, jti):
+        with self._lock:
+            self._jtis[jti] = None
+            self._jtis.move_to_end(jti)
+            while len(self._jtis) > self.max_size:
+                self._jtis.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._jtis.clear()
+
+    def __len__(self):
+        return len(self._jtis)
+
+
+blacklisted_jtis = BlacklistedJtiCache()
+
+
+def is_jti_blacklisted(jti) -> bool:
+    if jti in blacklisted_jtis:
+        return True
+    if BlacklistedToken.objects.filter(token__jti=jti).exists():
+        blacklisted_jtis.add(jti)
+        return True
+    return False
+
+
+class CourseRefreshToken(RefreshToken):
+    """Refresh token whose blacklist check is answered from `blacklisted_jtis` when possible."""
+
+    def check_blacklist(self):
+        if is_jti_blacklisted(self.payload[jwt_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        blacklisted_jtis.add(self.payload[jwt_settings.JTI_CLAIM])
+        return blacklisted
@@ -20,6 +20,13 @@ from courses.views import (
     MyEnrolledCoursesViewSet,
     GradeCommentViewSet,
     MySubmissionsViewSet,
+    SearchViewSet,
+    MyDashboardViewSet,
+    AsyncCourseView,
+    AsyncLectureView,
+    AsyncHomeworkView,
+    AsyncGradeView,
+    AsyncMySubmissionsView,
 )
 
 router = DefaultRouter()
@@ -54,4 +61,23 @@ urlpatterns += [
         MySubmissionsViewSet.as_view({'get': 'list'}),
         name="my-submissions",
     ),
+    path(
+        "me/dashboard/",
+        MyDashboardViewSet.as_view({'get': 'list'}),
+        name="my-dashboard",
+    ),
+    path("search/", SearchViewSet.as_view({'get': 'list'}), name="search"),
+]
+
+# Native async mirrors of the hot read endpoints, for ASGI deployments.
+urlpatterns += [
+    path("async/courses/", AsyncCourseView.as_view(), name="async-course-list"),
+    path("async/courses/<uuid:pk>/", AsyncCourseView.as_view(), name="async-course-detail"),
+    path("async/lectures/", AsyncLectureView.as_view(), name="async-lecture-list"),
+    path("async/lectures/<uuid:pk>/", AsyncLectureView.as_view(), name="async-lecture-detail"),
+    path("async/homeworks/", AsyncHomeworkView.as_view(), name="async-homework-list"),
+    path("async/homeworks/<uuid:pk>/", AsyncHomeworkView.as_view(), name="async-homework-detail"),
+    path("async/grades/", AsyncGradeView.as_view(), name="async-grade-list"),
+    path("async/grades/<uuid:pk>/", AsyncGradeView.as_view(), name="async-grade-detail"),
+    path("async/me/submissions/", AsyncMySubmissionsView.as_view(), name="async-my-submissions"),
 ]
@@ -3,6 +3,15 @@ from .lecture_views import LectureViewSet
 from .homework_views import HomeworkViewSet, HomeworkSubmissionViewSet, MySubmissionsViewSet
 from .grade_views import GradeViewSet, GradeCommentViewSet
 from .user_views import UserViewSet, RegisterViewSet, LogoutViewSet
+from .search_views import SearchViewSet
+from .dashboard_views import MyDashboardViewSet
+from .async_views import (
+    AsyncCourseView,
+    AsyncLectureView,
+    AsyncHomeworkView,
+    AsyncGradeView,
+    AsyncMySubmissionsView,
+)
 
 __all__ = [
     "CourseViewSet",
@@ -17,4 +26,11 @@ __all__ = [
     "UserViewSet",
     "RegisterViewSet",
     "LogoutViewSet",
+    "SearchViewSet",
+    "MyDashboardViewSet",
+    "AsyncCourseView",
+    "AsyncLectureView",
+    "AsyncHomeworkView",
+    "AsyncGradeView",
+    "AsyncMySubmissionsView",
 ]
@@ -0,0 +1,165 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from courses.models import Course, Lecture, Grade
+from courses.pagination import KeysetPagination
+from courses.permissions import IsTeacherOrReadOnly, IsCourseTeacherOrReadOnly, IsGradeOwnerOrCourseTeacher
+from courses.serializers import (
+    CourseSerializer,
+    CourseSummarySerializer,
+    LectureSerializer,
+    HomeworkSerializer,
+    HomeworkSubmissionReadSerializer,
+    GradeReadSerializer,
+)
+from courses.serializers.base import ValuesSerializer
+from courses.services.homework_services import get_homeworks_for_user, filter_submissions_for_user
+from courses.views.course_views import compact_param, course_representation
+from courses.views.homework_views import graded_param
+
+
+class AsyncReadView(View):
+    """
+    Native async GET endpoint for the hot read paths under ASGI.
+
+    Rows are fetched with the async ORM (`aiterator` / `aget`), so a worker can hold
+    many slow connections open without a thread per request. Authentication reuses
+    the DRF authenticators (off the event loop, they may hit the database);
+    permissions use `ahas_object_permission` when a class provides it. Responses
+    match the DRF endpoints, minus conditional GET and the response cache.
+
+    Subclasses set `queryset`; it is narrowed with `for_user` on every request.
+    Override `get_queryset` when rows come from a service instead.
+    """
+
+    http_method_names = ["get"]
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = []
+    pagination_class = KeysetPagination
+    queryset = None
+    serializer_class = None
+
+    def get_queryset(self):
+        if self.queryset is None:
+            raise ImproperlyConfigured(
+                f"{type(self).__name__} should either include a `queryset` attribute "
+                "or override the `get_queryset()` method."
+            )
+        return self.queryset.for_user(self.request.user)
+
+    def get_serializer_class(self):
+        return self.serializer_class
+
+    async def get(self, request, pk=None):
+        try:
+            self.request = await self.initialize_request(request)
+            await self.check_permissions()
+            data = await (self.retrieve(pk) if pk is not None else self.list())
+        except exceptions.APIException as exc:
+            return JsonResponse({"detail": exc.detail}, status=exc.status_code, encoder=JSONEncoder)
+        return JsonResponse(data, encoder=JSONEncoder, safe=False)
+
+    async def initialize_request(self, request):
+        drf_request = Request(request, authenticators=[auth() for auth in self.authentication_classes])
+        await sync_to_async(lambda: drf_request.user)()
+        return drf_request
+
+    def get_permissions(self):
+        return [permission() for permission in self.permission_classes]
+
+    async def check_permissions(self):
+        for permission in self.get_permissions():
+            if not permission.has_permission(self.request, self):
+                self.permission_denied()
+
+    async def check_object_permissions(self, obj):
+        for permission in self.get_permissions():
+            check = getattr(permission, "ahas_object_permission", None)
+            if check is not None:
+                allowed = await check(self.request, self, obj)
+            else:
+                allowed = await sync_to_async(permission.has_object_permission)(self.request, self, obj)
+            if not allowed:
+                self.permission_denied()
+
+    def permission_denied(self):
+        if not self.request.user.is_authenticated:
+            raise exceptions.NotAuthenticated()
+        raise exceptions.PermissionDenied()
+
+    async def list(self):
+        serializer_class = self.get_serializer_class()
+        queryset = self.get_queryset()
+        if issubclass(serializer_class, ValuesSerializer):
+            queryset = serializer_class.values(queryset)
+
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, self.request, self)
+        context = {"request": self.request, "view": self}
+        if page is None:
+            rows = [row async for row in queryset.aiterator(chunk_size=2000)]
+            return serializer_class(rows, many=True, context=context).data
+        return paginator.get_paginated_response(serializer_class(page, many=True, context=context).data).data
+
+    async def retrieve(self, pk):
+        try:
+            instance = await self.get_queryset().aget(pk=pk)
+        except (ObjectDoesNotExist, DjangoValidationError):
+            raise exceptions.NotFound()
+        await self.check_object_permissions(instance)
+        return self.get_serializer_class()(instance, context={"request": self.request, "view": self}).data
+
+
+class AsyncCourseView(AsyncReadView):
+    permission_classes = [IsTeacherOrReadOnly]
+    queryset = Course.objects.all()
+
+    def get_queryset(self):
+        courses, _ = course_representation(self.request, super().get_queryset())
+        return courses
+
+    def get_serializer_class(self):
+        return CourseSummarySerializer if compact_param(self.request) else CourseSerializer
+
+
+class AsyncLectureView(AsyncReadView):
+    permission_classes = [IsCourseTeacherOrReadOnly]
+    queryset = Lecture.objects.all()
+    serializer_class = LectureSerializer
+
+
+class AsyncHomeworkView(AsyncReadView):
+    permission_classes = [IsCourseTeacherOrReadOnly]
+    serializer_class = HomeworkSerializer
+
+    def get_queryset(self):
+        return get_homeworks_for_user(self.request.user)
+
+
+class AsyncGradeView(AsyncReadView):
+    permission_classes = [IsGradeOwnerOrCourseTeacher]
+    # The object permission reads submission.student_id; load it up front.
+    queryset = Grade.objects.select_related("submission", "teacher")
+    serializer_class = GradeReadSerializer
+
+
+class AsyncMySubmissionsView(AsyncReadView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = HomeworkSubmissionReadSerializer
+
+    def get_queryset(self):
+        params = self.request.query_params
+        return filter_submissions_for_user(
+            self.request.user,
+            homework_id=params.get("homework"),
+            lecture_id=params.get("lecture"),
+            course_id=params.get("course"),
+            graded=graded_param(self.request),
+        )
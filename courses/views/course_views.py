@@ -1,17 +1,30 @@
 from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from courses.models import Course, Lecture
+from courses.mixins import ActionListMixin, ConditionalGetMixin, DetailObjectMixin, GradingQueueMixin
+from courses.models import Course, Lecture, CourseGradeStatistics
 from courses.permissions import IsTeacherOrReadOnly
 from courses.models.roles import Role
-from courses.serializers import CourseSerializer, UserSerializer, LectureSerializer
+from courses.serializers import (
+    CourseSerializer,
+    CourseSummarySerializer,
+    UserSerializer,
+    LectureSerializer,
+    BulkEnrollmentSerializer,
+)
+from courses.services.access import invalidate_course_membership
+from courses.services.gradebook_services import GRADEBOOK_EXPORT_FIELDS, iter_gradebook_rows, build_gradebook
+from courses.services.statistics_services import get_grade_statistics
+from courses.streaming import stream_csv, stream_jsonl
 from courses.services.course_services import (
     add_user_to_course,
+    add_users_to_course,
     remove_user_from_course,
     get_course_users,
     create_lecture_for_course, get_teaching_courses, get_enrolled_courses,
@@ -19,24 +32,45 @@ from courses.services.course_services import (
 User = get_user_model()
 
 
-class CourseViewSet(viewsets.ModelViewSet):
-    queryset = Course.objects.all().prefetch_related("teachers", "students")
+def compact_param(request) -> bool:
+    """`?compact=true` swaps the rosters for teacher/student counts."""
+    return request.query_params.get("compact") in ("1", "true")
+
+
+def course_representation(request, courses):
+    """Prepare a course queryset for the requested representation and return it with its serializer."""
+    if compact_param(request):
+        return courses.with_member_counts(), CourseSummarySerializer
+    return courses.with_rosters(), CourseSerializer
+
+
+class CourseViewSet(ConditionalGetMixin, DetailObjectMixin, GradingQueueMixin, ActionListMixin, viewsets.ModelViewSet):
+    queryset = Course.objects.all()
     serializer_class = CourseSerializer
     permission_classes = [IsTeacherOrReadOnly]
 
     def get_queryset(self):
-        return Course.objects.for_user(self.request.user)
+        courses = Course.objects.for_user(self.request.user)
+        if self.action in ("list", "retrieve"):
+            courses, _ = course_representation(self.request, courses)
+        return courses
+
+    def get_serializer_class(self):
+        if self.action in ("list", "retrieve") and compact_param(self.request):
+            return CourseSummarySerializer
+        return super().get_serializer_class()
 
     def perform_create(self, serializer):
         course = serializer.save()
         course.teachers.add(self.request.user)
+        invalidate_course_membership(self.request.user)
 
     @action(detail=True, methods=["get", "post", "delete"], url_path="teachers")
     def manage_teachers(self, request, pk=None):
         course = self.get_object()
         if request.method == "GET":
             users = get_course_users(course, Role.TEACHER)
-            return Response(UserSerializer(users, many=True).data)
+            return self.list_response(users, UserSerializer)
 
         user_id = request.data.get("user")
         user = User.objects.filter(id=user_id).first()
@@ -56,7 +90,7 @@ class CourseViewSet(viewsets.ModelViewSet):
         course = self.get_object()
         if request.method == "GET":
             users = get_course_users(course, Role.STUDENT)
-            return Response(UserSerializer(users, many=True).data)
+            return self.list_response(users, UserSerializer)
 
         user_id = request.data.get("user")
         user = User.objects.filter(id=user_id).first()
@@ -71,15 +105,70 @@ class CourseViewSet(viewsets.ModelViewSet):
             remove_user_from_course(course, user, Role.STUDENT, request.user)
             return Response({"detail": f"{user.username} removed."}, status=204)
 
+    @action(detail=True, methods=["post"], url_path="teachers/bulk", serializer_class=BulkEnrollmentSerializer)
+    def bulk_teachers(self, request, pk=None):
+        """Add many teachers at once by ID, username or email."""
+        return self._bulk_enroll(request, Role.TEACHER)
+
+    @action(detail=True, methods=["post"], url_path="students/bulk", serializer_class=BulkEnrollmentSerializer)
+    def bulk_students(self, request, pk=None):
+        """Enroll many students at once by ID, username or email."""
+        return self._bulk_enroll(request, Role.STUDENT)
+
+    def _bulk_enroll(self, request, role):
+        course = self.get_object()
+        serializer = BulkEnrollmentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = add_users_to_course(course, serializer.validated_data["users"], role, request.user)
+        return Response({"results": results})
+
+    @action(detail=True, methods=["post"], url_path="grading-queue")
+    def grading_queue(self, request, pk=None):
+        """Lease the next ungraded submissions across the course, oldest first."""
+        return self.grading_queue_response(request, self.get_object())
+
+    @action(detail=True, methods=["get"], url_path="stats")
+    def stats(self, request, pk=None):
+        """Grade statistics rolled up over every homework of the course."""
+        course = self.get_object()
+        return Response(get_grade_statistics(CourseGradeStatistics, course.pk, course, request.user))
+
+    @action(detail=True, methods=["get"], url_path="gradebook")
+    def gradebook(self, request, pk=None):
+        """Student x homework matrix of latest grades; slice columns with `column_offset` / `column_limit`."""
+        course = self.get_object()
+        try:
+            column_offset = max(int(request.query_params.get("column_offset", 0)), 0)
+            column_limit = request.query_params.get("column_limit")
+            column_limit = max(int(column_limit), 0) if column_limit is not None else None
+        except ValueError:
+            raise ValidationError("column_offset and column_limit must be integers.")
+        gradebook = build_gradebook(course, request.user, column_offset, column_limit)
+        return Response(gradebook.as_dict())
+
+    @action(detail=True, methods=["get"], url_path="gradebook/export")
+    def export_gradebook(self, request, pk=None):
+        """Stream every submission and grade of the course as CSV (default) or `?output=jsonl`."""
+        course = self.get_object()
+        rows = iter_gradebook_rows(course, request.user)
+        columns = list(GRADEBOOK_EXPORT_FIELDS)
+
+        if request.query_params.get("output") == "jsonl":
+            response = StreamingHttpResponse(stream_jsonl(columns, rows), content_type="application/x-ndjson")
+            extension = "jsonl"
+        else:
+            response = StreamingHttpResponse(stream_csv(columns, rows), content_type="text/csv")
+            extension = "csv"
+        response["Content-Disposition"] = f'attachment; filename="gradebook-{course.id}.{extension}"'
+        return response
+
     @action(detail=True, methods=["get", "post"], url_path="lectures")
     def lectures(self, request, pk=None):
         course = self.get_object()
         if request.method == "GET":
-            lectures = course.lectures.select_related("course").prefetch_related(
-                "homeworks", "course__teachers", "course__students"
+            return self.list_response(
+                course.lectures.all(), LectureSerializer, cache=("course-lectures", course.pk, course.pk)
             )
-            serializer = LectureSerializer(lectures, many=True)
-            return Response(serializer.data)
 
         if request.method == "POST":
             lecture = create_lecture_for_course(course, request.data, request.user, LectureModel=Lecture)
@@ -87,21 +176,21 @@ class CourseViewSet(viewsets.ModelViewSet):
             return Response(serializer.data, status=201)
 
 
-class MyTeachingCoursesViewSet(viewsets.ViewSet):
+class MyTeachingCoursesViewSet(ActionListMixin, viewsets.GenericViewSet):
     """Retrieve all courses the authenticated teacher is teaching."""
 
+    serializer_class = CourseSerializer
     permission_classes = [IsAuthenticated]
 
     def list(self, request):
-        courses = get_teaching_courses(request.user)
-        serializer = CourseSerializer(courses, many=True)
-        return Response(serializer.data)
+        courses, serializer_class = course_representation(request, get_teaching_courses(request.user))
+        return self.list_response(courses, serializer_class)
 
 
-class MyEnrolledCoursesViewSet(viewsets.ViewSet):
+class MyEnrolledCoursesViewSet(ActionListMixin, viewsets.GenericViewSet):
+    serializer_class = CourseSerializer
     permission_classes = [IsAuthenticated]
 
     def list(self, request):
-        courses = get_enrolled_courses(request.user)
-        serializer = CourseSerializer(courses, many=True)
-        return Response(serializer.data)
+        courses, serializer_class = course_representation(request, get_enrolled_courses(request.user))
+        return self.list_response(courses, serializer_class)
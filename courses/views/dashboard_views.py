@@ -0,0 +1,24 @@
+from rest_framework import viewsets
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from courses.services.access import is_student
+from courses.services.dashboard_services import get_student_dashboard
+
+
+class MyDashboardViewSet(viewsets.GenericViewSet):
+    """
+    A student's home screen in one request: enrolled courses with their lectures,
+    homeworks, the student's submission status and current grades.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request):
+        if not is_student(request.user):
+            raise PermissionDenied("Only students have a dashboard.")
+        dashboard, hit = get_student_dashboard(request.user)
+        response = Response(dashboard)
+        response["X-Cache"] = "hit" if hit else "miss"
+        return response
@@ -1,22 +1,37 @@
+from django.db import transaction
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from courses.mixins import PostPutBlockedMixin
+from courses.mixins import (
+    PostPutBlockedMixin,
+    ActionListMixin,
+    ConditionalGetMixin,
+    ReadSerializerMixin,
+    DetailObjectMixin,
+)
 from courses.models import Grade, GradeComment
 from courses.permissions import IsGradeOwnerOrCourseTeacher, CanCommentOnGrade
-from courses.serializers import GradeSerializer, GradeCommentSerializer
+from courses.serializers import GradeSerializer, GradeReadSerializer, GradeCommentSerializer
 from courses.services.grade_services import (
     create_grade,
     update_grade,
     get_grade_comments,
-    add_grade_comment, get_visible_grade_comments, create_grade_comment,
+    add_grade_comment, get_visible_grade_comments, create_grade_comment, delete_grade,
 )
 
-class GradeViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
+class GradeViewSet(
+    ConditionalGetMixin,
+    ReadSerializerMixin,
+    DetailObjectMixin,
+    ActionListMixin,
+    viewsets.ModelViewSet,
+    PostPutBlockedMixin,
+):
     """Manage grades and their comments."""
 
     serializer_class = GradeSerializer
+    read_serializer_class = GradeReadSerializer
     permission_classes = [IsGradeOwnerOrCourseTeacher]
 
     def get_queryset(self):
@@ -27,10 +42,14 @@ class GradeViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
         """Save a new grade with the current user as teacher."""
         serializer.save(teacher=self.request.user)
 
+    @transaction.atomic
     def perform_update(self, serializer):
         """Update a grade while keeping the teacher fixed."""
         serializer.save(teacher=self.request.user)
 
+    def perform_destroy(self, instance):
+        delete_grade(instance)
+
     @action(
         detail=True,
         methods=["get", "post"],
@@ -39,17 +58,10 @@ class GradeViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
     )
     def comments(self, request, pk=None):
         """Retrieve or add comments on a grade."""
-        grade = (
-            self.get_queryset()
-            .select_related("submission__homework__lecture__course", "teacher")
-            .prefetch_related("comments__author")
-            .get(pk=pk)
-        )
+        grade = self.get_object()
 
         if request.method == "GET":
-            comments = grade.comments.all()
-            serializer = GradeCommentSerializer(comments, many=True)
-            return Response(serializer.data)
+            return self.list_response(get_grade_comments(grade), GradeCommentSerializer)
 
         if request.method == "POST":
             serializer = GradeCommentSerializer(data=request.data)
@@ -58,7 +70,7 @@ class GradeViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
             return Response(serializer.data, status=201)
 
 
-class GradeCommentViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
+class GradeCommentViewSet(ConditionalGetMixin, DetailObjectMixin, viewsets.ModelViewSet, PostPutBlockedMixin):
     """Manage grade comments."""
 
     http_method_names = ["get", "patch", "delete"]
@@ -3,10 +3,24 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from courses.mixins import PostPutBlockedMixin
-from courses.models import Homework
+from courses.mixins import (
+    PostPutBlockedMixin,
+    ActionListMixin,
+    ConditionalGetMixin,
+    ReadSerializerMixin,
+    DetailObjectMixin,
+    GradingQueueMixin,
+)
+from courses.models import Homework, HomeworkGradeStatistics
 from courses.permissions import IsCourseTeacherOrReadOnly, CanAccessSubmissions, IsStudentAndEnrolled, CanGradeCourse
-from courses.serializers import HomeworkSerializer, HomeworkSubmissionSerializer, GradeSerializer
+from courses.serializers import (
+    HomeworkSerializer,
+    HomeworkSubmissionSerializer,
+    HomeworkSubmissionReadSerializer,
+    GradeSerializer,
+    GradeReadSerializer,
+    BulkGradeSerializer,
+)
 
 from courses.services.homework_services import (
     get_homeworks_for_user,
@@ -14,15 +28,30 @@ from courses.services.homework_services import (
     submit_homework, add_grade_to_submission, get_submission_grades, get_submissions_for_user,
     filter_submissions_for_user,
 )
+from courses.services.grade_services import bulk_grade_submissions
+from courses.services.statistics_services import get_grade_statistics
+
 
+def graded_param(request):
+    """Parse `?graded=true|false` into True/False, or None when absent."""
+    return {"true": True, "false": False}.get(request.query_params.get("graded"))
 
-class HomeworkViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
+
+class HomeworkViewSet(
+    ConditionalGetMixin,
+    DetailObjectMixin,
+    GradingQueueMixin,
+    ActionListMixin,
+    viewsets.ModelViewSet,
+    PostPutBlockedMixin,
+):
     """Manage homeworks and their submissions."""
 
     http_method_names = ["get", "patch", "post", "delete"]
     queryset = Homework.objects.all()
     serializer_class = HomeworkSerializer
     permission_classes = [IsCourseTeacherOrReadOnly]
+    object_select_related = ("course",)
 
     def get_queryset(self):
         return get_homeworks_for_user(self.request.user)
@@ -37,20 +66,48 @@ class HomeworkViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
         homework = self.get_object()
 
         if request.method == "GET":
-            submissions = get_homework_submissions(homework)
-            serializer = HomeworkSubmissionSerializer(submissions, many=True)
-            return Response(serializer.data)
+            submissions = get_homework_submissions(homework, graded=graded_param(request))
+            return self.list_response(submissions, HomeworkSubmissionReadSerializer)
 
         if request.method == "POST":
             submission = submit_homework(homework, request.user, request.data, HomeworkSubmissionSerializer)
             serializer = HomeworkSubmissionSerializer(submission)
             return Response(serializer.data, status=201)
 
+    @action(detail=True, methods=["post"], url_path="grading-queue")
+    def grading_queue(self, request, pk=None):
+        """Lease the next ungraded submissions of this homework, oldest first."""
+        homework = self.get_object()
+        return self.grading_queue_response(request, homework.course, homework)
 
-class HomeworkSubmissionViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
+    @action(detail=True, methods=["get"], url_path="stats")
+    def stats(self, request, pk=None):
+        """Grade count, mean, spread, percentiles and histogram for the homework."""
+        homework = self.get_object()
+        return Response(get_grade_statistics(HomeworkGradeStatistics, homework.pk, homework.course, request.user))
+
+    @action(detail=True, methods=["post"], url_path="grades/bulk", serializer_class=BulkGradeSerializer)
+    def bulk_grades(self, request, pk=None):
+        """Grade many submissions from JSON rows or a CSV upload; bad rows are reported, not fatal."""
+        homework = self.get_object()
+        serializer = BulkGradeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = bulk_grade_submissions(homework, request.user, serializer.validated_data["rows"])
+        return Response(result)
+
+
+class HomeworkSubmissionViewSet(
+    ConditionalGetMixin,
+    ReadSerializerMixin,
+    DetailObjectMixin,
+    ActionListMixin,
+    viewsets.ModelViewSet,
+    PostPutBlockedMixin,
+):
     """Manage individual homework submissions and grades."""
 
     serializer_class = HomeworkSubmissionSerializer
+    read_serializer_class = HomeworkSubmissionReadSerializer
     permission_classes = [IsStudentAndEnrolled]
 
     def get_queryset(self):
@@ -67,8 +124,7 @@ class HomeworkSubmissionViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
 
         if request.method == "GET":
             grades = get_submission_grades(submission)
-            serializer = GradeSerializer(grades, many=True)
-            return Response(serializer.data)
+            return self.list_response(grades, GradeReadSerializer)
 
         if request.method == "POST":
             grade = add_grade_to_submission(submission, request.user, request.data, GradeSerializer)
@@ -76,7 +132,8 @@ class HomeworkSubmissionViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
             return Response(serializer.data, status=201)
 
 
-class MySubmissionsViewSet(viewsets.ViewSet):
+class MySubmissionsViewSet(ActionListMixin, viewsets.GenericViewSet):
+    serializer_class = HomeworkSubmissionSerializer
     permission_classes = [IsAuthenticated]
 
     def list(self, request):
@@ -86,6 +143,6 @@ class MySubmissionsViewSet(viewsets.ViewSet):
             homework_id=params.get("homework"),
             lecture_id=params.get("lecture"),
             course_id=params.get("course"),
+            graded=graded_param(request),
         )
-        serializer = HomeworkSubmissionSerializer(submissions, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        return self.list_response(submissions, HomeworkSubmissionReadSerializer)
\ No newline at end of file
@@ -3,19 +3,22 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 
-from courses.mixins import PostPutBlockedMixin
+from courses.mixins import PostPutBlockedMixin, ActionListMixin, ConditionalGetMixin, DetailObjectMixin
 from courses.models import Lecture
 from courses.permissions import IsCourseTeacherOrReadOnly
 from courses.serializers import LectureSerializer, HomeworkSerializer
 from courses.services.lecture_services import get_lecture_homeworks, create_homework_for_lecture
 
 
-class LectureViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
+class LectureViewSet(
+    ConditionalGetMixin, DetailObjectMixin, ActionListMixin, viewsets.ModelViewSet, PostPutBlockedMixin
+):
     """Manage lectures and associated homeworks."""
 
     queryset = Lecture.objects.all()
     serializer_class = LectureSerializer
     permission_classes = [IsCourseTeacherOrReadOnly]
+    object_select_related = ("course",)
     parser_classes = [parsers.JSONParser, parsers.MultiPartParser, parsers.FormParser]
 
     def get_queryset(self):
@@ -29,8 +32,9 @@ class LectureViewSet(viewsets.ModelViewSet, PostPutBlockedMixin):
 
         if request.method == "GET":
             homeworks = get_lecture_homeworks(lecture)
-            serializer = HomeworkSerializer(homeworks, many=True)
-            return Response(serializer.data)
+            return self.list_response(
+                homeworks, HomeworkSerializer, cache=("lecture-homeworks", lecture.course_id, lecture.pk)
+            )
 
         if request.method == "POST":
             serializer = HomeworkSerializer(data=request.data)
@@ -0,0 +1,40 @@
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+
+from courses.pagination import SearchPagination
+from courses.serializers import SearchResultSerializer
+from courses.services.search_services import SEARCHABLE, match_expression, search
+
+
+def kinds_param(request):
+    """Parse `?kind=lecture,homework` into a list of searchable kinds, or None for all."""
+    raw = request.query_params.get("kind")
+    if not raw:
+        return None
+    kinds = [kind.strip() for kind in raw.split(",") if kind.strip()]
+    unknown = sorted(set(kinds) - set(SEARCHABLE))
+    if unknown:
+        raise ValidationError({"kind": f"Unknown kind: {', '.join(unknown)}."})
+    return kinds
+
+
+class SearchViewSet(viewsets.GenericViewSet):
+    """
+    Full-text search over the lectures, homeworks and submissions visible to the user.
+
+    `?q=` is required; every word must match as a prefix. Results are ranked best
+    first and page-number paginated; `?kind=` narrows the object types.
+    """
+
+    serializer_class = SearchResultSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = SearchPagination
+
+    def list(self, request):
+        query = request.query_params.get("q", "")
+        if not match_expression(query):
+            raise ValidationError({"q": "Enter at least one word to search for."})
+        results = search(request.user, query, kinds_param(request))
+        page = self.paginate_queryset(results)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
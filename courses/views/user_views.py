@@ -3,10 +3,12 @@ from rest_framework import generics, viewsets, status, request
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
 from rest_framework import viewsets, mixins
 from courses.permissions import IsSelfOrAdmin
 from courses.serializers import UserSerializer
+from courses.services.user_services import blacklist_refresh_token
 
 User = get_user_model()
 
@@ -28,11 +30,9 @@ class LogoutViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
 
     def create(self, request, *args, **kwargs):
         try:
-            refresh_token = request.data["refresh"]
-            token = OutstandingToken.objects.get(token=refresh_token)
-            BlacklistedToken.objects.create(token=token)
+            blacklist_refresh_token(request.data["refresh"])
             return Response(status=status.HTTP_205_RESET_CONTENT)
-        except (KeyError, OutstandingToken.DoesNotExist):
+        except (KeyError, TokenError, OutstandingToken.DoesNotExist):
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
 
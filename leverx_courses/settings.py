@@ -47,11 +47,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'courses.middleware.QueryCountMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'courses.middleware.CourseMembershipMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -131,14 +133,31 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = "courses.User"
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Seconds a cached response lives per endpoint; see courses/cache.py.
+RESPONSE_CACHE_TTLS = {
+    "course-lectures": 300,
+    "lecture-homeworks": 300,
+    "my-dashboard": 300,
+}
+
+# How long a worker may trust a cached token version; bounds how long a revoked token
+# keeps working in processes other than the one that revoked it.
+TOKEN_VERSION_CACHE_TTL = 30
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "courses.authentication.ClaimsJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication", # This is for browsable API login
-        "rest_framework.authentication.BasicAuthentication",
+        "courses.authentication.CachedBasicAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "courses.pagination.KeysetPagination",
     "PAGE_SIZE": 10,
 }
 
@@ -146,6 +165,8 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_OBTAIN_SERIALIZER": "courses.serializers.CourseTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "courses.serializers.CourseTokenRefreshSerializer",
 }
 
 SPECTACULAR_SETTINGS = {